@@ -0,0 +1,243 @@
+"""
+Offline benchmarks for kaiascan-sdk-py.
+
+Runs `KaiascanSDK` against a local `ReplayServer` and reports, for each
+endpoint family and concurrency level, the request throughput, p50/p99
+latency, the share of requests that failed after retries and (with
+``--memory``) the peak Python heap allocated during the run. Throughput and
+latency count successful requests only. No API key or network access is
+needed.
+
+Responses are synthetic by default, shaped like the Kaiascan Open API. Pass
+``--recordings file.json`` to replay real captures instead; the file maps path
+regexes to response envelopes.
+
+Results can be saved with ``--json`` and compared against an earlier run with
+``--baseline``; the script exits non-zero if any family/concurrency pair lost
+more than ``--tolerance`` of its throughput.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --latency 0.05 --concurrency 1 8 64 --memory
+    python benchmarks/run.py --json before.json
+    python benchmarks/run.py --baseline before.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from kaiascan import KaiascanSDK, RetryPolicy
+from kaiascan.replay import ReplayServer
+
+ADDRESS = "0x" + "ab" * 20
+TX_HASH = "0x" + "cd" * 32
+
+
+def _envelope(data: Any) -> Dict[str, Any]:
+    return {"code": 0, "data": data, "msg": "success"}
+
+
+def _page(item: Callable[[int], Dict[str, Any]], size: int) -> Dict[str, Any]:
+    return _envelope(
+        {
+            "results": [item(index) for index in range(size)],
+            "paging": {
+                "total_count": size * 10,
+                "current_page": 1,
+                "last": False,
+                "total_page": 10,
+            },
+        }
+    )
+
+
+def _transfer(index: int) -> Dict[str, Any]:
+    return {
+        "transaction_hash": f"0x{index:064x}",
+        "block_id": 150_000_000 + index,
+        "datetime": "2024-11-25T10:00:00Z",
+        "contract_address": ADDRESS,
+        "from": ADDRESS,
+        "to": f"0x{index:040x}",
+        "amount": str(10**21 + index),
+    }
+
+
+def synthetic_recordings(page_size: int) -> Dict[str, Any]:
+    """Returns synthetic responses for every benchmarked endpoint family."""
+    return {
+        r"/api/v1/accounts/[^/]+/transactions": _page(_transfer, page_size),
+        r"/api/v1/tokens/[^/]+/transfers": _page(_transfer, page_size),
+        r"/api/v1/nfts/[^/]+/inventories": _page(
+            lambda index: {"token_id": str(index), "token_uri": f"ipfs://{index}"},
+            page_size,
+        ),
+        r"/api/v1/contracts/[^/]+/abi": _envelope(
+            {"abi": json.dumps([{"type": "function", "name": "f", "inputs": []}] * 50)}
+        ),
+        r"/api/v1/blocks\?blockNumber=": _envelope(
+            {"block_id": 150_000_000, "hash": TX_HASH, "total_transaction_count": 12}
+        ),
+        r"/api/v1/transactions/0x": _envelope(_transfer(0)),
+    }
+
+
+FAMILIES: Dict[str, Callable[[KaiascanSDK, int], Any]] = {
+    "accounts": lambda sdk, n: sdk.get_account_transactions(ADDRESS, size=2000),
+    "tokens": lambda sdk, n: sdk.get_token_transfers(ADDRESS, size=2000),
+    "nfts": lambda sdk, n: sdk.get_nft_inventories(ADDRESS, size=2000),
+    "contracts": lambda sdk, n: sdk.get_contract_abi(f"0x{n:040x}"),
+    "blocks": lambda sdk, n: sdk.get_block(n),
+    "transactions": lambda sdk, n: sdk.get_transaction(f"0x{n:064x}"),
+}
+
+
+def run_case(
+    base_url: str,
+    family: str,
+    concurrency: int,
+    requests: int,
+    memory: bool,
+) -> Dict[str, Any]:
+    """Runs one family at one concurrency level and returns its measurements."""
+    sdk = KaiascanSDK(is_testnet=True, retry=RetryPolicy(backoff_base=0.01))
+    sdk.base_url = base_url
+    call = FAMILIES[family]
+    latencies: List[float] = []
+    errors: List[Exception] = []
+
+    def timed(n: int) -> None:
+        started = time.perf_counter()
+        try:
+            call(sdk, n)
+        except Exception as error:
+            errors.append(error)
+        else:
+            latencies.append(time.perf_counter() - started)
+
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(requests)))
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] if memory else None
+    if memory:
+        tracemalloc.stop()
+
+    if len(latencies) >= 2:
+        quantiles = statistics.quantiles(latencies, n=100)
+        p50, p99 = quantiles[49], quantiles[98]
+    elif latencies:
+        p50 = p99 = latencies[0]
+    return {
+        "family": family,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": len(errors),
+        "error_rate": len(errors) / requests if requests else 0.0,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": p50 * 1000 if latencies else None,
+        "p99_ms": p99 * 1000 if latencies else None,
+        "peak_kib": None if peak is None else peak / 1024,
+    }
+
+
+def _cell(value: Optional[float], spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def _report(results: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'family':<14}{'conc':>6}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'errors':>8}{'peak KiB':>12}"
+    )
+    for result in results:
+        print(
+            f"{result['family']:<14}{result['concurrency']:>6}"
+            f"{result['throughput']:>10.1f}{_cell(result['p50_ms'], '.2f'):>10}"
+            f"{_cell(result['p99_ms'], '.2f'):>10}{result['errors']:>8}"
+            f"{_cell(result['peak_kib'], '.0f'):>12}"
+        )
+
+
+def _regressions(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[str]:
+    previous = {(r["family"], r["concurrency"]): r["throughput"] for r in baseline}
+    failures = []
+    for result in results:
+        before = previous.get((result["family"], result["concurrency"]))
+        if before and result["throughput"] < before * (1 - tolerance):
+            failures.append(
+                f"{result['family']} x{result['concurrency']}: "
+                f"{result['throughput']:.1f} req/s vs {before:.1f} req/s"
+            )
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--families", nargs="+", choices=sorted(FAMILIES), default=sorted(FAMILIES)
+    )
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--recordings", help="JSON file mapping path regexes to responses"
+    )
+    parser.add_argument("--memory", action="store_true", help="trace peak heap usage")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument(
+        "--baseline", help="compare throughput with an earlier --json file"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.recordings:
+        with open(args.recordings) as recordings_file:
+            recordings = json.load(recordings_file)
+    else:
+        recordings = synthetic_recordings(args.page_size)
+
+    results = []
+    with ReplayServer(
+        recordings,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=0,
+    ) as server:
+        for family in args.families:
+            for concurrency in args.concurrency:
+                results.append(
+                    run_case(
+                        server.base_url, family, concurrency, args.requests, args.memory
+                    )
+                )
+    _report(results)
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            failures = _regressions(results, json.load(baseline_file), args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,105 @@
-"""Top-level package for kaiascan-sdk-py."""
+"""Top-level package for kaiascan-sdk-py.
 
-from .kaiascan import KaiascanSDK
+Exports are loaded on first access (PEP 562), so importing a submodule such
+as `kaiascan.cli` does not pull in ``requests`` or the rest of the SDK.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .abi import AbiDecoder
+    from .async_kaiascan import AsyncKaiascanSDK
+    from .cache import ResponseCache
+    from .disk_cache import DiskCache
+    from .follower import ChainFollower, FollowedBlock
+    from .holders import HolderDiff, HolderSnapshot
+    from .instrumentation import PrometheusCollector, RequestMetrics
+    from .kaiascan import KaiascanSDK
+    from .log_store import EventLogStore
+    from .nft_crawler import CrawledNft, NftCrawler
+    from .portfolio import Portfolio, PortfolioAggregator, TokenMetadataCache
+    from .rate_limit import RateLimiter, RetryPolicy
+    from .scanner import BlockScanner, BlockWindow
+    from .sync import AccountActivity, AccountSync, CursorStore
+    from .transaction_details import TransactionAssembler, TransactionDetails
+    from .transport import HttpxTransport, RequestsTransport
 
 __author__ = """Mayowa Obisesan"""
 __email__ = "mayowaobi74@gmail.com"
 __version__ = "0.1.0"
-__all__ = ["KaiascanSDK"]
+
+_EXPORTS = {
+    "KaiascanSDK": ".kaiascan",
+    "AsyncKaiascanSDK": ".async_kaiascan",
+    "AbiDecoder": ".abi",
+    "ResponseCache": ".cache",
+    "DiskCache": ".disk_cache",
+    "EventLogStore": ".log_store",
+    "NftCrawler": ".nft_crawler",
+    "CrawledNft": ".nft_crawler",
+    "PortfolioAggregator": ".portfolio",
+    "Portfolio": ".portfolio",
+    "TokenMetadataCache": ".portfolio",
+    "PrometheusCollector": ".instrumentation",
+    "RequestMetrics": ".instrumentation",
+    "RateLimiter": ".rate_limit",
+    "RetryPolicy": ".rate_limit",
+    "BlockScanner": ".scanner",
+    "BlockWindow": ".scanner",
+    "ChainFollower": ".follower",
+    "FollowedBlock": ".follower",
+    "HolderSnapshot": ".holders",
+    "HolderDiff": ".holders",
+    "AccountSync": ".sync",
+    "AccountActivity": ".sync",
+    "CursorStore": ".sync",
+    "TransactionAssembler": ".transaction_details",
+    "TransactionDetails": ".transaction_details",
+    "RequestsTransport": ".transport",
+    "HttpxTransport": ".transport",
+}
+
+__all__ = [
+    "AbiDecoder",
+    "AccountActivity",
+    "AccountSync",
+    "AsyncKaiascanSDK",
+    "BlockScanner",
+    "BlockWindow",
+    "ChainFollower",
+    "CrawledNft",
+    "CursorStore",
+    "DiskCache",
+    "EventLogStore",
+    "FollowedBlock",
+    "HolderDiff",
+    "HolderSnapshot",
+    "HttpxTransport",
+    "KaiascanSDK",
+    "NftCrawler",
+    "Portfolio",
+    "PortfolioAggregator",
+    "PrometheusCollector",
+    "RateLimiter",
+    "RequestMetrics",
+    "RequestsTransport",
+    "ResponseCache",
+    "RetryPolicy",
+    "TokenMetadataCache",
+    "TransactionAssembler",
+    "TransactionDetails",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,436 @@
+"""
+This module decodes transaction input data and event logs using contract ABIs.
+
+An `AbiDecoder` compiles one or more ABIs, such as the output of
+`get_contract_abi`, once. Each function becomes a decoder keyed by its
+four-byte selector, and each event becomes one keyed by its first topic and
+topic count. Decoding a call or a log is then a dictionary lookup plus a walk
+over precompiled type decoders; no ABI is parsed and no signature is hashed
+per item.
+
+Large batches of logs can be decoded on a process pool with `decode_logs`.
+The pool is started on first use and kept for later batches until `close` is
+called; each worker process compiles the ABIs once when it starts.
+
+Values are returned as plain Python types: integers for ``uint``/``int``,
+checksum-free lowercase hex strings for ``address`` and ``bytes``, `str` for
+``string``, lists for arrays and dicts for named tuples.
+
+Usage:
+    decoder = AbiDecoder(sdk.get_contract_abi(token).data)
+    events = decoder.decode_logs(sdk.iter_account_event_logs(wallet))
+"""
+
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .concurrency import chunked
+from .interfaces.models import EventLog
+from .keccak import signature_hash
+
+# Decodes the value at a position of the data; dynamic values receive the
+# position their offset points to.
+Reader = Callable[[bytes, int], Any]
+
+# Batches smaller than this are decoded in the calling process.
+PROCESS_POOL_THRESHOLD = 10_000
+DEFAULT_CHUNK_SIZE = 2_000
+
+
+@dataclass
+class DecodedCall:
+    """
+    A data class holding a decoded function call.
+
+    Attributes:
+        name (str): The function name.
+        signature (str): The canonical signature, e.g. ``transfer(address,uint256)``.
+        args (Dict[str, Any]): The arguments, keyed by parameter name.
+    """
+
+    name: str
+    signature: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class DecodedEvent:
+    """
+    A data class holding a decoded event log.
+
+    Indexed parameters of dynamic types (strings, bytes, arrays and tuples)
+    are stored in topics as a hash and are returned as that hex hash.
+
+    Attributes:
+        name (str): The event name.
+        signature (str): The canonical signature.
+        args (Dict[str, Any]): The parameters, keyed by name.
+    """
+
+    name: str
+    signature: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class _Type:
+    """A compiled ABI type: its canonical name, head size and reader."""
+
+    __slots__ = ("dynamic", "name", "read", "size")
+
+    def __init__(self, name: str, dynamic: bool, size: int, read: Reader):
+        self.name = name
+        self.dynamic = dynamic
+        self.size = size
+        self.read = read
+
+
+def _word(data: bytes, position: int) -> int:
+    if position + 32 > len(data):
+        raise ValueError("Data is too short for its ABI")
+    return int.from_bytes(data[position : position + 32], "big")
+
+
+def _signed_word(data: bytes, position: int) -> int:
+    value = _word(data, position)
+    return value - (1 << 256) if value >> 255 else value
+
+
+def _read_tuple(
+    types: Sequence[_Type], names: Optional[Sequence[str]]
+) -> Callable[[bytes, int], Any]:
+    def read(data: bytes, base: int) -> Any:
+        values = []
+        position = base
+        for item in types:
+            if item.dynamic:
+                values.append(item.read(data, base + _word(data, position)))
+            else:
+                values.append(item.read(data, position))
+            position += item.size
+        return dict(zip(names, values)) if names else values
+
+    return read
+
+
+def _compile_elementary(name: str) -> _Type:
+    if name.startswith("uint"):
+        return _Type(name, False, 32, _word)
+    if name.startswith("int"):
+        return _Type(name, False, 32, _signed_word)
+    if name == "address":
+        return _Type(
+            name,
+            False,
+            32,
+            lambda data, position: "0x" + data[position + 12 : position + 32].hex(),
+        )
+    if name == "bool":
+        return _Type(name, False, 32, lambda data, position: _word(data, position) != 0)
+    if name == "bytes" or name == "string":
+        text = name == "string"
+
+        def read_bytes(data: bytes, position: int) -> Any:
+            length = _word(data, position)
+            if length > len(data) - position - 32:
+                raise ValueError("Byte string length exceeds the data")
+            value = data[position + 32 : position + 32 + length]
+            return value.decode("utf-8", "replace") if text else "0x" + value.hex()
+
+        return _Type(name, True, 32, read_bytes)
+    if name.startswith("bytes"):
+        width = int(name[5:])
+        return _Type(
+            name,
+            False,
+            32,
+            lambda data, position: "0x" + data[position : position + width].hex(),
+        )
+    if name == "function":
+        return _Type(
+            name,
+            False,
+            32,
+            lambda data, position: "0x" + data[position : position + 24].hex(),
+        )
+    raise ValueError(f"Unsupported ABI type: {name}")
+
+
+def _compile(param: Dict[str, Any]) -> _Type:
+    """Compiles one ABI parameter (``type`` plus optional ``components``)."""
+    kind: str = param["type"]
+    base, _, suffix = kind.partition("[")
+    if base == "tuple":
+        components = [_compile(component) for component in param["components"]]
+        names = [component.get("name") or "" for component in param["components"]]
+        element = _tuple_type(components, names if all(names) else None)
+    else:
+        element = _compile_elementary_cached(base)
+    if not suffix:
+        return element
+
+    # Array dimensions apply innermost first: uint256[2][] is a list of pairs.
+    for dimension in ("[" + suffix).split("]")[:-1]:
+        element = _array_type(element, dimension[1:])
+    return element
+
+
+@lru_cache(maxsize=None)
+def _compile_elementary_cached(name: str) -> _Type:
+    return _compile_elementary(name)
+
+
+def _tuple_type(components: List[_Type], names: Optional[List[str]]) -> _Type:
+    dynamic = any(component.dynamic for component in components)
+    canonical = "(" + ",".join(component.name for component in components) + ")"
+    size = 32 if dynamic else sum(component.size for component in components)
+    return _Type(canonical, dynamic, size, _read_tuple(components, names))
+
+
+def _array_type(element: _Type, length: str) -> _Type:
+    name = f"{element.name}[{length}]"
+    if not length:
+
+        def read_list(data: bytes, position: int) -> Any:
+            count = _word(data, position)
+            if count * element.size > len(data) - position:
+                raise ValueError("Array length exceeds the data")
+            return _read_tuple([element] * count, None)(data, position + 32)
+
+        return _Type(name, True, 32, read_list)
+
+    read = _read_tuple([element] * int(length), None)
+    if element.dynamic:
+        return _Type(name, True, 32, read)
+    return _Type(name, False, element.size * int(length), read)
+
+
+def _is_hashed(item: _Type) -> bool:
+    return item.dynamic or item.name.startswith("(") or item.name.endswith("]")
+
+
+def _signature(entry: Dict[str, Any], types: Sequence[_Type]) -> str:
+    return f"{entry['name']}({','.join(item.name for item in types)})"
+
+
+def _names(params: Sequence[Dict[str, Any]]) -> List[str]:
+    return [param.get("name") or f"arg{index}" for index, param in enumerate(params)]
+
+
+class _Function:
+    __slots__ = ("name", "names", "read", "signature")
+
+    def __init__(self, entry: Dict[str, Any]):
+        inputs = entry.get("inputs", [])
+        types = [_compile(param) for param in inputs]
+        self.name: str = entry["name"]
+        self.signature = _signature(entry, types)
+        self.names = _names(inputs)
+        self.read = _read_tuple(types, None)
+
+    def decode(self, data: bytes) -> DecodedCall:
+        return DecodedCall(
+            self.name, self.signature, dict(zip(self.names, self.read(data, 0)))
+        )
+
+
+class _Event:
+    __slots__ = ("indexed", "name", "names", "read", "signature", "topic_count")
+
+    def __init__(self, entry: Dict[str, Any]):
+        inputs = entry.get("inputs", [])
+        types = [_compile(param) for param in inputs]
+        self.name: str = entry["name"]
+        self.signature = _signature(entry, types)
+        self.names = _names(inputs)
+        # Indexed strings, bytes, arrays and tuples are stored as their hash.
+        self.indexed = [
+            (index, types[index], _is_hashed(types[index]))
+            for index, param in enumerate(inputs)
+            if param.get("indexed")
+        ]
+        self.read = _read_tuple(
+            [item for param, item in zip(inputs, types) if not param.get("indexed")],
+            None,
+        )
+        self.topic_count = len(self.indexed) + 1
+
+    def decode(self, topics: Sequence[str], data: bytes) -> DecodedEvent:
+        values: List[Any] = [None] * len(self.names)
+        for (index, item, hashed), topic in zip(self.indexed, topics[1:]):
+            raw = _hex_bytes(topic)
+            values[index] = "0x" + raw.hex() if hashed else item.read(raw, 0)
+        unindexed = iter(self.read(data, 0))
+        indexed = {index for index, _, _ in self.indexed}
+        for index in range(len(values)):
+            if index not in indexed:
+                values[index] = next(unindexed)
+        return DecodedEvent(self.name, self.signature, dict(zip(self.names, values)))
+
+
+def _hex_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+
+
+def _parse_abi(abi: Any) -> List[Dict[str, Any]]:
+    if isinstance(abi, dict):
+        abi = abi.get("abi", abi.get("result"))
+    if isinstance(abi, str):
+        abi = json.loads(abi)
+    if not isinstance(abi, list):
+        raise ValueError("ABI must be a list of entries or a JSON string of one")
+    return abi
+
+
+class AbiDecoder:
+    """
+    Decodes calls and logs against a set of compiled ABIs.
+
+    Args:
+        *abis (Any): ABIs as lists of entries, JSON strings, or the ``data``
+            of `get_contract_abi`. More can be added later with `add`.
+    """
+
+    def __init__(self, *abis: Any):
+        self.functions: Dict[str, _Function] = {}
+        self.events: Dict[Tuple[str, int], _Event] = {}
+        self._abis: List[List[Dict[str, Any]]] = []
+        # The worker pool of `decode_logs`, and the (processes, ABI count) it
+        # was started with; a change to either starts a new pool.
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_key: Optional[Tuple[Optional[int], int]] = None
+        self._pool_lock = threading.Lock()
+        for abi in abis:
+            self.add(abi)
+
+    def add(self, abi: Any) -> None:
+        """Compiles the functions and events of another ABI."""
+        entries = _parse_abi(abi)
+        self._abis.append(entries)
+        for entry in entries:
+            kind = entry.get("type", "function")
+            if kind == "function":
+                function = _Function(entry)
+                self.functions[signature_hash(function.signature)[:10]] = function
+            elif kind == "event" and not entry.get("anonymous"):
+                event = _Event(entry)
+                topic = signature_hash(event.signature)
+                self.events[(topic, event.topic_count)] = event
+
+    def decode_input(self, input_data: Any) -> Optional[DecodedCall]:
+        """
+        Decodes the input data of a transaction.
+
+        Args:
+            input_data (Any): The ``0x``-prefixed call data, or the ``data`` of
+                `get_transaction_input_data` (its ``input`` or
+                ``original_value`` field is used).
+
+        Returns:
+            Optional[DecodedCall]: The call, or `None` if the data is not valid
+            hex, its selector is not in any compiled ABI or it does not match.
+        """
+        if isinstance(input_data, dict):
+            input_data = input_data.get("input", input_data.get("original_value"))
+        if not input_data:
+            return None
+        try:
+            raw = _hex_bytes(input_data)
+            function = self.functions.get("0x" + raw[:4].hex())
+            if function is None:
+                return None
+            return function.decode(raw[4:])
+        except ValueError:
+            return None
+
+    def decode_log(self, log: Any) -> Optional[DecodedEvent]:
+        """
+        Decodes one event log.
+
+        Args:
+            log (Any): A log dict with ``topics`` and ``data`` keys, or an
+                `EventLog` model.
+
+        Returns:
+            Optional[DecodedEvent]: The event, or `None` if its topic is not
+            in any compiled ABI or the log does not match it.
+        """
+        if isinstance(log, EventLog):
+            topics, data = log.topics, log.data
+        else:
+            topics, data = log.get("topics"), log.get("data")
+        if not topics:
+            return None
+        event = self.events.get((topics[0].lower(), len(topics)))
+        if event is None:
+            return None
+        try:
+            return event.decode(topics, _hex_bytes(data or "0x"))
+        except ValueError:
+            return None
+
+    def decode_logs(
+        self,
+        logs: Iterable[Any],
+        processes: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[Optional[DecodedEvent]]:
+        """
+        Decodes many logs, on a process pool for large batches.
+
+        Args:
+            logs (Iterable[Any]): Log dicts or `EventLog` models.
+            processes (Optional[int]): Worker processes; defaults to the CPU
+                count. With ``1``, or fewer than `PROCESS_POOL_THRESHOLD`
+                logs, everything is decoded in the calling process.
+            chunk_size (int): Logs sent to a worker at a time.
+
+        Returns:
+            List[Optional[DecodedEvent]]: One result per log, in input order.
+        """
+        logs = list(logs)
+        if processes == 1 or len(logs) < PROCESS_POOL_THRESHOLD:
+            return [self.decode_log(log) for log in logs]
+
+        results: List[Optional[DecodedEvent]] = []
+        executor = self._executor(processes)
+        for chunk in executor.map(_decode_chunk, chunked(logs, chunk_size)):
+            results.extend(chunk)
+        return results
+
+    def _executor(self, processes: Optional[int]) -> ProcessPoolExecutor:
+        key = (processes, len(self._abis))
+        with self._pool_lock:
+            if self._pool is None or self._pool_key != key:
+                if self._pool is not None:
+                    self._pool.shutdown()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=processes,
+                    initializer=_start_worker,
+                    initargs=(list(self._abis),),
+                )
+                self._pool_key = key
+            return self._pool
+
+    def close(self) -> None:
+        """Shuts down the worker processes started by `decode_logs`."""
+        with self._pool_lock:
+            pool, self._pool, self._pool_key = self._pool, None, None
+        if pool is not None:
+            pool.shutdown()
+
+
+_worker: Optional[AbiDecoder] = None
+
+
+def _start_worker(abis: List[List[Dict[str, Any]]]) -> None:
+    global _worker
+    _worker = AbiDecoder(*abis)
+
+
+def _decode_chunk(logs: Sequence[Any]) -> List[Optional[DecodedEvent]]:
+    assert _worker is not None
+    return [_worker.decode_log(log) for log in logs]
@@ -0,0 +1,804 @@
+"""
+This module provides an asyncio front-end for the Kaiascan API.
+
+`AsyncKaiascanSDK` exposes every endpoint of `KaiascanSDK` as a coroutine with
+the same signature. It wraps a synchronous client and runs each request on a
+bounded worker pool that shares a single pooled HTTP connection set, so the
+network round-trip never blocks the event loop. The pool size caps how many
+requests are in flight at once, so hundreds of lookups can be awaited
+concurrently from one event loop without opening an unbounded number of
+sockets.
+
+Usage:
+    async with AsyncKaiascanSDK(is_testnet=True, max_concurrency=64) as sdk:
+        blocks = await asyncio.gather(*(sdk.get_block(n) for n in range(100)))
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .concurrency import chunked
+from .interfaces.api_response import ApiResponse
+from .interfaces.token_info import TokenInfo
+from .kaiascan import KaiascanSDK, contracts_by_address
+from .pagination import MAX_PAGE_SIZE, is_last_page, page_results, total_pages
+from .transport import RequestsTransport
+from .types.address import Address, normalize_addresses
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+class AsyncKaiascanSDK:
+    """
+    Asynchronous Kaiascan client.
+
+    Every public method of `KaiascanSDK` is available with the same signature
+    as a coroutine returning the same `ApiResponse`. Each call runs the
+    synchronous method on the worker pool, so invalid arguments raise
+    `ValueError` when the coroutine is awaited, before any request is sent.
+    The ``iter_*`` methods return async iterators, to be consumed with
+    ``async for``, and the ``*_bulk`` methods are coroutines returning dicts.
+
+    Args:
+        is_testnet (bool): Use the Kairos testnet instead of mainnet.
+        max_concurrency (int): Maximum number of requests in flight at once.
+            This is also the size of the shared connection pool, unless a
+            ``transport`` is passed in the options.
+        **options: Further keyword arguments accepted by `KaiascanSDK`.
+
+    Attributes:
+        client (KaiascanSDK): The synchronous client that performs the
+            requests. Its cache, hooks and transport apply to every call.
+    """
+
+    def __init__(self, is_testnet: bool, max_concurrency: int = 32, **options: Any):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        if options.get("transport") is None:
+            options["transport"] = RequestsTransport(pool_size=max_concurrency)
+        self.client = KaiascanSDK(is_testnet, **options)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="kaiascan"
+        )
+
+    async def _call(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(method, *args, **kwargs)
+        )
+
+    async def _iter_pages(
+        self,
+        fetch: Callable[..., Awaitable[ApiResponse[Any]]],
+        *args: Any,
+        size: int,
+        max_workers: int = 1,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        def submit(page: int) -> "asyncio.Future[ApiResponse[Any]]":
+            return asyncio.ensure_future(fetch(*args, page=page, size=size, **kwargs))
+
+        pending: Deque[Tuple[int, "asyncio.Future[ApiResponse[Any]]"]] = deque(
+            [(1, submit(1))]
+        )
+        next_page = 2
+        pages: Optional[int] = None
+        try:
+            while pending:
+                page, future = pending.popleft()
+                data = (await future).data
+                if page == 1 and max_workers > 1:
+                    pages = total_pages(data, size)
+                last = is_last_page(data, page, size)
+                if not last:
+                    limit = page + 1 if pages is None else pages
+                    while len(pending) < max_workers and next_page <= limit:
+                        pending.append((next_page, submit(next_page)))
+                        next_page += 1
+                for item in page_results(data):
+                    yield item
+                if last:
+                    break
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    async def _bulk(
+        self,
+        fetch: Callable[[K], Awaitable[ApiResponse[Any]]],
+        keys: Iterable[K],
+        max_workers: int,
+    ) -> Dict[K, Any]:
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            raise ValueError("At least one key is required")
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def one(key: K) -> Any:
+            async with semaphore:
+                return (await fetch(key)).data
+
+        return dict(zip(unique, await asyncio.gather(*map(one, unique))))
+
+    async def _contracts_chunk(self, chunk: Tuple[Address, ...]) -> ApiResponse[Any]:
+        contract_addresses: List[str] = list(chunk)
+        return await self.get_contracts_info(contract_addresses)
+
+    async def aclose(self) -> None:
+        """Wait for in-flight requests to finish and release the connection pool."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown, True)
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncKaiascanSDK":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def get_account_key_histories(
+        self, account_address: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_key_histories, account_address, page=page, size=size
+        )
+
+    def iter_account_key_histories(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_key_histories, account_address, size=size, **filters
+        )
+
+    async def get_account_info(self, account_address: str) -> ApiResponse[Any]:
+        return await self._call(self.client.get_account_info, account_address)
+
+    async def get_account_token_transfers(
+        self,
+        account_address: str,
+        page: int = 1,
+        size: int = 20,
+        contract_address: Optional[str] = None,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_token_transfers,
+            account_address,
+            page=page,
+            size=size,
+            contract_address=contract_address,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+        )
+
+    def iter_account_token_transfers(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_token_transfers, account_address, size=size, **filters
+        )
+
+    async def get_account_event_logs(
+        self,
+        account_address: str,
+        page: int = 1,
+        size: int = 20,
+        signature: Optional[str] = None,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_event_logs,
+            account_address,
+            page=page,
+            size=size,
+            signature=signature,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+        )
+
+    def iter_account_event_logs(
+        self,
+        account_address: str,
+        size: int = MAX_PAGE_SIZE,
+        max_workers: int = 1,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_event_logs,
+            account_address,
+            size=size,
+            max_workers=max_workers,
+            **filters,
+        )
+
+    async def get_account_kip17_nft_balances(
+        self, account_address: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_kip17_nft_balances,
+            account_address,
+            page=page,
+            size=size,
+        )
+
+    def iter_account_kip17_nft_balances(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_kip17_nft_balances, account_address, size=size, **filters
+        )
+
+    async def get_account_kip37_nft_balances(
+        self, account_address: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_kip37_nft_balances,
+            account_address,
+            page=page,
+            size=size,
+        )
+
+    def iter_account_kip37_nft_balances(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_kip37_nft_balances, account_address, size=size, **filters
+        )
+
+    async def get_account_nft_transfers(
+        self,
+        account_address: str,
+        page: int = 1,
+        size: int = 20,
+        contract_address: Optional[str] = None,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_nft_transfers,
+            account_address,
+            page=page,
+            size=size,
+            contract_address=contract_address,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+        )
+
+    def iter_account_nft_transfers(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_nft_transfers, account_address, size=size, **filters
+        )
+
+    async def get_account_token_balances(
+        self, account_address: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_token_balances,
+            account_address,
+            page=page,
+            size=size,
+        )
+
+    def iter_account_token_balances(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_token_balances, account_address, size=size, **filters
+        )
+
+    async def get_account_token_details(
+        self, account_address: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_token_details, account_address, page=page, size=size
+        )
+
+    def iter_account_token_details(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_token_details, account_address, size=size, **filters
+        )
+
+    async def get_account_transactions(
+        self,
+        account_address: str,
+        page: int = 1,
+        size: int = 20,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+        transaction_type: Optional[str] = None,
+        directions: Optional[List[str]] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_account_transactions,
+            account_address,
+            page=page,
+            size=size,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+            transaction_type=transaction_type,
+            directions=directions,
+        )
+
+    def iter_account_transactions(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_account_transactions, account_address, size=size, **filters
+        )
+
+    async def get_fee_paid_transactions(
+        self,
+        account_address: str,
+        page: int = 1,
+        size: int = 20,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+        transaction_type: Optional[str] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_fee_paid_transactions,
+            account_address,
+            page=page,
+            size=size,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+            transaction_type=transaction_type,
+        )
+
+    def iter_fee_paid_transactions(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_fee_paid_transactions, account_address, size=size, **filters
+        )
+
+    async def get_kaia_info(self) -> ApiResponse[Any]:
+        return await self._call(self.client.get_kaia_info)
+
+    async def get_fungible_token(
+        self, token_address: Address
+    ) -> ApiResponse[TokenInfo]:
+        return await self._call(self.client.get_fungible_token, token_address)
+
+    async def get_fungible_tokens_bulk(
+        self, token_addresses: Iterable[str], max_workers: int = 8
+    ) -> Dict[Address, Any]:
+        return await self._bulk(
+            self.get_fungible_token, normalize_addresses(token_addresses), max_workers
+        )
+
+    async def get_token_holders(
+        self,
+        token_address: str,
+        page: int = 1,
+        size: int = 20,
+        holder_address: Optional[str] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_token_holders,
+            token_address,
+            page=page,
+            size=size,
+            holder_address=holder_address,
+        )
+
+    def iter_token_holders(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_token_holders, token_address, size=size, **filters
+        )
+
+    async def get_token_burns(
+        self,
+        token_address: str,
+        page: int = 1,
+        size: int = 20,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_token_burns,
+            token_address,
+            page=page,
+            size=size,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+        )
+
+    def iter_token_burns(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_token_burns, token_address, size=size, **filters
+        )
+
+    async def get_token_transfers(
+        self,
+        token_address: str,
+        page: int = 1,
+        size: int = 20,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_token_transfers,
+            token_address,
+            page=page,
+            size=size,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+        )
+
+    def iter_token_transfers(
+        self,
+        token_address: str,
+        size: int = MAX_PAGE_SIZE,
+        max_workers: int = 1,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_token_transfers,
+            token_address,
+            size=size,
+            max_workers=max_workers,
+            **filters,
+        )
+
+    async def get_nft_item(
+        self, nft_address: Address, token_id: str
+    ) -> ApiResponse[Any]:
+        return await self._call(self.client.get_nft_item, nft_address, token_id)
+
+    async def get_nft(self, token_address: str) -> ApiResponse[Any]:
+        return await self._call(self.client.get_nft, token_address)
+
+    async def get_nft_transfers(
+        self,
+        token_address: str,
+        page: int = 1,
+        size: int = 20,
+        token_id: Optional[str] = None,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_nft_transfers,
+            token_address,
+            page=page,
+            size=size,
+            token_id=token_id,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+        )
+
+    def iter_nft_transfers(
+        self,
+        token_address: str,
+        size: int = MAX_PAGE_SIZE,
+        max_workers: int = 1,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_nft_transfers,
+            token_address,
+            size=size,
+            max_workers=max_workers,
+            **filters,
+        )
+
+    async def get_nft_holders(
+        self,
+        token_address: str,
+        page: int = 1,
+        size: int = 20,
+        token_id: Optional[str] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_nft_holders,
+            token_address,
+            page=page,
+            size=size,
+            token_id=token_id,
+        )
+
+    def iter_nft_holders(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_nft_holders, token_address, size=size, **filters
+        )
+
+    async def get_nft_inventories(
+        self,
+        token_address: str,
+        page: int = 1,
+        size: int = 20,
+        keyword: Optional[str] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_nft_inventories,
+            token_address,
+            page=page,
+            size=size,
+            keyword=keyword,
+        )
+
+    def iter_nft_inventories(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_nft_inventories, token_address, size=size, **filters
+        )
+
+    async def get_contract_creation_code(
+        self, contract_address: Address
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_contract_creation_code, contract_address
+        )
+
+    async def get_contract_source_code(
+        self, contract_address: Address
+    ) -> ApiResponse[Any]:
+        return await self._call(self.client.get_contract_source_code, contract_address)
+
+    async def get_contract_info(self, contract_address: str) -> ApiResponse[Any]:
+        return await self._call(self.client.get_contract_info, contract_address)
+
+    async def get_contracts_info(
+        self, contract_addresses: List[str]
+    ) -> ApiResponse[Any]:
+        return await self._call(self.client.get_contracts_info, contract_addresses)
+
+    async def get_contracts_info_bulk(
+        self,
+        contract_addresses: Iterable[str],
+        chunk_size: int = 50,
+        max_workers: int = 8,
+    ) -> Dict[Address, Any]:
+        addresses = list(dict.fromkeys(normalize_addresses(contract_addresses)))
+        if not addresses:
+            raise ValueError("Contract address list is required")
+
+        chunks = await self._bulk(
+            self._contracts_chunk, chunked(addresses, chunk_size), max_workers
+        )
+        return contracts_by_address(addresses, chunks.values())
+
+    async def get_contract_abi(self, contract_address: str) -> ApiResponse[Any]:
+        return await self._call(self.client.get_contract_abi, contract_address)
+
+    async def get_latest_block(self) -> ApiResponse[Any]:
+        return await self._call(self.client.get_latest_block)
+
+    async def get_latest_block_burns(
+        self, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_latest_block_burns, page=page, size=size
+        )
+
+    def iter_latest_block_burns(
+        self, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(self.get_latest_block_burns, size=size, **filters)
+
+    async def get_latest_block_rewards(self, block_number: int) -> ApiResponse[Any]:
+        return await self._call(self.client.get_latest_block_rewards, block_number)
+
+    async def get_block(self, block_number: int) -> ApiResponse[Any]:
+        return await self._call(self.client.get_block, block_number)
+
+    async def get_blocks_bulk(
+        self, block_numbers: Iterable[int], max_workers: int = 8
+    ) -> Dict[int, Any]:
+        return await self._bulk(self.get_block, block_numbers, max_workers)
+
+    async def get_blocks(
+        self,
+        block_number: int,
+        block_number_start: Optional[int] = None,
+        block_number_end: Optional[int] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_blocks,
+            block_number,
+            block_number_start=block_number_start,
+            block_number_end=block_number_end,
+            page=page,
+            size=size,
+        )
+
+    def iter_blocks(
+        self, block_number: int, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(self.get_blocks, block_number, size=size, **filters)
+
+    async def get_transactions_of_block(
+        self,
+        block_number: int,
+        transaction_type: Optional[str] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transactions_of_block,
+            block_number,
+            transaction_type=transaction_type,
+            page=page,
+            size=size,
+        )
+
+    def iter_transactions_of_block(
+        self, block_number: int, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_transactions_of_block, block_number, size=size, **filters
+        )
+
+    async def get_block_burns(self, block_number: int) -> ApiResponse[Any]:
+        return await self._call(self.client.get_block_burns, block_number)
+
+    async def get_block_rewards(self, block_number: int) -> ApiResponse[Any]:
+        return await self._call(self.client.get_block_rewards, block_number)
+
+    async def get_internal_transactions_of_block(
+        self, block_number: int, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_internal_transactions_of_block,
+            block_number,
+            page=page,
+            size=size,
+        )
+
+    def iter_internal_transactions_of_block(
+        self, block_number: int, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_internal_transactions_of_block, block_number, size=size, **filters
+        )
+
+    async def get_blocks_by_timestamp(self, timestamp: int) -> ApiResponse[Any]:
+        return await self._call(self.client.get_blocks_by_timestamp, timestamp)
+
+    async def get_transaction(self, transaction_hash: str) -> ApiResponse[Any]:
+        return await self._call(self.client.get_transaction, transaction_hash)
+
+    async def get_transactions_bulk(
+        self, transaction_hashes: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Any]:
+        return await self._bulk(self.get_transaction, transaction_hashes, max_workers)
+
+    async def get_transaction_receipt_status(
+        self, transaction_hash: str
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transaction_receipt_status, transaction_hash
+        )
+
+    async def get_transaction_status(self, transaction_hash: str) -> ApiResponse[Any]:
+        return await self._call(self.client.get_transaction_status, transaction_hash)
+
+    async def get_transaction_input_data(
+        self, transaction_hash: str
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transaction_input_data, transaction_hash
+        )
+
+    async def get_transaction_event_logs(
+        self,
+        transaction_hash: str,
+        page: int = 1,
+        size: int = 20,
+        signature: Optional[str] = None,
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transaction_event_logs,
+            transaction_hash,
+            page=page,
+            size=size,
+            signature=signature,
+        )
+
+    def iter_transaction_event_logs(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_event_logs, transaction_hash, size=size, **filters
+        )
+
+    async def get_transaction_internal_transactions(
+        self, transaction_hash: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transaction_internal_transactions,
+            transaction_hash,
+            page=page,
+            size=size,
+        )
+
+    def iter_transaction_internal_transactions(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_internal_transactions,
+            transaction_hash,
+            size=size,
+            **filters,
+        )
+
+    async def get_transaction_token_transfers(
+        self, transaction_hash: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transaction_token_transfers,
+            transaction_hash,
+            page=page,
+            size=size,
+        )
+
+    def iter_transaction_token_transfers(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_token_transfers, transaction_hash, size=size, **filters
+        )
+
+    async def get_transaction_nft_transfers(
+        self, transaction_hash: str, page: int = 1, size: int = 20
+    ) -> ApiResponse[Any]:
+        return await self._call(
+            self.client.get_transaction_nft_transfers,
+            transaction_hash,
+            page=page,
+            size=size,
+        )
+
+    def iter_transaction_nft_transfers(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_nft_transfers, transaction_hash, size=size, **filters
+        )
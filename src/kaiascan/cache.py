@@ -0,0 +1,158 @@
+"""
+This module provides an in-memory response cache that understands chain finality.
+
+Kaia blocks are final as soon as they are produced, so anything addressed by a
+block number or transaction hash never changes once the API has returned it,
+and neither does deployed contract code. Those responses can be kept until the
+cache needs the room. An empty answer on such a path (for example a block
+past the chain head) is only kept briefly, since the data may still appear.
+Views of the chain head change every block and are only kept for a short time,
+and everything else is not cached at all.
+
+The `DEFAULT_CACHE_POLICY` list maps endpoint paths to time-to-live values and
+can be replaced or extended per cache instance.
+
+Usage:
+    sdk = KaiascanSDK(is_testnet=False, cache=ResponseCache(max_entries=50_000))
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Pattern, Tuple
+
+from .pagination import page_results
+
+# Time-to-live for responses that never change once returned.
+IMMUTABLE = float("inf")
+
+# Time-to-live for empty responses on immutable paths, e.g. a future block.
+EMPTY_RESPONSE_TTL = 1.0
+
+# Ordered (pattern, ttl) rules matched against the request path and query,
+# relative to the network base URL. The first match wins.
+DEFAULT_CACHE_POLICY: List[Tuple[Pattern[str], float]] = [
+    (re.compile(r"^api/v1/blocks/latest(/|\?|$)"), 1.0),
+    (re.compile(r"^api/v1/kaia$"), 10.0),
+    (re.compile(r"^api/v1/blocks\?blockNumber=\d+$"), IMMUTABLE),
+    (re.compile(r"^api/v1/blocks/\d+/(rewards|burns)$"), IMMUTABLE),
+    (re.compile(r"^api/v1/transactions/0x[0-9a-fA-F]+(/input-data)?$"), IMMUTABLE),
+    (re.compile(r"^api/v1/contracts/0x[0-9a-fA-F]+/abi$"), IMMUTABLE),
+    (re.compile(r"^api/v1/contracts/(source|creation)-code\?"), IMMUTABLE),
+]
+
+
+def policy_ttl(policy: List[Tuple[Pattern[str], float]], path: str) -> Optional[float]:
+    """
+    Returns the time-to-live of the first rule in ``policy`` matching ``path``.
+
+    Args:
+        policy (List[Tuple[Pattern[str], float]]): Ordered (pattern, ttl) rules.
+        path (str): The request path and query, relative to the base URL.
+
+    Returns:
+        Optional[float]: The matching time-to-live, or `None` if no rule matches.
+    """
+    for pattern, ttl in policy:
+        if pattern.search(path):
+            return ttl
+    return None
+
+
+def is_empty_response(data: Any) -> bool:
+    """
+    Tells whether a response carries no data, so it must not be kept forever.
+
+    Args:
+        data (Any): The ``data`` field of an `ApiResponse`.
+
+    Returns:
+        bool: `True` for a missing or empty payload, or an empty result page.
+    """
+    if not data:
+        return True
+    return isinstance(data, dict) and "results" in data and not page_results(data)
+
+
+def response_ttl(ttl: Optional[float], data: Any) -> Optional[float]:
+    """
+    Returns the time-to-live for a response, given its path's ``ttl``.
+
+    `IMMUTABLE` is lowered to `EMPTY_RESPONSE_TTL` for empty responses, which
+    only mean the data does not exist yet.
+    """
+    if ttl == IMMUTABLE and is_empty_response(data):
+        return EMPTY_RESPONSE_TTL
+    return ttl
+
+
+class ResponseCache:
+    """
+    A thread-safe LRU cache of API responses with per-endpoint expiry.
+
+    Cached `ApiResponse` objects are shared between callers and should be
+    treated as read-only.
+
+    Args:
+        max_entries (int): The number of responses to keep before evicting the
+            least recently used one.
+        policy (Optional[List[Tuple[Pattern[str], float]]]): Rules mapping a
+            request path to a time-to-live in seconds. Defaults to
+            `DEFAULT_CACHE_POLICY`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        policy: Optional[List[Tuple[Pattern[str], float]]] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self.max_entries = max_entries
+        self.policy = DEFAULT_CACHE_POLICY if policy is None else policy
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """
+        Returns how long the response for ``path`` may be cached.
+
+        Args:
+            path (str): The request path and query, relative to the base URL.
+
+        Returns:
+            Optional[float]: A time-to-live in seconds, `IMMUTABLE`, or `None`
+            if the response must not be cached.
+        """
+        return policy_ttl(self.policy, path)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
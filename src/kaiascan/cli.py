@@ -0,0 +1,264 @@
+"""
+This module provides the ``kaiascan`` command-line tool for bulk lookups.
+
+The tool reads one input per line (an address, transaction hash or block
+number) from stdin or a file. It calls the named `KaiascanSDK` method on each
+input using a pool of workers, and writes one JSON object per line (NDJSON)
+to stdout as each call finishes. Input is read lazily, so output starts while
+the input is still arriving. Each record is ``{"input": ..., "data": ...}`` or
+``{"input": ..., "error": ...}``; ``iter_*`` methods write one record per item
+as the items are fetched, so a long history is never held in memory.
+
+Only the standard library is imported until the SDK is built, so ``--help``
+returns without paying for ``requests``.
+
+Usage:
+    kaiascan get_account_info -w 16 < addresses.txt > accounts.ndjson
+    kaiascan iter_transactions_of_block -i blocks.txt --param size=100
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    get_args,
+)
+
+from .concurrency import bounded_map, bounded_map_unordered
+
+_END = object()
+
+
+def _read_inputs(stream: IO[str]) -> Iterator[str]:
+    for line in stream:
+        value = line.strip()
+        if value and not value.startswith("#"):
+            yield value
+
+
+def _accepts_int(annotation: Any) -> bool:
+    return annotation is int or int in get_args(annotation)
+
+
+def _to_int(value: str) -> int:
+    return int(value, 16) if value.lower().startswith("0x") else int(value)
+
+
+def resolve_method(sdk: Any, name: str) -> Callable[..., Any]:
+    """
+    Looks up an SDK method that takes a single address, hash or block number.
+
+    Args:
+        sdk (KaiascanSDK): The SDK the method is bound to.
+        name (str): A ``get_*`` or ``iter_*`` method name.
+
+    Returns:
+        Callable[..., Any]: The method, taking one input line first and
+        converting it to an integer where the method expects a block number.
+    """
+    import inspect
+
+    method: Optional[Callable[..., Any]] = (
+        getattr(sdk, name, None) if name.startswith(("get_", "iter_")) else None
+    )
+    if not callable(method):
+        raise ValueError(f"Unknown method: {name}")
+    parameters = list(inspect.signature(method).parameters.values())
+    first = parameters[0].annotation if parameters else None
+    positional = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    required = [
+        parameter
+        for parameter in parameters
+        if parameter.kind in positional and parameter.default is parameter.empty
+    ]
+    # `Address` is a NewType of str.
+    if len(required) != 1 or (
+        first not in (int, str) and getattr(first, "__supertype__", None) is not str
+    ):
+        raise ValueError(f"{name} does not take a single address, hash or number")
+
+    if first is int:
+        return lambda value, **kwargs: method(_to_int(value), **kwargs)
+    return method
+
+
+def parse_params(sdk: Any, name: str, params: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parses ``KEY=VALUE`` options into keyword arguments for an SDK method.
+
+    Args:
+        sdk (KaiascanSDK): The SDK the method is bound to.
+        name (str): The method name.
+        params (Iterable[str]): ``KEY=VALUE`` strings.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments, with integers converted where the
+        method expects them.
+    """
+    import inspect
+
+    parameters = inspect.signature(getattr(sdk, name)).parameters
+    kwargs: Dict[str, Any] = {}
+    for param in params:
+        key, separator, value = param.partition("=")
+        if not separator or key not in parameters:
+            raise ValueError(f"Invalid parameter for {name}: {param}")
+        kwargs[key] = (
+            _to_int(value) if _accepts_int(parameters[key].annotation) else value
+        )
+    return kwargs
+
+
+def run(
+    sdk: Any,
+    name: str,
+    inputs: Iterable[str],
+    out: IO[str],
+    workers: int = 8,
+    ordered: bool = False,
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Calls an SDK method on every input and streams the results as NDJSON.
+
+    Args:
+        sdk (KaiascanSDK): The SDK to call.
+        name (str): A ``get_*`` or ``iter_*`` method taking one input.
+        inputs (Iterable[str]): The inputs; consumed lazily.
+        out (IO[str]): The stream NDJSON records are written to.
+        workers (int): The number of concurrent calls.
+        ordered (bool): Write results in input order instead of as they
+            finish.
+        params (Optional[Dict[str, Any]]): Extra keyword arguments for every
+            call.
+
+    Returns:
+        int: The number of inputs that failed.
+    """
+    method = resolve_method(sdk, name)
+    kwargs = params or {}
+    paged = name.startswith("iter_")
+
+    def call(value: str) -> Dict[str, Any]:
+        try:
+            if paged:
+                # Fetch the first page here; the rest streams as it is written.
+                items = iter(method(value, **kwargs))
+                first = next(items, _END)
+                return {
+                    "items": items if first is _END else itertools.chain([first], items)
+                }
+            return {"data": method(value, **kwargs).data}
+        except Exception as e:
+            return {"error": str(e)}
+
+    def write(record: Dict[str, Any]) -> None:
+        out.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+
+    mapper = bounded_map if ordered else bounded_map_unordered
+    failed = 0
+    for value, result in mapper(call, inputs, max_workers=workers):
+        if "error" in result:
+            failed += 1
+            write({"input": value, **result})
+        elif paged:
+            try:
+                for item in result["items"]:
+                    write({"input": value, "data": item})
+            except Exception as e:
+                failed += 1
+                write({"input": value, "error": str(e)})
+        else:
+            write({"input": value, "data": result["data"]})
+        out.flush()
+    return failed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kaiascan",
+        description=(
+            "Call a KaiascanSDK method on each address, transaction hash or "
+            "block number read from the input, and stream the results as NDJSON."
+        ),
+    )
+    parser.add_argument("method", help="the SDK method, e.g. get_account_info")
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=argparse.FileType("r"),
+        default="-",
+        help="file with one input per line (default: stdin)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=8, help="concurrent requests"
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="extra keyword argument for every call; repeatable",
+    )
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="write results in input order instead of as they finish",
+    )
+    parser.add_argument("--testnet", action="store_true", help="use Kairos testnet")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    from .kaiascan import KaiascanSDK
+    from .transport import RequestsTransport
+
+    sdk = KaiascanSDK(
+        is_testnet=args.testnet, transport=RequestsTransport(pool_size=args.workers)
+    )
+    try:
+        resolve_method(sdk, args.method)
+        params = parse_params(sdk, args.method, args.param)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        failed = run(
+            sdk,
+            args.method,
+            _read_inputs(args.input),
+            sys.stdout,
+            workers=args.workers,
+            ordered=args.ordered,
+            params=params,
+        )
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); silence the final flush.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        args.input.close()
+        sdk.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
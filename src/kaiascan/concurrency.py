@@ -0,0 +1,118 @@
+"""
+This module provides small concurrency helpers shared by the bulk APIs.
+
+`bounded_map` applies a function to a stream of inputs on a thread pool while
+keeping only a bounded number of calls in flight, and yields results in input
+order as soon as they are ready. Unlike `ThreadPoolExecutor.map` it does not
+consume the whole input up front, so it works with unbounded iterables and
+keeps memory flat. `bounded_map_unordered` does the same but yields each
+result as soon as it finishes, for callers that only need to stream results.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, Iterator, Tuple, TypeVar
+
+A = TypeVar("A")
+R = TypeVar("R")
+
+
+def bounded_map(
+    fn: Callable[[A], R], items: Iterable[A], max_workers: int = 8
+) -> Iterator[Tuple[A, R]]:
+    """
+    Yields ``(item, fn(item))`` pairs in input order, computed concurrently.
+
+    Args:
+        fn (Callable[[A], R]): The function to apply.
+        items (Iterable[A]): The inputs; consumed lazily.
+        max_workers (int): The number of worker threads. At most twice this
+            many calls are submitted ahead of the consumer.
+
+    Returns:
+        Iterator[Tuple[A, R]]: Each input paired with its result. The first
+        exception raised by ``fn`` is re-raised when its result is reached.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Tuple[A, "Future[R]"]] = deque()
+        try:
+            for item in items:
+                pending.append((item, executor.submit(fn, item)))
+                if len(pending) >= max_workers * 2:
+                    done, future = pending.popleft()
+                    yield done, future.result()
+            while pending:
+                done, future = pending.popleft()
+                yield done, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def bounded_map_unordered(
+    fn: Callable[[A], R], items: Iterable[A], max_workers: int = 8
+) -> Iterator[Tuple[A, R]]:
+    """
+    Yields ``(item, fn(item))`` pairs in completion order, computed concurrently.
+
+    Finished calls are yielded whenever the next input is read, so one slow
+    call never holds back the results queued behind it.
+
+    Args:
+        fn (Callable[[A], R]): The function to apply.
+        items (Iterable[A]): The inputs; consumed lazily.
+        max_workers (int): The number of worker threads. At most twice this
+            many calls are submitted ahead of the consumer.
+
+    Returns:
+        Iterator[Tuple[A, R]]: Each input paired with its result. The first
+        exception raised by ``fn`` is re-raised when its result is reached.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict["Future[R]", A] = {}
+        try:
+            for item in items:
+                pending[executor.submit(fn, item)] = item
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                else:
+                    done = {future for future in pending if future.done()}
+                for future in done:
+                    yield pending.pop(future), future.result()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def chunked(items: Iterable[A], size: int) -> Iterator[Tuple[A, ...]]:
+    """
+    Splits ``items`` into tuples of at most ``size`` elements.
+
+    Args:
+        items (Iterable[A]): The inputs; consumed lazily.
+        size (int): The maximum chunk length.
+
+    Returns:
+        Iterator[Tuple[A, ...]]: Consecutive chunks in input order.
+    """
+    if size < 1:
+        raise ValueError("size must be >= 1")
+
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield tuple(chunk)
+            chunk = []
+    if chunk:
+        yield tuple(chunk)
@@ -0,0 +1,150 @@
+"""
+This module provides pluggable JSON decoders for API response bodies.
+
+`KaiascanSDK` decodes every response body through a `JsonDecoder`. The
+`default_decoder` function picks the fastest backend that is installed:
+msgspec, then orjson, then the standard library `json` module. Neither
+third-party backend is required. orjson cannot represent integers wider than
+64 bits, so bodies that may contain one (token amounts in their smallest unit
+often do) are parsed with `json` by that backend.
+
+Decoders can also turn a paginated body straight into typed models (see
+`kaiascan.interfaces.models`). The msgspec backend does this without building
+a `dict` for each item: items are decoded into generated structs that mirror
+the model's keys and handed to the model as a tuple.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from .interfaces.models import Model
+
+# Any integer outside the 64-bit range has at least 20 digits. A match inside a
+# string only sends that body down the slower, exact path.
+_WIDE_INTEGER = re.compile(rb"\d{20}")
+
+
+def _build_page(envelope: Dict[str, Any], model: Type[Model]) -> Dict[str, Any]:
+    data = envelope.get("data")
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        data["results"] = [model.from_dict(item) for item in data["results"]]
+    return envelope
+
+
+class JsonDecoder:
+    """
+    Decodes response bodies with the standard library `json` module.
+
+    Subclasses replace `loads` with a faster parser; `decode` handles model
+    conversion for all of them.
+    """
+
+    name = "json"
+
+    def loads(self, body: bytes) -> Any:
+        return json.loads(body)
+
+    def decode(self, body: bytes, model: Optional[Type[Model]] = None) -> Any:
+        """
+        Decodes a response envelope.
+
+        Args:
+            body (bytes): The raw response body.
+            model (Optional[Type[Model]]): If given, the items of a paginated
+                ``data.results`` list are returned as instances of this model.
+
+        Returns:
+            Any: The decoded envelope with ``code``, ``data`` and ``msg`` keys.
+        """
+        envelope = self.loads(body)
+        if model is None or not isinstance(envelope, dict):
+            return envelope
+        return _build_page(envelope, model)
+
+
+class OrjsonDecoder(JsonDecoder):
+    """
+    Decodes response bodies with orjson.
+
+    orjson turns integers wider than 64 bits into floats, so bodies containing
+    a 20-digit number are decoded with `json` instead to keep them exact.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads: Callable[[bytes], Any] = orjson.loads
+
+    def loads(self, body: bytes) -> Any:
+        if _WIDE_INTEGER.search(body):
+            return json.loads(body)
+        return self._loads(body)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """Decodes response bodies with msgspec, decoding pages directly into models."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._page_decoders: Dict[Type[Model], Any] = {}
+
+    def loads(self, body: bytes) -> Any:
+        return self._decoder.decode(body)
+
+    def _page_decoder(self, model: Type[Model]) -> Any:
+        decoder = self._page_decoders.get(model)
+        if decoder is None:
+            defstruct = self._msgspec.defstruct
+            names = [f"f{index}" for index in range(len(model.KEYS))]
+            item = defstruct(
+                f"{model.__name__}Item",
+                [(name, Any, None) for name in names],
+                rename=dict(zip(names, model.KEYS)),
+            )
+            page = defstruct(
+                f"{model.__name__}Page",
+                [("results", List[item]), ("paging", Any, None)],  # type: ignore[valid-type]
+            )
+            envelope = defstruct(
+                f"{model.__name__}Envelope",
+                [("code", int), ("data", page), ("msg", Any, None)],
+            )
+            decoder = self._msgspec.json.Decoder(envelope)
+            self._page_decoders[model] = decoder
+        return decoder
+
+    def decode(self, body: bytes, model: Optional[Type[Model]] = None) -> Any:
+        if model is None:
+            return self.loads(body)
+        try:
+            envelope = self._page_decoder(model).decode(body)
+        except self._msgspec.ValidationError:
+            return super().decode(body, model)
+
+        astuple = self._msgspec.structs.astuple
+        return {
+            "code": envelope.code,
+            "data": {
+                "results": [model(astuple(item)) for item in envelope.data.results],
+                "paging": envelope.data.paging,
+            },
+            "msg": envelope.msg,
+        }
+
+
+def default_decoder() -> JsonDecoder:
+    """Returns the fastest available decoder: msgspec, orjson, then `json`."""
+    for backend in (MsgspecDecoder, OrjsonDecoder):
+        try:
+            return backend()
+        except ImportError:
+            continue
+    return JsonDecoder()
@@ -0,0 +1,100 @@
+"""
+This module provides a persistent SQLite store for immutable API responses.
+
+Responses that the cache policy marks as `IMMUTABLE` (block and transaction
+details, transaction input data, contract ABIs, source and creation code) are
+written to a local SQLite database keyed by network chain ID and request path,
+so they survive process restarts and are never downloaded twice. Everything
+else is left to the in-memory `ResponseCache` or the network.
+
+Usage:
+    sdk = KaiascanSDK(is_testnet=False, disk_cache=DiskCache("~/.kaiascan.db"))
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, List, Optional, Pattern, Tuple
+
+from .cache import DEFAULT_CACHE_POLICY, IMMUTABLE, policy_ttl
+from .interfaces.api_response import ApiResponse
+
+
+class DiskCache:
+    """
+    A thread-safe, process-safe SQLite store of immutable API responses.
+
+    Args:
+        path (str): The database file. ``~`` is expanded and the file is
+            created on first use.
+        policy (Optional[List[Tuple[Pattern[str], float]]]): Rules mapping a
+            request path to a time-to-live; only `IMMUTABLE` paths are stored.
+            Defaults to `DEFAULT_CACHE_POLICY`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        policy: Optional[List[Tuple[Pattern[str], float]]] = None,
+    ):
+        self.path = os.path.expanduser(path)
+        self.policy = DEFAULT_CACHE_POLICY if policy is None else policy
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " chain_id TEXT NOT NULL,"
+            " request TEXT NOT NULL,"
+            " body TEXT NOT NULL,"
+            " PRIMARY KEY (chain_id, request)"
+            ") WITHOUT ROWID"
+        )
+
+    def is_persistent(self, path: str) -> bool:
+        """
+        Tells whether the response for ``path`` belongs in the store.
+
+        Args:
+            path (str): The request path and query, relative to the base URL.
+
+        Returns:
+            bool: `True` if the policy marks the path as `IMMUTABLE`.
+        """
+        return policy_ttl(self.policy, path) == IMMUTABLE
+
+    def get(self, chain_id: str, request: str) -> Optional[ApiResponse[Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body FROM responses WHERE chain_id = ? AND request = ?",
+                (chain_id, request),
+            ).fetchone()
+        if row is None:
+            return None
+        body = json.loads(row[0])
+        return ApiResponse(code=body["code"], data=body["data"], msg=body["msg"])
+
+    def set(self, chain_id: str, request: str, response: ApiResponse[Any]) -> None:
+        body = json.dumps(
+            {"code": response.code, "data": response.data, "msg": response.msg},
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (chain_id, request, body)"
+                " VALUES (?, ?, ?)",
+                (chain_id, request, body),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            )
@@ -0,0 +1,235 @@
+"""
+This module streams paginated API results into columnar formats.
+
+Items produced by the ``iter_*`` methods (dicts, or models when the client is
+typed) are gathered into fixed-size batches and turned into Arrow record
+batches, Parquet files or NumPy structured arrays, one batch at a time, so a
+full token history never has to exist as a list of dicts.
+
+Column types come from the model's field converters:
+
+* integers (block numbers, counts) become ``int64``;
+* datetimes become UTC second-resolution timestamps;
+* amounts become exact decimal strings in Arrow, since a full uint256 has 78
+  digits and Arrow's widest decimal holds 76, and exact `Decimal` objects in
+  NumPy, which has no wide integer type. Pass ``decimal_scale`` to get
+  ``decimal256(76, decimal_scale)`` columns instead when amounts are known to
+  fit;
+* topic lists become lists of strings; everything else is a string.
+
+pyarrow and NumPy are optional and only imported when used.
+
+Usage:
+    write_parquet(sdk.iter_token_transfers(token, max_workers=4),
+                  TokenTransfer, "transfers.parquet")
+"""
+
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from .concurrency import chunked
+from .interfaces.models import Model, to_datetime, to_decimal, to_int
+
+DEFAULT_BATCH_SIZE = 65_536
+
+# Arrow's widest decimal type holds this many digits, fewer than a uint256.
+MAX_DECIMAL_PRECISION = 76
+
+# NumPy integer columns cannot hold missing values; they are stored as this.
+NUMPY_INT_NULL = -1
+
+
+def _import(module: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as error:
+        raise ImportError(
+            f"{module} is required for columnar export: pip install {module}"
+        ) from error
+
+
+def _rows(items: Sequence[Any], model: Type[Model]) -> List[Tuple[Any, ...]]:
+    return [
+        item._values if isinstance(item, Model) else tuple(map(item.get, model.KEYS))
+        for item in items
+    ]
+
+
+def _decimal_text(value: Any) -> str:
+    return format(to_decimal(value), "f")
+
+
+def _column(values: Iterable[Any], convert: Any) -> List[Any]:
+    if convert is None:
+        return [None if value is None else str(value) for value in values]
+    return [None if value is None else convert(value) for value in values]
+
+
+def arrow_schema(model: Type[Model], decimal_scale: Optional[int] = None) -> Any:
+    """
+    Returns the Arrow schema used for ``model``.
+
+    Args:
+        model (Type[Model]): The model describing the items.
+        decimal_scale (Optional[int]): Digits kept after the decimal point
+            for amounts stored as ``decimal256``. By default amounts are
+            exact decimal strings.
+
+    Returns:
+        pyarrow.Schema: One field per model attribute.
+    """
+    pa = _import("pyarrow")
+    types: Dict[Any, Any] = {
+        to_int: pa.int64(),
+        to_datetime: pa.timestamp("s", tz="UTC"),
+        to_decimal: pa.string()
+        if decimal_scale is None
+        else pa.decimal256(MAX_DECIMAL_PRECISION, decimal_scale),
+        tuple: pa.list_(pa.string()),
+    }
+    return pa.schema(
+        [
+            pa.field(attribute, types.get(convert, pa.string()))
+            for attribute, _, convert in model.FIELDS
+        ]
+    )
+
+
+def iter_record_batches(
+    items: Iterable[Any],
+    model: Type[Model],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    decimal_scale: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Converts a stream of items into Arrow record batches.
+
+    Args:
+        items (Iterable[Any]): Dicts or ``model`` instances; consumed lazily.
+        model (Type[Model]): The model describing the items.
+        batch_size (int): Rows per record batch.
+        decimal_scale (Optional[int]): See `arrow_schema`.
+
+    Returns:
+        Iterator[pyarrow.RecordBatch]: Batches sharing `arrow_schema(model)`.
+    """
+    pa = _import("pyarrow")
+    schema = arrow_schema(model, decimal_scale)
+    converters = [
+        _decimal_text if convert is to_decimal and decimal_scale is None else convert
+        for _, _, convert in model.FIELDS
+    ]
+    for batch in chunked(items, batch_size):
+        columns = zip(*_rows(batch, model))
+        yield pa.RecordBatch.from_arrays(
+            [
+                pa.array(_column(values, convert), type=field.type)
+                for convert, values, field in zip(converters, columns, schema)
+            ],
+            schema=schema,
+        )
+
+
+def write_parquet(
+    items: Iterable[Any],
+    model: Type[Model],
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    decimal_scale: Optional[int] = None,
+) -> int:
+    """
+    Streams items into a Parquet file, one row group per batch.
+
+    Args:
+        items (Iterable[Any]): Dicts or ``model`` instances; consumed lazily.
+        model (Type[Model]): The model describing the items.
+        path (str): The output file.
+        batch_size (int): Rows per row group.
+        decimal_scale (Optional[int]): See `arrow_schema`.
+
+    Returns:
+        int: The number of rows written.
+    """
+    _import("pyarrow")
+    import pyarrow.parquet as pq
+
+    rows = 0
+    with pq.ParquetWriter(path, arrow_schema(model, decimal_scale)) as writer:
+        for batch in iter_record_batches(items, model, batch_size, decimal_scale):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def numpy_dtype(model: Type[Model]) -> Any:
+    """
+    Returns the NumPy structured dtype used for ``model``.
+
+    Args:
+        model (Type[Model]): The model describing the items.
+
+    Returns:
+        numpy.dtype: One field per model attribute.
+    """
+    np = _import("numpy")
+    types: Dict[Any, Any] = {to_int: np.int64, to_datetime: "datetime64[s]"}
+    return np.dtype(
+        [
+            (attribute, types.get(convert, object))
+            for attribute, _, convert in model.FIELDS
+        ]
+    )
+
+
+def _numpy_value(value: Any, convert: Any) -> Any:
+    if convert is to_int:
+        return NUMPY_INT_NULL if value is None else to_int(value)
+    if convert is to_datetime:
+        if value is None:
+            return "NaT"
+        moment: datetime = to_datetime(value)
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    if value is None or convert is None:
+        return value
+    return convert(value)
+
+
+def to_numpy(
+    items: Iterable[Any],
+    model: Type[Model],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    out: Optional[Any] = None,
+) -> Any:
+    """
+    Collects items into a NumPy structured array, converting one batch at a time.
+
+    Args:
+        items (Iterable[Any]): Dicts or ``model`` instances; consumed lazily.
+        model (Type[Model]): The model describing the items.
+        batch_size (int): Rows converted per step.
+        out (Optional[numpy.ndarray]): An array to append to.
+
+    Returns:
+        numpy.ndarray: A structured array with `numpy_dtype(model)`.
+    """
+    np = _import("numpy")
+    dtype = numpy_dtype(model)
+    parts = [] if out is None else [out]
+    for batch in chunked(items, batch_size):
+        part = np.empty(len(batch), dtype=dtype)
+        for (attribute, _, convert), values in zip(
+            model.FIELDS, zip(*_rows(batch, model))
+        ):
+            part[attribute] = [_numpy_value(value, convert) for value in values]
+        parts.append(part)
+    return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
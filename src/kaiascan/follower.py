@@ -0,0 +1,230 @@
+"""
+This module provides a follower that streams new blocks as the chain grows.
+
+`ChainFollower` polls `get_latest_block` and delivers every block after its
+starting point exactly once and in order, even when several blocks appear
+between two polls or the follower falls behind. For each block it fetches the
+block itself, its transactions, its internal transactions and its rewards
+in parallel, and several blocks are fetched at once while catching up.
+
+The polling interval adapts to the chain: the follower keeps a moving average
+of the observed block time and polls again about one block time after the
+head last advanced, backing off gradually while the head stands still.
+
+Blocks are delivered through a callback (`run`), a plain iterator
+(`iter_blocks`) or an async iterator (`aiter_blocks`).
+
+Usage:
+    follower = ChainFollower(sdk)
+    for block in follower.iter_blocks():
+        alert(block.transactions)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .interfaces.models import Block
+from .kaiascan import KaiascanSDK
+
+
+@dataclass
+class FollowedBlock:
+    """
+    A data class holding one block and its contents.
+
+    Attributes:
+        number (int): The block number.
+        block (Any): The block, as returned by `get_block`.
+        transactions (List[Any]): Every transaction of the block.
+        internal_transactions (List[Any]): Every internal transaction.
+        rewards (Any): The block rewards, or `None` if not requested.
+    """
+
+    number: int
+    block: Any = None
+    transactions: List[Any] = field(default_factory=list)
+    internal_transactions: List[Any] = field(default_factory=list)
+    rewards: Any = None
+
+
+class ChainFollower:
+    """
+    Follows the chain head, yielding every new block in order.
+
+    A failed request stops the follower with that error; `next_block` then
+    tells where to restart without losing or repeating blocks.
+
+    Args:
+        sdk (KaiascanSDK): The client used for all requests.
+        start_block (Optional[int]): The first block to deliver. Defaults to
+            the head at the first poll.
+        poll_interval (float): The initial estimate of the block time.
+        min_interval (float): The shortest wait between polls.
+        max_interval (float): The longest wait between polls.
+        max_workers (int): Blocks fetched concurrently while catching up.
+        include_internal (bool): Also fetch internal transactions.
+        include_rewards (bool): Also fetch block rewards.
+    """
+
+    def __init__(
+        self,
+        sdk: KaiascanSDK,
+        start_block: Optional[int] = None,
+        poll_interval: float = 1.0,
+        min_interval: float = 0.2,
+        max_interval: float = 5.0,
+        max_workers: int = 4,
+        include_internal: bool = True,
+        include_rewards: bool = True,
+    ):
+        if start_block is not None and start_block < 0:
+            raise ValueError("start_block must be >= 0")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.sdk = sdk
+        self.next_block = start_block
+        self.block_time = poll_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_workers = max_workers
+        self.include_internal = include_internal
+        self.include_rewards = include_rewards
+        self.head: Optional[int] = None
+        self._advanced_at = 0.0
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        """Stops following once the block being delivered has been handled."""
+        self._stopped.set()
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def poll(self) -> int:
+        """Reads the chain head and updates the block time estimate."""
+        head = Block.from_dict(self.sdk.get_latest_block().data).number
+        now = time.monotonic()
+        if self.head is not None and head > self.head:
+            observed = (now - self._advanced_at) / (head - self.head)
+            self.block_time = 0.8 * self.block_time + 0.2 * observed
+        if self.head is None or head > self.head:
+            self.head = head
+            self._advanced_at = now
+        return head
+
+    def fetch_block(self, number: int, parts: ThreadPoolExecutor) -> FollowedBlock:
+        """Fetches one block and its contents, in parallel on ``parts``."""
+        sdk = self.sdk
+        block = parts.submit(lambda: sdk.get_block(number).data)
+        transactions = parts.submit(
+            lambda: list(sdk.iter_transactions_of_block(number))
+        )
+        internal = (
+            parts.submit(lambda: list(sdk.iter_internal_transactions_of_block(number)))
+            if self.include_internal
+            else None
+        )
+        rewards = (
+            parts.submit(lambda: sdk.get_block_rewards(number).data)
+            if self.include_rewards
+            else None
+        )
+        return FollowedBlock(
+            number,
+            block.result(),
+            transactions.result(),
+            [] if internal is None else internal.result(),
+            None if rewards is None else rewards.result(),
+        )
+
+    def iter_blocks(self) -> Generator[FollowedBlock, None, None]:
+        """
+        Yields new blocks in order until `stop` is called.
+
+        Returns:
+            Generator[FollowedBlock, None, None]: Every block from
+            `next_block` onwards.
+        """
+        self._stopped.clear()
+        wait = self.block_time
+        blocks = ThreadPoolExecutor(self.max_workers)
+        parts = ThreadPoolExecutor(self.max_workers * 4)
+        pending: Deque[Tuple[int, "Future[FollowedBlock]"]] = deque()
+        submitted: Optional[int] = None
+        try:
+            while not self._stopped.is_set():
+                if self.head is not None and self.next_block is not None:
+                    start = self.next_block if submitted is None else submitted + 1
+                    for number in range(start, self.head + 1):
+                        if len(pending) >= self.max_workers:
+                            break
+                        future = blocks.submit(self.fetch_block, number, parts)
+                        pending.append((number, future))
+                        submitted = number
+                if pending:
+                    number, future = pending.popleft()
+                    result = future.result()
+                    self.next_block = number + 1
+                    yield result
+                    continue
+
+                previous = self.head
+                if previous is not None:
+                    self._stopped.wait(wait)
+                    if self._stopped.is_set():
+                        break
+                head = self.poll()
+                if self.next_block is None:
+                    self.next_block = head
+                if previous is None or head > previous:
+                    wait = self._clamp(self.block_time)
+                else:
+                    wait = self._clamp(wait * 1.5)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            blocks.shutdown()
+            parts.shutdown()
+
+    def run(self, handler: Callable[[FollowedBlock], None]) -> None:
+        """Calls ``handler`` for each new block until `stop` is called."""
+        for block in self.iter_blocks():
+            handler(block)
+
+    async def aiter_blocks(self) -> AsyncIterator[FollowedBlock]:
+        """
+        Yields new blocks to an event loop until `stop` is called.
+
+        Polling and fetching run on a worker thread, so the loop is never
+        blocked while waiting for the next block.
+        """
+        loop = asyncio.get_running_loop()
+        blocks = self.iter_blocks()
+        # One thread drives the generator, so closing it waits for a pending step.
+        with ThreadPoolExecutor(max_workers=1) as driver:
+            try:
+                while True:
+                    block = await loop.run_in_executor(driver, next, blocks, None)
+                    if block is None:
+                        return
+                    yield block
+            finally:
+                self.stop()
+                await loop.run_in_executor(driver, blocks.close)
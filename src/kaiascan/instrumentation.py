@@ -0,0 +1,237 @@
+"""
+This module provides per-request instrumentation for `KaiascanSDK`.
+
+Every call that goes through the client produces one `RequestMetrics` record,
+which is passed to each hook in ``KaiascanSDK.hooks``. A record says where the
+time went: waiting for the rate limiter, waiting for the server's first byte,
+reading the body, and decoding JSON. It also notes whether the response came
+from a cache and how many times the request was retried.
+
+`PrometheusCollector` is a ready-made hook that aggregates records into
+counters and histograms and renders them in the Prometheus text format.
+
+``requests`` does not report DNS and TCP/TLS connect time separately, so they
+are included in ``ttfb``, the time from sending the request until the response
+headers were parsed.
+
+Usage:
+    collector = PrometheusCollector()
+    sdk = KaiascanSDK(is_testnet=True, hooks=[collector])
+    sdk.get_latest_block()
+    print(collector.render())
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# How a response was obtained.
+CACHE_HIT = "hit"  # from the in-memory response cache
+CACHE_DISK = "disk"  # from the persistent disk cache
+CACHE_MISS = "miss"  # fetched from the API
+CACHE_SHARED = "shared"  # shared with an identical request already in flight
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_TEMPLATE_RULES: List[Tuple["re.Pattern[str]", str]] = [
+    (re.compile(r"(?<=/)0x[0-9a-fA-F]{64}(?=/|$)"), "{hash}"),
+    (re.compile(r"(?<=/)0x[0-9a-fA-F]{40}(?=/|$)"), "{address}"),
+    (re.compile(r"(?<=/)(?:\d+|0x[0-9a-fA-F]+)(?=/|$)"), "{id}"),
+]
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Reduces a request path to its endpoint template.
+
+    Addresses, hashes and other identifiers in the path are replaced with
+    placeholders and the query string is dropped, so metrics are grouped per
+    endpoint rather than per resource.
+
+    Args:
+        path (str): The request path and query, relative to the base URL.
+
+    Returns:
+        str: The template, for example ``api/v1/accounts/{address}/transactions``.
+    """
+    template = path.split("?", 1)[0]
+    for pattern, placeholder in _TEMPLATE_RULES:
+        template = pattern.sub(placeholder, template)
+    return template
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Timings and counters for one call through the client.
+
+    All durations are in seconds. Network fields stay at zero when the
+    response was served from a cache.
+    """
+
+    url: str
+    endpoint: str
+    cache: str = CACHE_SHARED
+    status: Optional[int] = None
+    queue_wait: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    decode: float = 0.0
+    total: float = 0.0
+    bytes_received: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+
+
+RequestHook = Callable[[RequestMetrics], None]
+
+
+class _Histogram:
+    __slots__ = ("bounds", "count", "counts", "total")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    pairs = ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    # Exact sample values: `:g` would round large byte counts to six digits.
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class PrometheusCollector:
+    """
+    A request hook that keeps Prometheus-style counters and histograms.
+
+    Counters are labelled by endpoint template (and, for the request count,
+    by cache outcome and status); histograms are labelled by endpoint.
+
+    Args:
+        prefix (str): Prefix for every metric name.
+        buckets (Sequence[float]): Upper bounds of the histogram buckets.
+    """
+
+    _COUNTERS = (
+        ("requests_total", "Requests made through the client.", 3),
+        ("retries_total", "Retried HTTP attempts.", 1),
+        ("response_bytes_total", "Response body bytes received.", 1),
+        ("errors_total", "Requests that raised an error.", 1),
+    )
+    _HISTOGRAMS = (
+        ("request_seconds", "Total time per request."),
+        ("queue_wait_seconds", "Time spent waiting for the rate limiter."),
+        ("ttfb_seconds", "Time until response headers, including connect."),
+        ("download_seconds", "Time spent reading the response body."),
+        ("decode_seconds", "Time spent decoding the response body."),
+    )
+
+    def __init__(
+        self, prefix: str = "kaiascan", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._counters: Dict[str, Dict[Tuple[str, ...], float]] = {
+            name: {} for name, _, _ in self._COUNTERS
+        }
+        self._histograms: Dict[str, Dict[str, _Histogram]] = {
+            name: {} for name, _ in self._HISTOGRAMS
+        }
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, labels: Tuple[str, ...], amount: float) -> None:
+        counter = self._counters[name]
+        counter[labels] = counter.get(labels, 0) + amount
+
+    def _observe(self, name: str, endpoint: str, value: float) -> None:
+        series = self._histograms[name]
+        histogram = series.get(endpoint)
+        if histogram is None:
+            histogram = series[endpoint] = _Histogram(self.buckets)
+        histogram.observe(value)
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        endpoint = metrics.endpoint
+        status = "" if metrics.status is None else str(metrics.status)
+        network = metrics.cache == CACHE_MISS
+        with self._lock:
+            self._count("requests_total", (endpoint, metrics.cache, status), 1)
+            if metrics.retries:
+                self._count("retries_total", (endpoint,), metrics.retries)
+            if metrics.bytes_received:
+                self._count("response_bytes_total", (endpoint,), metrics.bytes_received)
+            if metrics.error is not None:
+                self._count("errors_total", (endpoint,), 1)
+            self._observe("request_seconds", endpoint, metrics.total)
+            if network:
+                self._observe("queue_wait_seconds", endpoint, metrics.queue_wait)
+                self._observe("ttfb_seconds", endpoint, metrics.ttfb)
+                self._observe("download_seconds", endpoint, metrics.download)
+                self._observe("decode_seconds", endpoint, metrics.decode)
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        label_names = {3: ("endpoint", "cache", "status"), 1: ("endpoint",)}
+        lines: List[str] = []
+        with self._lock:
+            for name, help_text, arity in self._COUNTERS:
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(
+                        f"{full_name}{_labels(label_names[arity], labels)} "
+                        f"{_number(value)}"
+                    )
+            for name, help_text in self._HISTOGRAMS:
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for endpoint, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    bounds = [f"{bound:g}" for bound in histogram.bounds] + ["+Inf"]
+                    for bound, count in zip(bounds, histogram.counts):
+                        cumulative += count
+                        bucket = _labels(("endpoint", "le"), (endpoint, bound))
+                        lines.append(f"{full_name}_bucket{bucket} {cumulative}")
+                    series = _labels(("endpoint",), (endpoint,))
+                    lines.append(f"{full_name}_sum{series} {_number(histogram.total)}")
+                    lines.append(f"{full_name}_count{series} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Resets every counter and histogram."""
+        with self._lock:
+            for counter in self._counters.values():
+                counter.clear()
+            for series in self._histograms.values():
+                series.clear()
@@ -18,6 +18,8 @@ class ApiResponse(Generic[T]):
         T: The type of the data payload, allowing flexibility for various use cases.
     """
 
+    __slots__ = ("code", "data", "msg")
+
     def __init__(self, code: int, data: T, msg: str):
         self.code: int = code
         self.data: T = data
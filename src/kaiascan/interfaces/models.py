@@ -0,0 +1,316 @@
+"""
+This module defines compact, typed models for the main Kaiascan API payloads.
+
+Each model keeps the raw field values of one API item in a single tuple slot,
+so an instance costs one small object plus one tuple instead of a full `dict`.
+Values are converted to their Python types (integers, decimals, datetimes)
+only when an attribute is read, so building millions of models is cheap and
+fields that are never looked at are never converted.
+
+Field names follow the snake_case keys of the Kaiascan Open API. Subclass a
+model and extend its ``FIELDS`` to pick up additional keys.
+
+`PAGE_MODELS` maps list endpoints to the model of their items; it is used by
+`KaiascanSDK(typed=True)` to return models instead of dicts.
+
+Usage:
+    transfers = TokenTransfer.from_page(sdk.get_token_transfers(token).data)
+    total = sum(transfer.amount for transfer in transfers)
+"""
+
+import re
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from ..pagination import page_results
+
+M = TypeVar("M", bound="Model")
+Converter = Optional[Callable[[Any], Any]]
+
+
+def to_int(value: Any) -> int:
+    """Converts decimal or ``0x``-prefixed hexadecimal values to `int`."""
+    if isinstance(value, str) and value[:2] in ("0x", "0X"):
+        return int(value, 16)
+    return int(value)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Converts token amounts to `Decimal` without losing precision."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def to_datetime(value: Any) -> datetime:
+    """Converts ISO-8601 strings or Unix timestamps to aware `datetime` objects."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class _Field:
+    """A descriptor reading and converting one raw value of a model on access."""
+
+    __slots__ = ("index", "key", "convert")
+
+    def __init__(self, index: int, key: str, convert: Converter):
+        self.index = index
+        self.key = key
+        self.convert = convert
+
+    def __get__(self, instance: Optional["Model"], owner: type) -> Any:
+        if instance is None:
+            return self
+        value = instance._values[self.index]
+        if value is None or self.convert is None:
+            return value
+        return self.convert(value)
+
+
+class Model:
+    """
+    Base class for slotted, lazily converted API models.
+
+    Subclasses declare ``__slots__ = ()`` and a ``FIELDS`` tuple of
+    ``(attribute, api_key, converter)`` entries; a converter of `None` returns
+    the raw value unchanged. Each attribute is also annotated with its
+    converted type so type checkers see it; keys a payload may omit read as
+    `None` and are annotated `Optional`.
+    """
+
+    __slots__ = ("_values",)
+
+    FIELDS: ClassVar[Tuple[Tuple[str, str, Converter], ...]] = ()
+    KEYS: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls.KEYS = tuple(key for _, key, _ in cls.FIELDS)
+        for index, (attribute, key, convert) in enumerate(cls.FIELDS):
+            setattr(cls, attribute, _Field(index, key, convert))
+
+    def __init__(self, values: Tuple[Any, ...]):
+        self._values = values
+
+    @classmethod
+    def from_dict(cls: Type[M], item: Dict[str, Any]) -> M:
+        """Builds a model from one item of an API payload."""
+        return cls(tuple(map(item.get, cls.KEYS)))
+
+    @classmethod
+    def from_page(cls: Type[M], data: Any) -> List[M]:
+        """Builds models for every item of a paginated API payload."""
+        return [cls.from_dict(item) for item in page_results(data)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the converted fields keyed by attribute name."""
+        return {attribute: getattr(self, attribute) for attribute, _, _ in self.FIELDS}
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._values == other._values
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{attribute}={value!r}"
+            for (attribute, _, _), value in zip(self.FIELDS, self._values)
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self._values
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self._values = state
+
+
+class Block(Model):
+    """A block, as returned by the block endpoints."""
+
+    __slots__ = ()
+
+    number: int
+    hash: str
+    parent_hash: Optional[str]
+    datetime: Optional[datetime]
+    transaction_count: Optional[int]
+    proposer: Optional[str]
+    gas_used: Optional[int]
+    base_fee_per_gas: Optional[Decimal]
+    size: Optional[int]
+
+    FIELDS = (
+        ("number", "block_id", to_int),
+        ("hash", "hash", None),
+        ("parent_hash", "parent_hash", None),
+        ("datetime", "datetime", to_datetime),
+        ("transaction_count", "total_transaction_count", to_int),
+        ("proposer", "block_proposer", None),
+        ("gas_used", "gas_used", to_int),
+        ("base_fee_per_gas", "base_fee_per_gas", to_decimal),
+        ("size", "block_size", to_int),
+    )
+
+
+class Transaction(Model):
+    """A transaction, as returned by the account, block and transaction endpoints."""
+
+    __slots__ = ()
+
+    hash: str
+    block_number: int
+    datetime: Optional[datetime]
+    from_address: Optional[str]
+    to_address: Optional[str]
+    transaction_type: Optional[str]
+    method_id: Optional[str]
+    amount: Optional[Decimal]
+    fee: Optional[Decimal]
+    status: Optional[Any]
+
+    FIELDS = (
+        ("hash", "transaction_hash", None),
+        ("block_number", "block_id", to_int),
+        ("datetime", "datetime", to_datetime),
+        ("from_address", "from", None),
+        ("to_address", "to", None),
+        ("transaction_type", "transaction_type", None),
+        ("method_id", "method_id", None),
+        ("amount", "amount", to_decimal),
+        ("fee", "transaction_fee", to_decimal),
+        ("status", "status", None),
+    )
+
+
+class TokenTransfer(Model):
+    """A fungible token transfer."""
+
+    __slots__ = ()
+
+    transaction_hash: str
+    block_number: int
+    datetime: Optional[datetime]
+    contract_address: Optional[str]
+    from_address: Optional[str]
+    to_address: Optional[str]
+    amount: Optional[Decimal]
+
+    FIELDS = (
+        ("transaction_hash", "transaction_hash", None),
+        ("block_number", "block_id", to_int),
+        ("datetime", "datetime", to_datetime),
+        ("contract_address", "contract_address", None),
+        ("from_address", "from", None),
+        ("to_address", "to", None),
+        ("amount", "amount", to_decimal),
+    )
+
+
+class NftTransfer(Model):
+    """A KIP-17 or KIP-37 token transfer."""
+
+    __slots__ = ()
+
+    transaction_hash: str
+    block_number: int
+    datetime: Optional[datetime]
+    contract_address: Optional[str]
+    from_address: Optional[str]
+    to_address: Optional[str]
+    token_id: Optional[str]
+    token_count: Optional[int]
+
+    FIELDS = (
+        ("transaction_hash", "transaction_hash", None),
+        ("block_number", "block_id", to_int),
+        ("datetime", "datetime", to_datetime),
+        ("contract_address", "contract_address", None),
+        ("from_address", "from", None),
+        ("to_address", "to", None),
+        ("token_id", "token_id", None),
+        ("token_count", "token_count", to_int),
+    )
+
+
+class TokenHolder(Model):
+    """A holder of a fungible token or NFT collection."""
+
+    __slots__ = ()
+
+    holder_address: str
+    amount: Optional[Decimal]
+    percentage: Optional[Decimal]
+
+    FIELDS = (
+        ("holder_address", "holder_address", None),
+        ("amount", "amount", to_decimal),
+        ("percentage", "percentage", to_decimal),
+    )
+
+
+class EventLog(Model):
+    """An event log emitted by a contract."""
+
+    __slots__ = ()
+
+    transaction_hash: str
+    block_number: int
+    datetime: Optional[datetime]
+    log_index: int
+    contract_address: Optional[str]
+    signature: Optional[str]
+    topics: Optional[Tuple[str, ...]]
+    data: Optional[str]
+
+    FIELDS = (
+        ("transaction_hash", "transaction_hash", None),
+        ("block_number", "block_id", to_int),
+        ("datetime", "datetime", to_datetime),
+        ("log_index", "log_index", to_int),
+        ("contract_address", "contract_address", None),
+        ("signature", "signature", None),
+        ("topics", "topics", tuple),
+        ("data", "data", None),
+    )
+
+
+# Ordered (pattern, model) rules matched against the request path and query,
+# relative to the network base URL. The first match wins.
+PAGE_MODELS: List[Tuple[Pattern[str], Type[Model]]] = [
+    (re.compile(r"/(token-transfers|tokens/[^/]+/transfers)\?"), TokenTransfer),
+    (re.compile(r"/(nft-transfers|nfts/[^/]+/transfers)\?"), NftTransfer),
+    (re.compile(r"/event-logs\?"), EventLog),
+    (re.compile(r"/holders\?"), TokenHolder),
+    (re.compile(r"/(fee-paid-transactions|transactions)\?"), Transaction),
+    (re.compile(r"^api/v1/blocks\?blockNumber=\d+&"), Block),
+]
+
+
+def model_for(path: str) -> Optional[Type[Model]]:
+    """
+    Returns the model for the items of a list endpoint.
+
+    Args:
+        path (str): The request path and query, relative to the base URL.
+
+    Returns:
+        Optional[Type[Model]]: The item model, or `None` if the endpoint has none.
+    """
+    for pattern, model in PAGE_MODELS:
+        if pattern.search(path):
+            return model
+    return None
@@ -31,6 +31,19 @@ class TokenInfo:
         total_burns (int): The total number of burn transactions.
     """
 
+    __slots__ = (
+        "contract_type",
+        "name",
+        "symbol",
+        "icon",
+        "decimal",
+        "total_supply",
+        "total_transfers",
+        "official_site",
+        "burn_amount",
+        "total_burns",
+    )
+
     contract_type: str
     name: str
     symbol: str
@@ -1,18 +1,89 @@
-from typing import Optional, Any, TypeVar, List
 import os
+import time
 import urllib.parse
-from requests import Session
-from .objects.chain_info import CHAIN_INFO
-from .objects.endpoints import ENDPOINTS
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from requests import Response
+from requests.exceptions import ConnectionError as RequestConnectionError
+from requests.exceptions import Timeout
+
+from .cache import ResponseCache, is_empty_response, response_ttl
+from .concurrency import bounded_map, chunked
+from .decoding import JsonDecoder, default_decoder
+from .disk_cache import DiskCache
+from .instrumentation import (
+    CACHE_DISK,
+    CACHE_HIT,
+    CACHE_MISS,
+    RequestHook,
+    RequestMetrics,
+    endpoint_template,
+)
 from .interfaces.api_response import ApiResponse
+from .interfaces.models import model_for
 from .interfaces.token_info import TokenInfo
-from .types.address import Address
+from .objects.chain_info import CHAIN_INFO
+from .objects.endpoints import ENDPOINTS
+from .pagination import MAX_PAGE_SIZE, is_last_page, page_results, total_pages
+from .rate_limit import RateLimiter, RetryPolicy, parse_retry_after
+from .single_flight import SingleFlight
+from .transport import RequestsTransport, Transport
+from .types.address import Address, normalize_address, normalize_addresses
 
 T = TypeVar("T")
+K = TypeVar("K")
+
+
+def contracts_by_address(
+    addresses: List[Address], chunks: Iterable[Any]
+) -> Dict[Address, Any]:
+    """
+    Merges chunked `get_contracts_info` responses into one lookup.
+
+    A chunk's data is either a mapping keyed by address or a page of contract
+    items. Addresses missing from every chunk map to ``None``.
+    """
+    by_address: Dict[str, Any] = {}
+    for data in chunks:
+        if isinstance(data, dict) and "results" not in data:
+            items = {str(key).lower(): value for key, value in data.items()}
+        else:
+            items = {
+                str(item.get("contract_address", "")).lower(): item
+                for item in page_results(data)
+                if isinstance(item, dict)
+            }
+        by_address.update(items)
+    return {address: by_address.get(address.lower()) for address in addresses}
 
 
 class KaiascanSDK:
-    def __init__(self, is_testnet: bool):
+    def __init__(
+        self,
+        is_testnet: bool,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        single_flight: Optional["SingleFlight[ApiResponse[Any]]"] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        typed: bool = False,
+        hooks: Optional[List[RequestHook]] = None,
+        transport: Optional[Transport] = None,
+    ):
         self.base_url = (
             CHAIN_INFO["BASE_URL_TESTNET"]
             if is_testnet
@@ -23,19 +94,103 @@ class KaiascanSDK:
             if is_testnet
             else CHAIN_INFO["CHAIN_ID_MAINNET"]
         )
-        self.session = Session()
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.single_flight = (
+            single_flight if single_flight is not None else SingleFlight()
+        )
+        self.json_decoder = (
+            json_decoder if json_decoder is not None else default_decoder()
+        )
+        self.typed = typed
+        self.hooks: List[RequestHook] = list(hooks) if hooks else []
+        self.session = transport if transport is not None else RequestsTransport()
         self.session.headers.update(
             {
-                "Authorization": f'Bearer {os.getenv("API_KEY")}',
+                "Authorization": f"Bearer {os.getenv('API_KEY')}",
                 "Content-Type": "application/json",
             }
         )
 
+    def close(self) -> None:
+        """Closes the pooled connections of the transport."""
+        self.session.close()
+
     def _fetch_api(self, url_str: str) -> ApiResponse[T]:
+        if not self.hooks:
+            return self._fetch(url_str, None)
+
+        started = time.perf_counter()
+        metrics = RequestMetrics(
+            url=url_str, endpoint=endpoint_template(url_str[len(self.base_url) :])
+        )
         try:
-            response = self.session.get(url_str)
+            return self._fetch(url_str, metrics)
+        except Exception as error:
+            metrics.error = str(error)
+            raise
+        finally:
+            metrics.total = time.perf_counter() - started
+            for hook in self.hooks:
+                hook(metrics)
+
+    def _fetch(self, url_str: str, metrics: Optional[RequestMetrics]) -> ApiResponse[T]:
+        cache = self.cache
+        path = url_str[len(self.base_url) :]
+        ttl = None if cache is None else cache.ttl_for(path)
+        if cache is not None and ttl is not None:
+            cached: Optional[ApiResponse[T]] = cache.get(url_str)
+            if cached is not None:
+                if metrics is not None:
+                    metrics.cache = CACHE_HIT
+                return cached
+
+        return self.single_flight.do(
+            url_str, lambda: self._load(url_str, path, ttl, metrics)
+        )
+
+    def _load(
+        self,
+        url_str: str,
+        path: str,
+        ttl: Optional[float],
+        metrics: Optional[RequestMetrics] = None,
+    ) -> ApiResponse[T]:
+        disk_cache = self.disk_cache
+        if disk_cache is not None and not disk_cache.is_persistent(path):
+            disk_cache = None
+        stored = None if disk_cache is None else disk_cache.get(self.chain_id, path)
+        if stored is not None:
+            if metrics is not None:
+                metrics.cache = CACHE_DISK
+            api_response: ApiResponse[T] = stored
+        else:
+            if metrics is not None:
+                metrics.cache = CACHE_MISS
+            api_response = self._request(url_str, metrics)
+            if disk_cache is not None and not is_empty_response(api_response.data):
+                disk_cache.set(self.chain_id, path, api_response)
+
+        ttl = response_ttl(ttl, api_response.data)
+        if self.cache is not None and ttl is not None:
+            self.cache.set(url_str, api_response, ttl)
+        return api_response
+
+    def _request(
+        self, url_str: str, metrics: Optional[RequestMetrics] = None
+    ) -> ApiResponse[T]:
+        try:
+            response = self._send(url_str, metrics)
             response.raise_for_status()
-            data = response.json()
+            model = model_for(url_str[len(self.base_url) :]) if self.typed else None
+            if metrics is None:
+                data = self.json_decoder.decode(response.content, model)
+            else:
+                started = time.perf_counter()
+                data = self.json_decoder.decode(response.content, model)
+                metrics.decode = time.perf_counter() - started
 
             api_response = ApiResponse(
                 code=data["code"], data=data["data"], msg=data["msg"]
@@ -46,13 +201,132 @@ class KaiascanSDK:
                     f"API error! code: {api_response.code}, message: {api_response.msg}"
                 )
 
+            if self.rate_limiter is not None:
+                self.rate_limiter.reward()
             return api_response
         except Exception as error:
             raise Exception(f"Error making request to {url_str}: {str(error)}")
 
+    def _send(self, url_str: str, metrics: Optional[RequestMetrics] = None) -> Response:
+        """
+        Sends a GET request, throttled and retried according to the client policy.
+
+        Connection errors and retryable statuses are retried with jittered
+        exponential backoff. HTTP 429 also slows the shared rate limiter down
+        and honours ``Retry-After``. The last response or error is returned or
+        raised once the retries are exhausted.
+
+        If ``metrics`` is given, rate limiter waits and retries are added to it
+        and the timings of the final attempt are recorded.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if metrics is not None:
+                    metrics.queue_wait += waited
+            if metrics is not None:
+                metrics.retries = attempt
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url_str)
+            except (RequestConnectionError, Timeout):
+                if attempt >= self.retry.max_retries:
+                    raise
+                time.sleep(self.retry.backoff(attempt))
+                attempt += 1
+                continue
+
+            if metrics is not None:
+                elapsed = time.perf_counter() - started
+                metrics.status = response.status_code
+                metrics.ttfb = min(response.elapsed.total_seconds(), elapsed)
+                metrics.download = elapsed - metrics.ttfb
+                metrics.bytes_received = len(response.content)
+            if response.status_code not in self.retry.retry_statuses:
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.penalize(retry_after)
+            if attempt >= self.retry.max_retries:
+                return response
+            time.sleep(self.retry.backoff(attempt, retry_after))
+            attempt += 1
+
+    def _iter_pages(
+        self,
+        fetch: Callable[..., ApiResponse[Any]],
+        *args: Any,
+        size: int,
+        max_workers: int = 1,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """
+        Yields every item of a paginated endpoint, in page order.
+
+        The next page is requested on a background thread while the caller
+        consumes the current one. With ``max_workers`` above one, the total
+        page count reported by the first page is used to keep up to that many
+        later pages in flight at once; items are still yielded in page order
+        and at most ``max_workers + 1`` pages are held at a time.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def submit(page: int) -> "Future[ApiResponse[Any]]":
+                return executor.submit(fetch, *args, page=page, size=size, **kwargs)
+
+            pending: Deque[Tuple[int, "Future[ApiResponse[Any]]"]] = deque(
+                [(1, submit(1))]
+            )
+            next_page = 2
+            pages: Optional[int] = None
+            try:
+                while pending:
+                    page, future = pending.popleft()
+                    data = future.result().data
+                    if page == 1 and max_workers > 1:
+                        pages = total_pages(data, size)
+                    last = is_last_page(data, page, size)
+                    if not last:
+                        limit = page + 1 if pages is None else pages
+                        while len(pending) < max_workers and next_page <= limit:
+                            pending.append((next_page, submit(next_page)))
+                            next_page += 1
+                    yield from page_results(data)
+                    if last:
+                        break
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _bulk(
+        self,
+        fetch: Callable[[K], ApiResponse[Any]],
+        keys: Iterable[K],
+        max_workers: int,
+    ) -> Dict[K, Any]:
+        """
+        Looks up many keys concurrently through a single-item endpoint.
+
+        Duplicate keys are fetched once. The result maps each key to the
+        ``data`` of its response, in input order.
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            raise ValueError("At least one key is required")
+
+        return {
+            key: response.data
+            for key, response in bounded_map(fetch, unique, max_workers)
+        }
+
     def get_account_key_histories(
         self, account_address: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -62,9 +336,17 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{urllib.parse.quote(account_address)}/key-histories?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_key_histories(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_key_histories, account_address, size=size, **filters
+        )
+
     def get_account_info(self, account_address: str) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
 
         url_str = f"{self.base_url}api/v1/accounts/{account_address}"
         return self._fetch_api(url_str)
@@ -80,6 +362,9 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
+        if contract_address:
+            contract_address = normalize_address(contract_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -96,6 +381,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/token-transfers?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_token_transfers(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_token_transfers, account_address, size=size, **filters
+        )
+
     def get_account_event_logs(
         self,
         account_address: str,
@@ -107,6 +399,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -123,11 +416,27 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/event-logs?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_event_logs(
+        self,
+        account_address: str,
+        size: int = MAX_PAGE_SIZE,
+        max_workers: int = 1,
+        **filters: Any,
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_event_logs,
+            account_address,
+            size=size,
+            max_workers=max_workers,
+            **filters,
+        )
+
     def get_account_kip17_nft_balances(
         self, account_address: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -137,11 +446,19 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/nft-balances/kip17?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_kip17_nft_balances(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_kip17_nft_balances, account_address, size=size, **filters
+        )
+
     def get_account_kip37_nft_balances(
         self, account_address: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -151,6 +468,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/nft-balances/kip37?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_kip37_nft_balances(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_kip37_nft_balances, account_address, size=size, **filters
+        )
+
     def get_account_nft_transfers(
         self,
         account_address: str,
@@ -162,6 +486,9 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
+        if contract_address:
+            contract_address = normalize_address(contract_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -178,11 +505,19 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/nft-transfers?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_nft_transfers(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_nft_transfers, account_address, size=size, **filters
+        )
+
     def get_account_token_balances(
         self, account_address: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -192,11 +527,19 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/token-balances?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_token_balances(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_token_balances, account_address, size=size, **filters
+        )
+
     def get_account_token_details(
         self, account_address: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -206,6 +549,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/token-details?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_token_details(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_token_details, account_address, size=size, **filters
+        )
+
     def get_account_transactions(
         self,
         account_address: str,
@@ -218,6 +568,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -236,6 +587,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/transactions?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_account_transactions(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_account_transactions, account_address, size=size, **filters
+        )
+
     def get_fee_paid_transactions(
         self,
         account_address: str,
@@ -247,6 +605,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not account_address:
             raise ValueError("Account address is required")
+        account_address = normalize_address(account_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -263,14 +622,29 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/accounts/{account_address}/fee-paid-transactions?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_fee_paid_transactions(
+        self, account_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_fee_paid_transactions, account_address, size=size, **filters
+        )
+
     def get_kaia_info(self) -> ApiResponse[Any]:
         url_str = f"{self.base_url}api/v1/kaia"
         return self._fetch_api(url_str)
 
     def get_fungible_token(self, token_address: Address) -> ApiResponse[TokenInfo]:
+        token_address = normalize_address(token_address)
         url_str = f"{self.base_url}{ENDPOINTS['tokens_endpoint']}?tokenAddress={urllib.parse.quote(token_address)}"
         return self._fetch_api(url_str)
 
+    def get_fungible_tokens_bulk(
+        self, token_addresses: Iterable[str], max_workers: int = 8
+    ) -> Dict[Address, Any]:
+        return self._bulk(
+            self.get_fungible_token, normalize_addresses(token_addresses), max_workers
+        )
+
     def get_token_holders(
         self,
         token_address: str,
@@ -278,6 +652,9 @@ class KaiascanSDK:
         size: int = 20,
         holder_address: Optional[str] = None,
     ) -> ApiResponse[Any]:
+        token_address = normalize_address(token_address)
+        if holder_address:
+            holder_address = normalize_address(holder_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -290,6 +667,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/tokens/{token_address}/holders?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_token_holders(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_token_holders, token_address, size=size, **filters
+        )
+
     def get_token_burns(
         self,
         token_address: str,
@@ -300,6 +684,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not token_address:
             raise ValueError("Token address is required")
+        token_address = normalize_address(token_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -314,6 +699,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/tokens/{token_address}/burns?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_token_burns(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_token_burns, token_address, size=size, **filters
+        )
+
     def get_token_transfers(
         self,
         token_address: str,
@@ -324,6 +716,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not token_address:
             raise ValueError("Token address is required")
+        token_address = normalize_address(token_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -338,13 +731,30 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/tokens/{token_address}/transfers?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_token_transfers(
+        self,
+        token_address: str,
+        size: int = MAX_PAGE_SIZE,
+        max_workers: int = 1,
+        **filters: Any,
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_token_transfers,
+            token_address,
+            size=size,
+            max_workers=max_workers,
+            **filters,
+        )
+
     def get_nft_item(self, nft_address: Address, token_id: str) -> ApiResponse[Any]:
+        nft_address = normalize_address(nft_address)
         url_str = f"{self.base_url}{ENDPOINTS['nfts_endpoint']}?nftAddress={urllib.parse.quote(nft_address)}&tokenId={urllib.parse.quote(token_id)}"
         return self._fetch_api(url_str)
 
     def get_nft(self, token_address: str) -> ApiResponse[Any]:
         if not token_address:
             raise ValueError("Token address is required")
+        token_address = normalize_address(token_address)
 
         url_str = f"{self.base_url}api/v1/nfts/{token_address}"
         return self._fetch_api(url_str)
@@ -360,6 +770,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not token_address:
             raise ValueError("Token address is required")
+        token_address = normalize_address(token_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -376,6 +787,21 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/nfts/{token_address}/transfers?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_nft_transfers(
+        self,
+        token_address: str,
+        size: int = MAX_PAGE_SIZE,
+        max_workers: int = 1,
+        **filters: Any,
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_nft_transfers,
+            token_address,
+            size=size,
+            max_workers=max_workers,
+            **filters,
+        )
+
     def get_nft_holders(
         self,
         token_address: str,
@@ -385,6 +811,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not token_address:
             raise ValueError("Token address is required")
+        token_address = normalize_address(token_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -397,6 +824,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/nfts/{token_address}/holders?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_nft_holders(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_nft_holders, token_address, size=size, **filters
+        )
+
     def get_nft_inventories(
         self,
         token_address: str,
@@ -406,6 +840,7 @@ class KaiascanSDK:
     ) -> ApiResponse[Any]:
         if not token_address:
             raise ValueError("Token address is required")
+        token_address = normalize_address(token_address)
         if page < 1:
             raise ValueError("Page must be >= 1")
         if not 1 <= size <= 2000:
@@ -418,17 +853,27 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/nfts/{token_address}/inventories?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_nft_inventories(
+        self, token_address: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_nft_inventories, token_address, size=size, **filters
+        )
+
     def get_contract_creation_code(self, contract_address: Address) -> ApiResponse[Any]:
+        contract_address = normalize_address(contract_address)
         url_str = f"{self.base_url}{ENDPOINTS['contract_endpoint']}/creation-code?contractAddress={urllib.parse.quote(contract_address)}"
         return self._fetch_api(url_str)
 
     def get_contract_source_code(self, contract_address: Address) -> ApiResponse[Any]:
+        contract_address = normalize_address(contract_address)
         url_str = f"{self.base_url}{ENDPOINTS['contract_endpoint']}/source-code?contractAddress={urllib.parse.quote(contract_address)}"
         return self._fetch_api(url_str)
 
     def get_contract_info(self, contract_address: str) -> ApiResponse[Any]:
         if not contract_address:
             raise ValueError("Contract address is required")
+        contract_address = normalize_address(contract_address)
 
         url_str = f"{self.base_url}api/v1/contracts/{contract_address}"
         return self._fetch_api(url_str)
@@ -436,14 +881,33 @@ class KaiascanSDK:
     def get_contracts_info(self, contract_addresses: List[str]) -> ApiResponse[Any]:
         if not contract_addresses or len(contract_addresses) == 0:
             raise ValueError("Contract address list is required")
+        addresses = normalize_addresses(contract_addresses)
 
-        query_params = f"contractAddresses={','.join(contract_addresses)}"
+        query_params = f"contractAddresses={','.join(addresses)}"
         url_str = f"{self.base_url}api/v1/contracts?{query_params}"
         return self._fetch_api(url_str)
 
+    def get_contracts_info_bulk(
+        self,
+        contract_addresses: Iterable[str],
+        chunk_size: int = 50,
+        max_workers: int = 8,
+    ) -> Dict[Address, Any]:
+        addresses = list(dict.fromkeys(normalize_addresses(contract_addresses)))
+        if not addresses:
+            raise ValueError("Contract address list is required")
+
+        chunks = self._bulk(
+            lambda chunk: self.get_contracts_info(list(chunk)),
+            chunked(addresses, chunk_size),
+            max_workers,
+        )
+        return contracts_by_address(addresses, chunks.values())
+
     def get_contract_abi(self, contract_address: str) -> ApiResponse[Any]:
         if not contract_address:
             raise ValueError("Contract address is required")
+        contract_address = normalize_address(contract_address)
 
         url_str = f"{self.base_url}api/v1/contracts/{contract_address}/abi"
         return self._fetch_api(url_str)
@@ -462,6 +926,11 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/blocks/latest/burns?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_latest_block_burns(
+        self, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(self.get_latest_block_burns, size=size, **filters)
+
     def get_latest_block_rewards(self, block_number: int) -> ApiResponse[Any]:
         url_str = (
             f"{self.base_url}api/v1/blocks/latest/rewards?blockNumber={block_number}"
@@ -474,6 +943,11 @@ class KaiascanSDK:
         )
         return self._fetch_api(url_str)
 
+    def get_blocks_bulk(
+        self, block_numbers: Iterable[int], max_workers: int = 8
+    ) -> Dict[int, Any]:
+        return self._bulk(self.get_block, block_numbers, max_workers)
+
     def get_blocks(
         self,
         block_number: int,
@@ -499,6 +973,11 @@ class KaiascanSDK:
         )
         return self._fetch_api(url_str)
 
+    def iter_blocks(
+        self, block_number: int, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(self.get_blocks, block_number, size=size, **filters)
+
     def get_transactions_of_block(
         self,
         block_number: int,
@@ -521,6 +1000,13 @@ class KaiascanSDK:
         )
         return self._fetch_api(url_str)
 
+    def iter_transactions_of_block(
+        self, block_number: int, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_transactions_of_block, block_number, size=size, **filters
+        )
+
     def get_block_burns(self, block_number: int) -> ApiResponse[Any]:
         url_str = f"{self.base_url}api/v1/blocks/{block_number}/burns"
         return self._fetch_api(url_str)
@@ -541,6 +1027,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/blocks/{block_number}/internal-transactions?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_internal_transactions_of_block(
+        self, block_number: int, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_internal_transactions_of_block, block_number, size=size, **filters
+        )
+
     def get_blocks_by_timestamp(self, timestamp: int) -> ApiResponse[Any]:
         if timestamp <= 0:
             raise ValueError("Timestamp must be a positive integer")
@@ -552,6 +1045,11 @@ class KaiascanSDK:
         url_str = f"{self.base_url}{ENDPOINTS['transaction_endpoint']}/{urllib.parse.quote(transaction_hash)}"
         return self._fetch_api(url_str)
 
+    def get_transactions_bulk(
+        self, transaction_hashes: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Any]:
+        return self._bulk(self.get_transaction, transaction_hashes, max_workers)
+
     def get_transaction_receipt_status(self, transaction_hash: str) -> ApiResponse[Any]:
         url_str = f"{self.base_url}{ENDPOINTS['transaction_receipts_endpoint']}/status?transactionHash={urllib.parse.quote(transaction_hash)}"
         return self._fetch_api(url_str)
@@ -588,6 +1086,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/transactions/{transaction_hash}/event-logs?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_transaction_event_logs(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_event_logs, transaction_hash, size=size, **filters
+        )
+
     def get_transaction_internal_transactions(
         self, transaction_hash: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
@@ -602,6 +1107,16 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/transactions/{transaction_hash}/internal-transactions?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_transaction_internal_transactions(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_internal_transactions,
+            transaction_hash,
+            size=size,
+            **filters,
+        )
+
     def get_transaction_token_transfers(
         self, transaction_hash: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
@@ -616,6 +1131,13 @@ class KaiascanSDK:
         url_str = f"{self.base_url}api/v1/transactions/{transaction_hash}/token-transfers?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
 
+    def iter_transaction_token_transfers(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_token_transfers, transaction_hash, size=size, **filters
+        )
+
     def get_transaction_nft_transfers(
         self, transaction_hash: str, page: int = 1, size: int = 20
     ) -> ApiResponse[Any]:
@@ -629,3 +1151,10 @@ class KaiascanSDK:
         query_params = [f"page={page}", f"size={size}"]
         url_str = f"{self.base_url}api/v1/transactions/{transaction_hash}/nft-transfers?{'&'.join(query_params)}"
         return self._fetch_api(url_str)
+
+    def iter_transaction_nft_transfers(
+        self, transaction_hash: str, size: int = MAX_PAGE_SIZE, **filters: Any
+    ) -> Iterator[Any]:
+        return self._iter_pages(
+            self.get_transaction_nft_transfers, transaction_hash, size=size, **filters
+        )
@@ -0,0 +1,286 @@
+"""
+This module provides a local SQLite index of event logs.
+
+`EventLogStore` ingests the event logs returned by `get_account_event_logs`
+and `get_transaction_event_logs` (or their ``iter_*`` forms) and indexes them
+by contract address, signature, block number and transaction hash. Filtering
+by those keys is then a local index lookup instead of a paginated API walk.
+
+Each log is stored once per chain, keyed by transaction hash and log index, so
+ingesting overlapping pages or re-running an ingest is harmless. A log without
+a log index is numbered by its position among its transaction's logs, which is
+only known when the complete log list of one transaction is ingested; other
+such logs are rejected. Addresses and hashes are stored lowercase. Queries
+return dicts with the API's keys, so results can be passed to
+`EventLog.from_dict` or `AbiDecoder.decode_log`.
+
+Usage:
+    store = EventLogStore("~/.kaiascan-logs.db", sdk.chain_id)
+    store.ingest_account(sdk, wallet, block_number_start=150_000_000)
+    swaps = store.query(signature=SWAP, block_start=150_000_000)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .concurrency import chunked
+from .interfaces.models import EventLog, Model
+from .kaiascan import KaiascanSDK
+from .pagination import MAX_PAGE_SIZE
+
+# Rows written per transaction during ingest.
+INGEST_BATCH_SIZE = 5_000
+
+_COLUMNS = (
+    "transaction_hash",
+    "log_index",
+    "block_number",
+    "contract_address",
+    "signature",
+    "datetime",
+    "topics",
+    "data",
+)
+
+
+def _lower(value: Any) -> Optional[str]:
+    return None if value is None else str(value).lower()
+
+
+class EventLogStore:
+    """
+    A thread-safe SQLite index of event logs for one chain.
+
+    Args:
+        path (str): The database file. ``~`` is expanded and the file is
+            created on first use.
+        chain_id (str): The chain the logs belong to, e.g. ``sdk.chain_id``.
+    """
+
+    def __init__(self, path: str, chain_id: str):
+        self.path = os.path.expanduser(path)
+        self.chain_id = chain_id
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS event_logs ("
+            " chain_id TEXT NOT NULL,"
+            " transaction_hash TEXT NOT NULL,"
+            " log_index INTEGER NOT NULL,"
+            " block_number INTEGER,"
+            " contract_address TEXT,"
+            " signature TEXT,"
+            " datetime TEXT,"
+            " topics TEXT,"
+            " data TEXT,"
+            " PRIMARY KEY (chain_id, transaction_hash, log_index)"
+            ") WITHOUT ROWID"
+        )
+        for name, columns in (
+            ("contract", "contract_address, signature, block_number"),
+            ("signature", "signature, block_number"),
+            ("block", "block_number"),
+        ):
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS event_logs_by_{name}"
+                f" ON event_logs (chain_id, {columns})"
+            )
+
+    def _row(
+        self, log: Any, transaction_hash: Optional[str], ordinals: Dict[str, int]
+    ) -> Tuple[Any, ...]:
+        if isinstance(log, Model):
+            log = dict(zip(log.KEYS, log._values))
+        tx_hash = _lower(log.get("transaction_hash") or transaction_hash)
+        if tx_hash is None:
+            raise ValueError("Event log has no transaction hash")
+        log_index = log.get("log_index")
+        if log_index is None:
+            if transaction_hash is None:
+                raise ValueError(f"Event log of {tx_hash} has no log index")
+            # A transaction's full log list is in log order, so the position of
+            # a log in it is its index.
+            log_index = ordinals.get(tx_hash, 0)
+        ordinals[tx_hash] = int(log_index) + 1
+        block = EventLog.from_dict(log).block_number
+        topics = log.get("topics")
+        return (
+            self.chain_id,
+            tx_hash,
+            int(log_index),
+            block,
+            _lower(log.get("contract_address")),
+            log.get("signature"),
+            log.get("datetime"),
+            None if topics is None else json.dumps(list(topics)),
+            log.get("data"),
+        )
+
+    def ingest(
+        self, logs: Iterable[Any], transaction_hash: Optional[str] = None
+    ) -> int:
+        """
+        Stores event logs, replacing any already stored under the same key.
+
+        Args:
+            logs (Iterable[Any]): Log dicts or `EventLog` models; consumed
+                lazily and written in batches.
+            transaction_hash (Optional[str]): The transaction whose complete,
+                ordered log list ``logs`` is. It is used for logs that do not
+                carry their own transaction hash, and logs without a log index
+                are numbered by their position. Without it, such logs raise
+                `ValueError`.
+
+        Returns:
+            int: The number of logs written.
+        """
+        ordinals: Dict[str, int] = {}
+        placeholders = ", ".join("?" * (len(_COLUMNS) + 1))
+        statement = (
+            f"INSERT OR REPLACE INTO event_logs (chain_id, {', '.join(_COLUMNS)})"
+            f" VALUES ({placeholders})"
+        )
+        written = 0
+        for batch in chunked(logs, INGEST_BATCH_SIZE):
+            rows = [self._row(log, transaction_hash, ordinals) for log in batch]
+            with self._lock, self._connection:
+                self._connection.execute("BEGIN")
+                self._connection.executemany(statement, rows)
+            written += len(rows)
+        return written
+
+    def ingest_account(
+        self, sdk: KaiascanSDK, account_address: str, **filters: Any
+    ) -> int:
+        """Fetches and stores every event log of an account matching ``filters``."""
+        return self.ingest(sdk.iter_account_event_logs(account_address, **filters))
+
+    def ingest_transaction(
+        self,
+        sdk: KaiascanSDK,
+        transaction_hash: str,
+        size: int = MAX_PAGE_SIZE,
+        **filters: Any,
+    ) -> int:
+        """
+        Fetches and stores the event logs of a transaction matching ``filters``.
+
+        Without filters the complete log list is fetched, so logs lacking a
+        transaction hash or log index are keyed by ``transaction_hash`` and
+        their position. A filtered list is incomplete, so such logs raise
+        `ValueError` instead of being stored under another log's key.
+        """
+        logs = sdk.iter_transaction_event_logs(transaction_hash, size=size, **filters)
+        return self.ingest(logs, None if filters else transaction_hash)
+
+    def _where(
+        self,
+        contract_address: Optional[str],
+        signature: Optional[str],
+        block_start: Optional[int],
+        block_end: Optional[int],
+        transaction_hash: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses = ["chain_id = ?"]
+        params: List[Any] = [self.chain_id]
+        for clause, value in (
+            ("contract_address = ?", _lower(contract_address)),
+            ("signature = ?", signature),
+            ("block_number >= ?", block_start),
+            ("block_number <= ?", block_end),
+            ("transaction_hash = ?", _lower(transaction_hash)),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def query(
+        self,
+        contract_address: Optional[str] = None,
+        signature: Optional[str] = None,
+        block_start: Optional[int] = None,
+        block_end: Optional[int] = None,
+        transaction_hash: Optional[str] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns stored logs matching every given filter.
+
+        Args:
+            contract_address (Optional[str]): The emitting contract.
+            signature (Optional[str]): The event signature.
+            block_start (Optional[int]): The first block, inclusive.
+            block_end (Optional[int]): The last block, inclusive.
+            transaction_hash (Optional[str]): The transaction.
+            limit (Optional[int]): The maximum number of logs returned.
+            descending (bool): Newest first instead of oldest first.
+
+        Returns:
+            List[Dict[str, Any]]: Logs in block and log index order, with the
+            API's keys (``block_id`` for the block number).
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be >= 1")
+
+        where, params = self._where(
+            contract_address, signature, block_start, block_end, transaction_hash
+        )
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT {', '.join(_COLUMNS)} FROM event_logs WHERE {where}"
+            f" ORDER BY block_number {direction}, log_index {direction}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        logs = []
+        for tx_hash, log_index, block, contract, sig, moment, topics, data in rows:
+            logs.append(
+                {
+                    "transaction_hash": tx_hash,
+                    "log_index": log_index,
+                    "block_id": block,
+                    "contract_address": contract,
+                    "signature": sig,
+                    "datetime": moment,
+                    "topics": None if topics is None else json.loads(topics),
+                    "data": data,
+                }
+            )
+        return logs
+
+    def count(
+        self,
+        contract_address: Optional[str] = None,
+        signature: Optional[str] = None,
+        block_start: Optional[int] = None,
+        block_end: Optional[int] = None,
+        transaction_hash: Optional[str] = None,
+    ) -> int:
+        """Returns the number of stored logs matching every given filter."""
+        where, params = self._where(
+            contract_address, signature, block_start, block_end, transaction_hash
+        )
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT COUNT(*) FROM event_logs WHERE {where}", params
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        return self.count()
@@ -0,0 +1,155 @@
+"""
+This module provides a resumable crawler over every item of an NFT collection.
+
+`NftCrawler` lists the token IDs of a KIP-17 or KIP-37 collection page by page
+through `get_nft_inventories`, and fetches each item's metadata with
+`get_nft_item` on a pool of worker threads while listing continues. Token IDs
+seen twice (pages shift while a collection is minting) are fetched once.
+
+Each item is handed to a callback on the calling thread. Once the callback
+returns, the token ID is appended to a progress file, so recording an item
+costs one short write however large the collection is. Running the same crawl
+again skips every token ID already recorded.
+
+Usage:
+    crawler = NftCrawler(sdk, collection, progress_path="crawl.progress")
+    crawler.run(lambda item: store(item.token_id, item.metadata))
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from .concurrency import bounded_map_unordered
+from .interfaces.models import Model
+from .kaiascan import KaiascanSDK
+from .pagination import MAX_PAGE_SIZE
+from .types.address import normalize_address
+
+
+@dataclass
+class CrawledNft:
+    """
+    A data class holding one crawled collection item.
+
+    Attributes:
+        token_id (str): The token ID.
+        inventory (Dict[str, Any]): The item as listed by `get_nft_inventories`.
+        metadata (Any): The item as returned by `get_nft_item`.
+    """
+
+    token_id: str
+    inventory: Dict[str, Any]
+    metadata: Any
+
+
+class NftCrawler:
+    """
+    Crawls every item of an NFT collection, with a progress file.
+
+    Args:
+        sdk (KaiascanSDK): The client used for all requests.
+        token_address (str): The NFT collection.
+        max_workers (int): Items fetched concurrently.
+        progress_path (Optional[str]): A file recording crawled token IDs.
+            Without one, progress is kept in memory only.
+        page_size (int): Inventory items listed per request.
+    """
+
+    def __init__(
+        self,
+        sdk: KaiascanSDK,
+        token_address: str,
+        max_workers: int = 8,
+        progress_path: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.sdk = sdk
+        self.token_address = normalize_address(token_address)
+        self.max_workers = max_workers
+        self.progress_path = progress_path
+        self.page_size = page_size
+        self.completed: Set[str] = self._load_progress()
+
+    def pending_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Lists the collection lazily, skipping crawled and duplicate token IDs.
+
+        Returns:
+            Iterator[Tuple[str, Dict[str, Any]]]: Each new token ID with its
+            inventory entry, in listing order.
+        """
+        seen = set(self.completed)
+        for item in self.sdk.iter_nft_inventories(
+            self.token_address, size=self.page_size
+        ):
+            if isinstance(item, Model):
+                item = dict(zip(item.KEYS, item._values))
+            token_id = str(item["token_id"])
+            if token_id not in seen:
+                seen.add(token_id)
+                yield token_id, item
+
+    def fetch_item(self, entry: Tuple[str, Dict[str, Any]]) -> CrawledNft:
+        """Fetches the metadata of one listed item."""
+        token_id, inventory = entry
+        metadata = self.sdk.get_nft_item(self.token_address, token_id).data
+        return CrawledNft(token_id, inventory, metadata)
+
+    def run(self, handler: Callable[[CrawledNft], None]) -> int:
+        """
+        Crawls every pending item, calling ``handler`` for each one.
+
+        Items complete in whatever order the workers finish them. ``handler``
+        runs on the calling thread and an item is recorded only after it
+        returns, so a failure in either fetching or handling leaves that item
+        and every unfinished one to be crawled on the next run.
+
+        Returns:
+            int: The number of items crawled by this run.
+        """
+        crawled = 0
+        progress = self._open_progress()
+        try:
+            for _, item in bounded_map_unordered(
+                self.fetch_item, self.pending_items(), self.max_workers
+            ):
+                handler(item)
+                self.completed.add(item.token_id)
+                if progress is not None:
+                    progress.write(item.token_id + "\n")
+                    progress.flush()
+                crawled += 1
+        finally:
+            if progress is not None:
+                progress.close()
+        return crawled
+
+    def _load_progress(self) -> Set[str]:
+        if not self.progress_path or not os.path.exists(self.progress_path):
+            return set()
+
+        with open(self.progress_path) as progress:
+            header = progress.readline().strip()
+            if header != f"# {self.token_address}":
+                raise ValueError(
+                    f"Progress file {self.progress_path} belongs to a different crawl"
+                )
+            # A crash can leave a partial last line; it has no newline yet.
+            return {line[:-1] for line in progress if line.endswith("\n")}
+
+    def _open_progress(self) -> Optional[Any]:
+        if not self.progress_path:
+            return None
+
+        if not os.path.exists(self.progress_path):
+            with open(self.progress_path, "w") as progress:
+                progress.write(f"# {self.token_address}\n")
+        else:
+            # Drop a partial last line so the next ID starts on a fresh one.
+            with open(self.progress_path, "rb+") as progress:
+                progress.truncate(progress.read().rfind(b"\n") + 1)
+        return open(self.progress_path, "a")
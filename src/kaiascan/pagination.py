@@ -0,0 +1,85 @@
+"""
+This module provides helpers for reading paginated Kaiascan API payloads.
+
+List endpoints return their items under ``results`` together with a ``paging``
+object describing the current page and, when the server knows it, the total
+number of pages or items. These helpers hide the small differences between
+endpoints so that auto-paginating iterators can decide when to stop.
+"""
+
+from typing import Any, Dict, List, Optional
+
+MAX_PAGE_SIZE = 2000
+
+
+def _paging(data: Any) -> Dict[str, Any]:
+    paging = data.get("paging") if isinstance(data, dict) else None
+    return paging if isinstance(paging, dict) else {}
+
+
+def _paging_value(data: Any, *keys: str) -> Any:
+    paging = _paging(data)
+    for key in keys:
+        if paging.get(key) is not None:
+            return paging[key]
+    return None
+
+
+def page_results(data: Any) -> List[Any]:
+    """
+    Returns the items of a single page.
+
+    Args:
+        data (Any): The ``data`` field of an `ApiResponse` from a list endpoint.
+
+    Returns:
+        List[Any]: The items on the page, or an empty list if there are none.
+    """
+    if isinstance(data, list):
+        return data
+    results = data.get("results") if isinstance(data, dict) else None
+    return results if isinstance(results, list) else []
+
+
+def total_pages(data: Any, size: int) -> Optional[int]:
+    """
+    Returns the number of pages reported by the server, if it reports one.
+
+    Args:
+        data (Any): The ``data`` field of the first page.
+        size (int): The page size the request was made with.
+
+    Returns:
+        Optional[int]: The total page count, or `None` when it is unknown.
+    """
+    pages = _paging_value(data, "total_page", "totalPage")
+    if pages is not None:
+        return int(pages)
+    count = _paging_value(data, "total_count", "totalCount")
+    if count is not None:
+        return -(-int(count) // size)
+    return None
+
+
+def is_last_page(data: Any, page: int, size: int) -> bool:
+    """
+    Decides whether ``page`` is the final page of a listing.
+
+    The explicit ``last`` flag wins; otherwise the total page count is used,
+    and as a last resort a short page is taken to mean there is nothing more.
+
+    Args:
+        data (Any): The ``data`` field of the page.
+        page (int): The 1-based page number that was requested.
+        size (int): The page size the request was made with.
+
+    Returns:
+        bool: `True` if no further pages should be requested.
+    """
+    last = _paging_value(data, "last")
+    if last is not None:
+        return bool(last)
+    pages = total_pages(data, size)
+    if pages is not None:
+        return page >= pages
+    return len(page_results(data)) < size
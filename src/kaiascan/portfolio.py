@@ -0,0 +1,251 @@
+"""
+This module builds merged token and NFT portfolios for many wallets.
+
+`PortfolioAggregator.build` fetches the fungible token, KIP-17 and KIP-37
+balances of every wallet concurrently, one task per wallet and balance kind
+on a shared worker pool. Raw token balances are scaled by the token's
+decimals from `get_fungible_token`, looked up as soon as a wallet's token
+list arrives.
+
+Token metadata is held in a `TokenMetadataCache`. Each token is looked up at
+most once for the lifetime of the cache, however many wallets hold it and
+however many portfolios are built, and concurrent lookups of the same token
+share one request.
+
+Usage:
+    aggregator = PortfolioAggregator(sdk, max_workers=16)
+    portfolio = aggregator.build(wallets)
+    print(portfolio.totals, portfolio.wallets[wallet].tokens)
+"""
+
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .concurrency import bounded_map_unordered
+from .interfaces.models import Model, to_decimal
+from .interfaces.token_info import TokenInfo
+from .kaiascan import KaiascanSDK
+from .single_flight import SingleFlight
+from .types.address import Address, normalize_address, normalize_addresses
+
+# Balance kinds fetched per wallet, and the SDK method listing each.
+BALANCE_KINDS = {
+    "tokens": "iter_account_token_balances",
+    "kip17": "iter_account_kip17_nft_balances",
+    "kip37": "iter_account_kip37_nft_balances",
+}
+
+
+def _as_dict(item: Any) -> Dict[str, Any]:
+    if isinstance(item, Model):
+        return dict(zip(item.KEYS, item._values))
+    return dict(item)
+
+
+def _contract_address(item: Dict[str, Any]) -> str:
+    # Balance items either carry the contract inline or nest it.
+    contract = item.get("contract")
+    if isinstance(contract, dict):
+        return normalize_address(contract["contract_address"])
+    return normalize_address(item["contract_address"])
+
+
+def _scale(raw: Any, decimals: Optional[int]) -> Decimal:
+    amount = to_decimal(raw)
+    if not decimals or not str(raw).isdigit():
+        # Already in whole tokens, or the token has no decimals.
+        return amount
+    # Shift the exponent directly; `Decimal.scaleb` rounds to 28 digits.
+    sign, digits, exponent = amount.as_tuple()
+    return Decimal((sign, digits, int(exponent) - int(decimals)))
+
+
+class TokenMetadataCache:
+    """
+    A thread-safe, load-once cache of fungible token metadata.
+
+    Args:
+        sdk (KaiascanSDK): The client used for `get_fungible_token`.
+    """
+
+    def __init__(self, sdk: KaiascanSDK):
+        self.sdk = sdk
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, TokenInfo] = {}
+        self._single_flight: SingleFlight[TokenInfo] = SingleFlight()
+
+    def get(self, token_address: str) -> TokenInfo:
+        """Returns the metadata of a token, fetching it on first use."""
+        address = normalize_address(token_address)
+        with self._lock:
+            info = self._tokens.get(address)
+        if info is not None:
+            return info
+        return self._single_flight.do(address, lambda: self._load(address))
+
+    def _load(self, token_address: Address) -> TokenInfo:
+        with self._lock:
+            # Another leader may have finished between the miss and this call.
+            info = self._tokens.get(token_address)
+        if info is None:
+            # Fields the API leaves out are stored as None.
+            data: Dict[str, Any] = dict.fromkeys(TokenInfo.__slots__)
+            data.update(_as_dict(self.sdk.get_fungible_token(token_address).data))
+            info = TokenInfo(
+                contract_type=data["contract_type"],
+                name=data["name"],
+                symbol=data["symbol"],
+                icon=data["icon"],
+                decimal=data["decimal"],
+                total_supply=data["total_supply"],
+                total_transfers=data["total_transfers"],
+                official_site=data["official_site"],
+                burn_amount=data["burn_amount"],
+                total_burns=data["total_burns"],
+            )
+            with self._lock:
+                self._tokens[token_address] = info
+        return info
+
+    def __contains__(self, token_address: str) -> bool:
+        return normalize_address(token_address) in self._tokens
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+@dataclass
+class TokenPosition:
+    """
+    A data class holding a wallet's balance of one fungible token.
+
+    Attributes:
+        token_address (str): The token contract.
+        symbol (Optional[str]): The token symbol.
+        decimals (Optional[int]): The token decimals used for ``balance``.
+        raw_balance (str): The balance as returned by the API.
+        balance (Decimal): The balance in whole tokens.
+    """
+
+    token_address: str
+    symbol: Optional[str]
+    decimals: Optional[int]
+    raw_balance: str
+    balance: Decimal
+
+
+@dataclass
+class WalletPortfolio:
+    """
+    A data class holding everything one wallet holds.
+
+    Attributes:
+        account (str): The wallet address.
+        tokens (List[TokenPosition]): Fungible token balances.
+        kip17 (List[Any]): KIP-17 NFT balance items, as returned by the API.
+        kip37 (List[Any]): KIP-37 NFT balance items, as returned by the API.
+    """
+
+    account: str
+    tokens: List[TokenPosition] = field(default_factory=list)
+    kip17: List[Any] = field(default_factory=list)
+    kip37: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class Portfolio:
+    """
+    A data class holding the merged holdings of many wallets.
+
+    Attributes:
+        wallets (Dict[str, WalletPortfolio]): Holdings by wallet, in input
+            order.
+        totals (Dict[str, Decimal]): Whole-token balances summed over all
+            wallets, by token contract.
+        tokens (Dict[str, TokenInfo]): Metadata of every token held.
+    """
+
+    wallets: Dict[str, WalletPortfolio] = field(default_factory=dict)
+    totals: Dict[str, Decimal] = field(default_factory=dict)
+    tokens: Dict[str, TokenInfo] = field(default_factory=dict)
+
+
+class PortfolioAggregator:
+    """
+    Builds portfolios for many wallets with shared, cached token metadata.
+
+    Args:
+        sdk (KaiascanSDK): The client used for all requests.
+        max_workers (int): Balance listings and metadata lookups in flight.
+        metadata (Optional[TokenMetadataCache]): A cache to share with other
+            aggregators; one is created if omitted.
+    """
+
+    def __init__(
+        self,
+        sdk: KaiascanSDK,
+        max_workers: int = 8,
+        metadata: Optional[TokenMetadataCache] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.sdk = sdk
+        self.max_workers = max_workers
+        self.metadata = metadata if metadata is not None else TokenMetadataCache(sdk)
+
+    def _balances(self, task: Tuple[str, str]) -> List[Dict[str, Any]]:
+        account, kind = task
+        listing = getattr(self.sdk, BALANCE_KINDS[kind])
+        items = [_as_dict(item) for item in listing(account)]
+        if kind == "tokens":
+            # Resolve metadata while other wallets are still being listed.
+            for token in dict.fromkeys(map(_contract_address, items)):
+                self.metadata.get(token)
+        return items
+
+    def build(self, accounts: Iterable[str]) -> Portfolio:
+        """
+        Fetches and merges the holdings of every wallet.
+
+        Args:
+            accounts (Iterable[str]): The wallets. Every address is validated
+                before any request is made, and duplicates are fetched once.
+
+        Returns:
+            Portfolio: Per-wallet holdings, totals and token metadata.
+        """
+        wallets = list(dict.fromkeys(normalize_addresses(accounts)))
+        portfolio = Portfolio(
+            {account: WalletPortfolio(account) for account in wallets}
+        )
+        tasks = [(account, kind) for account in wallets for kind in BALANCE_KINDS]
+
+        token_items: Dict[str, List[Dict[str, Any]]] = {}
+        for (account, kind), items in bounded_map_unordered(
+            self._balances, tasks, self.max_workers
+        ):
+            if kind == "tokens":
+                token_items[account] = items
+            else:
+                setattr(portfolio.wallets[account], kind, items)
+
+        for account in wallets:
+            for item in token_items.get(account, []):
+                token = _contract_address(item)
+                info = portfolio.tokens[token] = self.metadata.get(token)
+                raw = item.get("balance", "0")
+                position = TokenPosition(
+                    token,
+                    info.symbol,
+                    info.decimal,
+                    str(raw),
+                    _scale(raw, info.decimal),
+                )
+                portfolio.wallets[account].tokens.append(position)
+                portfolio.totals[token] = (
+                    portfolio.totals.get(token, Decimal(0)) + position.balance
+                )
+        return portfolio
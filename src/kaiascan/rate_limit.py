@@ -0,0 +1,174 @@
+"""
+This module provides client-side throttling and retry policies for the Kaiascan API.
+
+`RateLimiter` is a thread-safe token bucket. A single instance can be shared by
+any number of `KaiascanSDK` and `AsyncKaiascanSDK` clients (and therefore by all
+of their threads and coroutines); `RateLimiter.shared` hands out one instance
+per API key. When the server pushes back with HTTP 429 the limiter halves its
+rate and honours ``Retry-After`` for every caller, then creeps back up towards
+the configured ceiling as requests succeed again.
+
+`RetryPolicy` describes which failures are retried and how long to wait in
+between, using exponential backoff with full jitter.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, ClassVar, Dict, FrozenSet, Optional
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    A data class describing how failed requests are retried.
+
+    Attributes:
+        max_retries (int): Retries after the first attempt; 0 disables retrying.
+        backoff_base (float): The backoff ceiling in seconds for the first retry.
+        backoff_max (float): The largest backoff ceiling in seconds.
+        retry_statuses (FrozenSet[int]): HTTP statuses worth retrying.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Returns how long to sleep before retry number ``attempt`` (0-based).
+
+        A server-supplied ``Retry-After`` is a lower bound; otherwise the delay
+        is drawn uniformly between zero and the exponential ceiling.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        delay = random.uniform(0, ceiling)
+        return delay if retry_after is None else retry_after + delay / 4
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The raw header value.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or `None` if absent or
+        unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    A thread-safe, adaptive token bucket.
+
+    Args:
+        rate (float): The ceiling on requests per second.
+        burst (Optional[int]): The bucket capacity. Defaults to one second's
+            worth of requests.
+        min_rate (Optional[float]): The floor the rate is never reduced below.
+            Defaults to a tenth of ``rate``.
+        decrease_factor (float): Multiplier applied to the rate on pushback.
+        increase_step (Optional[float]): Requests per second regained after each
+            success. Defaults to 2% of ``rate``.
+    """
+
+    _shared: ClassVar[Dict[str, "RateLimiter"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        min_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else rate / 50
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls, api_key: Optional[str], rate: float, **options: Any
+    ) -> "RateLimiter":
+        """
+        Returns the limiter shared by every client using ``api_key``.
+
+        The first call for a key creates the limiter with the given settings;
+        later calls return the same instance unchanged.
+        """
+        with cls._shared_lock:
+            key = api_key or ""
+            if key not in cls._shared:
+                cls._shared[key] = cls(rate, **options)
+            return cls._shared[key]
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self) -> float:
+        """
+        Blocks until a request may be sent.
+
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return now - started
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Slows down after the server pushed back, pausing for ``retry_after``."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(
+                    self._blocked_until, time.monotonic() + retry_after
+                )
+
+    def reward(self) -> None:
+        """Speeds back up towards the ceiling after a successful request."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
@@ -0,0 +1,145 @@
+"""
+This module provides a local HTTP server that replays recorded API responses.
+
+`ReplayServer` stands in for the Kaiascan API in tests and benchmarks. Each
+recording pairs a regular expression, matched against the request path and
+query, with a response body. The server can add latency and inject throttling
+and server errors at a configurable rate, so the full request path of
+`KaiascanSDK` (pooling, retries, caching, decoding) runs without spending API
+quota.
+
+Usage:
+    recordings = {r"^/api/v1/kaia$": {"code": 0, "data": {}, "msg": "success"}}
+    with ReplayServer(recordings, latency=0.05) as server:
+        sdk = KaiascanSDK(is_testnet=True)
+        sdk.base_url = server.base_url
+        sdk.get_kaia_info()
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Type, Union
+
+Recording = Union[bytes, Dict[str, Any], Callable[[str], Any]]
+
+
+class ReplayServer:
+    """
+    A threaded HTTP server answering from recorded responses.
+
+    Args:
+        recordings (Dict[str, Recording]): Maps path regexes to a response.
+            A response is a JSON-serialisable envelope, pre-encoded bytes, or a
+            callable taking the request path and returning either.
+        latency (float): Seconds added to every response.
+        jitter (float): Up to this many extra seconds, drawn uniformly.
+        error_rate (float): Fraction of requests answered with an error.
+        throttle_share (float): Share of errors that are HTTP 429 with a
+            ``Retry-After`` header; the rest are HTTP 503.
+        retry_after (float): The ``Retry-After`` value sent with HTTP 429.
+        seed (Optional[int]): Seeds latency and error sampling.
+    """
+
+    def __init__(
+        self,
+        recordings: Dict[str, Recording],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_share: float = 0.5,
+        retry_after: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.routes: List[Tuple[Pattern[str], Recording]] = [
+            (re.compile(pattern), response) for pattern, response in recordings.items()
+        ]
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_share = throttle_share
+        self.retry_after = retry_after
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """The URL to assign to ``KaiascanSDK.base_url``."""
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/"
+
+    def _respond(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failing = self._random.random() < self.error_rate
+            throttled = self._random.random() < self.throttle_share
+        if delay:
+            time.sleep(delay)
+        if failing:
+            if throttled:
+                return 429, {"Retry-After": str(self.retry_after)}, b"{}"
+            return 503, {}, b"{}"
+
+        for pattern, recording in self.routes:
+            if pattern.search(path):
+                body = recording(path) if callable(recording) else recording
+                if not isinstance(body, bytes):
+                    body = json.dumps(body, separators=(",", ":")).encode()
+                return 200, {"Content-Type": "application/json"}, body
+        return 404, {}, b'{"code": 404, "data": null, "msg": "no recording"}'
+
+    def _handler(self) -> Type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                status, headers, body = server._respond(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
@@ -0,0 +1,195 @@
+"""
+This module provides a resumable, parallel scanner over a range of blocks.
+
+`BlockScanner` splits an inclusive block range into fixed-size windows and
+fetches each window (its blocks, plus every transaction and internal
+transaction of each block) on a pool of worker threads. Fetched windows are
+handed to a callback on the calling thread, and only once the callback returns
+is the window recorded in a JSON checkpoint file. If the process dies, running
+the same scan again skips every window already recorded and carries on.
+
+Progress is kept as a low-water mark, below which every window is complete,
+plus the sparse set of completed windows above it. Windows are started in
+block order, so that set holds at most about ``max_workers`` entries and each
+checkpoint write stays the same size however far the scan has got.
+
+Usage:
+    scanner = BlockScanner(sdk, 1_000_000, 2_000_000, checkpoint_path="scan.json")
+    scanner.run(lambda window: store(window.transactions))
+"""
+
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .kaiascan import KaiascanSDK
+
+
+@dataclass
+class BlockWindow:
+    """
+    A data class holding everything fetched for one window of blocks.
+
+    Attributes:
+        start (int): The first block number of the window.
+        end (int): The last block number of the window, inclusive.
+        blocks (List[Any]): The blocks returned by `get_blocks` for the range.
+        transactions (Dict[int, List[Any]]): Transactions keyed by block number.
+        internal_transactions (Dict[int, List[Any]]): Internal transactions
+            keyed by block number.
+    """
+
+    start: int
+    end: int
+    blocks: List[Any] = field(default_factory=list)
+    transactions: Dict[int, List[Any]] = field(default_factory=dict)
+    internal_transactions: Dict[int, List[Any]] = field(default_factory=dict)
+
+
+class BlockScanner:
+    """
+    Scans an inclusive block range window by window, with checkpoints.
+
+    Args:
+        sdk (KaiascanSDK): The client used for all requests.
+        start_block (int): The first block to scan.
+        end_block (int): The last block to scan, inclusive.
+        window_size (int): Blocks per window, the unit of work and of progress.
+        max_workers (int): Windows fetched concurrently.
+        checkpoint_path (Optional[str]): A JSON file recording completed
+            windows. Without one, progress is kept in memory only.
+        include_internal (bool): Also fetch internal transactions.
+    """
+
+    def __init__(
+        self,
+        sdk: KaiascanSDK,
+        start_block: int,
+        end_block: int,
+        window_size: int = 100,
+        max_workers: int = 4,
+        checkpoint_path: Optional[str] = None,
+        include_internal: bool = True,
+    ):
+        if start_block < 0 or end_block < start_block:
+            raise ValueError("Block range must satisfy 0 <= start_block <= end_block")
+        if window_size < 1:
+            raise ValueError("window_size must be >= 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.sdk = sdk
+        self.start_block = start_block
+        self.end_block = end_block
+        self.window_size = window_size
+        self.max_workers = max_workers
+        self.checkpoint_path = checkpoint_path
+        self.include_internal = include_internal
+        # Every window starting below `low_water_mark` is complete; `completed`
+        # holds the starts of the complete windows at or above it.
+        self.low_water_mark = start_block
+        self.completed: Set[int] = set()
+        self._load_checkpoint()
+
+    def windows(self) -> List[Tuple[int, int]]:
+        """Returns every ``(start, end)`` window of the range, in block order."""
+        return [
+            (start, min(start + self.window_size - 1, self.end_block))
+            for start in range(self.start_block, self.end_block + 1, self.window_size)
+        ]
+
+    def pending_windows(self) -> List[Tuple[int, int]]:
+        """Returns the windows not yet recorded as completed."""
+        return [window for window in self.windows() if not self.is_completed(window[0])]
+
+    def is_completed(self, start: int) -> bool:
+        """Returns whether the window starting at ``start`` is recorded as done."""
+        return start < self.low_water_mark or start in self.completed
+
+    def _mark_completed(self, start: int) -> None:
+        self.completed.add(start)
+        while self.low_water_mark in self.completed:
+            self.completed.remove(self.low_water_mark)
+            self.low_water_mark += self.window_size
+
+    def fetch_window(self, start: int, end: int) -> BlockWindow:
+        """Fetches the blocks and transactions of one window."""
+        window = BlockWindow(start, end)
+        window.blocks = list(
+            self.sdk.iter_blocks(start, block_number_start=start, block_number_end=end)
+        )
+        for number in range(start, end + 1):
+            window.transactions[number] = list(
+                self.sdk.iter_transactions_of_block(number)
+            )
+            if self.include_internal:
+                window.internal_transactions[number] = list(
+                    self.sdk.iter_internal_transactions_of_block(number)
+                )
+        return window
+
+    def run(self, handler: Callable[[BlockWindow], None]) -> None:
+        """
+        Scans every pending window, calling ``handler`` for each one.
+
+        Windows complete in whatever order the workers finish them. ``handler``
+        runs on the calling thread and a window is checkpointed only after it
+        returns, so a failure in either fetching or handling leaves that window
+        to be retried on the next run.
+        """
+        pending = iter(self.pending_windows())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: Set["Future[BlockWindow]"] = set()
+            try:
+                while True:
+                    while len(running) < self.max_workers:
+                        window = next(pending, None)
+                        if window is None:
+                            break
+                        running.add(executor.submit(self.fetch_window, *window))
+                    if not running:
+                        return
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        handler(result)
+                        self._mark_completed(result.start)
+                        self._save_checkpoint()
+            finally:
+                for future in running:
+                    future.cancel()
+
+    def _load_checkpoint(self) -> None:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+
+        with open(self.checkpoint_path) as checkpoint:
+            state = json.load(checkpoint)
+        expected = [self.start_block, self.end_block, self.window_size]
+        if [state["start_block"], state["end_block"], state["window_size"]] != expected:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to a different scan"
+            )
+        self.low_water_mark = state.get("low_water_mark", self.start_block)
+        for start in state["completed"]:
+            self._mark_completed(start)
+
+    def _save_checkpoint(self) -> None:
+        if not self.checkpoint_path:
+            return
+
+        state = {
+            "start_block": self.start_block,
+            "end_block": self.end_block,
+            "window_size": self.window_size,
+            "low_water_mark": self.low_water_mark,
+            "completed": sorted(self.completed),
+        }
+        temporary = f"{self.checkpoint_path}.tmp"
+        with open(temporary, "w") as checkpoint:
+            json.dump(state, checkpoint)
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        os.replace(temporary, self.checkpoint_path)
@@ -0,0 +1,58 @@
+"""
+This module provides request coalescing for concurrent identical lookups.
+
+When several threads ask for the same URL while a request for it is already
+in flight, `SingleFlight` lets only the first caller (the leader) perform the
+request. Everyone else waits for the leader and receives the same result, or
+the same exception. Once the request completes the key is forgotten, so later
+calls go out again (or hit the response cache).
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Generic, TypeVar
+
+R = TypeVar("R")
+
+
+class SingleFlight(Generic[R]):
+    """Coalesces concurrent calls that share a key into a single execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "Future[R]"] = {}
+
+    def do(self, key: str, fn: Callable[[], R]) -> R:
+        """
+        Runs ``fn`` unless a call for ``key`` is already running, then shares its outcome.
+
+        Args:
+            key (str): Identifies calls that are interchangeable, e.g. a URL.
+            fn (Callable[[], R]): The call to perform if this caller leads.
+
+        Returns:
+            R: The result of the single execution of ``fn``.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,221 @@
+"""
+This module provides incremental activity sync for tracked accounts.
+
+`AccountSync` remembers, per account and per activity endpoint, the last block
+whose activity has been fully delivered. Each run reads the current chain
+head once, then asks every endpoint only for blocks after the stored cursor,
+using ``block_number_start`` and ``block_number_end``. Pinning the end of the
+range to the head keeps paging stable while new activity arrives, and lets the
+cursor advance to the head even for accounts that had no new activity.
+
+Cursors live in a `CursorStore`, a small SQLite database keyed by chain ID,
+account and endpoint. An account's cursors are written only after the
+handler has accepted its activity, so activity is delivered at least once: a
+crash mid-run re-delivers, on the next run, what was not yet acknowledged.
+
+Usage:
+    sync = AccountSync(sdk, CursorStore("~/.kaiascan-cursors.db"))
+    sync.run(wallets, lambda activity: store(activity.items))
+"""
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .concurrency import bounded_map
+from .interfaces.models import Block
+from .kaiascan import KaiascanSDK
+from .types.address import normalize_addresses
+
+# Activity endpoints that accept a block range, and the SDK method walking each.
+SYNC_ENDPOINTS: Dict[str, str] = {
+    "transactions": "iter_account_transactions",
+    "token_transfers": "iter_account_token_transfers",
+    "nft_transfers": "iter_account_nft_transfers",
+    "event_logs": "iter_account_event_logs",
+}
+
+
+class CursorStore:
+    """
+    A thread-safe SQLite store of per-account, per-endpoint block cursors.
+
+    Args:
+        path (str): The database file. ``~`` is expanded and the file is
+            created on first use.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cursors ("
+            " chain_id TEXT NOT NULL,"
+            " account TEXT NOT NULL,"
+            " endpoint TEXT NOT NULL,"
+            " block INTEGER NOT NULL,"
+            " PRIMARY KEY (chain_id, account, endpoint)"
+            ") WITHOUT ROWID"
+        )
+
+    def get(self, chain_id: str, account: str) -> Dict[str, int]:
+        """Returns the cursors of one account, keyed by endpoint."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT endpoint, block FROM cursors"
+                " WHERE chain_id = ? AND account = ?",
+                (chain_id, account.lower()),
+            ).fetchall()
+        return dict(rows)
+
+    def set(self, chain_id: str, account: str, cursors: Dict[str, int]) -> None:
+        """Stores the cursors of one account atomically."""
+        rows = [
+            (chain_id, account.lower(), endpoint, block)
+            for endpoint, block in cursors.items()
+        ]
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO cursors"
+                " (chain_id, account, endpoint, block) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._connection.execute("SELECT COUNT(*) FROM cursors").fetchone()[0]
+            )
+
+
+@dataclass
+class AccountActivity:
+    """
+    A data class holding the new activity of one account.
+
+    Attributes:
+        account (str): The account address.
+        end_block (int): The last block covered, inclusive; the account's
+            cursors move here once the activity is handled.
+        ranges (Dict[str, Tuple[int, int]]): The inclusive block range
+            requested from each endpoint. Endpoints already up to date are
+            absent.
+        items (Dict[str, List[Any]]): The items returned by each endpoint.
+    """
+
+    account: str
+    end_block: int
+    ranges: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    items: Dict[str, List[Any]] = field(default_factory=dict)
+
+
+class AccountSync:
+    """
+    Fetches only new activity for many accounts, resuming from stored cursors.
+
+    Args:
+        sdk (KaiascanSDK): The client used for all requests.
+        store (CursorStore): Where cursors are kept between runs.
+        endpoints (Sequence[str]): Names from `SYNC_ENDPOINTS` to follow.
+        start_block (int): Where accounts without a cursor start.
+        confirmations (int): Blocks to stay behind the chain head, giving the
+            explorer's indexer time to catch up.
+        max_workers (int): Accounts fetched concurrently.
+    """
+
+    def __init__(
+        self,
+        sdk: KaiascanSDK,
+        store: CursorStore,
+        endpoints: Sequence[str] = tuple(SYNC_ENDPOINTS),
+        start_block: int = 0,
+        confirmations: int = 0,
+        max_workers: int = 8,
+    ):
+        unknown = set(endpoints) - set(SYNC_ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown sync endpoints: {', '.join(sorted(unknown))}")
+        if start_block < 0 or confirmations < 0:
+            raise ValueError("start_block and confirmations must be >= 0")
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.sdk = sdk
+        self.store = store
+        self.endpoints = tuple(endpoints)
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.max_workers = max_workers
+
+    def head(self) -> int:
+        """Returns the last block to sync up to in this run."""
+        latest = Block.from_dict(self.sdk.get_latest_block().data).number
+        return max(latest - self.confirmations, 0)
+
+    def fetch(self, account: str, end_block: int) -> AccountActivity:
+        """Fetches an account's activity between its cursors and ``end_block``."""
+        cursors = self.store.get(self.sdk.chain_id, account)
+        activity = AccountActivity(account, end_block)
+        for endpoint in self.endpoints:
+            cursor = cursors.get(endpoint)
+            start = self.start_block if cursor is None else cursor + 1
+            if start > end_block:
+                continue
+            walk = getattr(self.sdk, SYNC_ENDPOINTS[endpoint])
+            activity.ranges[endpoint] = (start, end_block)
+            activity.items[endpoint] = list(
+                walk(account, block_number_start=start, block_number_end=end_block)
+            )
+        return activity
+
+    def run(
+        self,
+        accounts: Iterable[str],
+        handler: Callable[[AccountActivity], None],
+        end_block: Optional[int] = None,
+    ) -> int:
+        """
+        Syncs every account up to ``end_block``, calling ``handler`` for each.
+
+        Accounts are fetched concurrently and handed to ``handler`` on the
+        calling thread, in input order. Cursors move only after ``handler``
+        returns, so an exception stops the run and leaves the failed account
+        to be fetched again next time.
+
+        Args:
+            accounts (Iterable[str]): The accounts to sync. Addresses are
+                normalized first, so duplicates in any letter case are
+                synced once.
+            handler (Callable[[AccountActivity], None]): Receives the new
+                activity of each account, including accounts with none.
+            end_block (Optional[int]): The last block to sync; defaults to
+                `head`.
+
+        Returns:
+            int: The block every account is now synced to.
+        """
+        end = self.head() if end_block is None else end_block
+        unique = list(dict.fromkeys(normalize_addresses(accounts)))
+
+        def fetch(account: str) -> AccountActivity:
+            return self.fetch(account, end)
+
+        for account, activity in bounded_map(fetch, unique, self.max_workers):
+            handler(activity)
+            self.store.set(
+                self.sdk.chain_id,
+                account,
+                {endpoint: end for endpoint in activity.ranges},
+            )
+        return end
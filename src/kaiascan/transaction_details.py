@@ -0,0 +1,135 @@
+"""
+This module assembles complete transaction records from their sub-resources.
+
+A transaction detail page needs six endpoints: the transaction, its receipt
+status, and its event logs, internal transactions, token transfers and NFT
+transfers. `TransactionAssembler` requests all six at once, follows every
+paginated list to its last page, and returns one `TransactionDetails` per
+hash. A page therefore waits for its slowest endpoint instead of the sum of
+all of them. Many hashes are assembled concurrently, each on its own set of
+part requests.
+
+Usage:
+    assembler = TransactionAssembler(sdk, max_workers=8)
+    details = assembler.assemble(tx_hash)
+    pages = assembler.assemble_many(tx_hashes)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from .concurrency import bounded_map
+from .kaiascan import KaiascanSDK
+
+# Requests made per transaction.
+PARTS_PER_TRANSACTION = 6
+
+
+@dataclass
+class TransactionDetails:
+    """
+    A data class holding a transaction and all of its sub-resources.
+
+    Attributes:
+        transaction_hash (str): The transaction hash.
+        transaction (Any): The transaction returned by `get_transaction`.
+        receipt_status (Any): The receipt status returned by
+            `get_transaction_receipt_status`.
+        event_logs (List[Any]): Every event log of the transaction.
+        internal_transactions (List[Any]): Every internal transaction.
+        token_transfers (List[Any]): Every fungible token transfer.
+        nft_transfers (List[Any]): Every NFT transfer.
+    """
+
+    transaction_hash: str
+    transaction: Any
+    receipt_status: Any
+    event_logs: List[Any] = field(default_factory=list)
+    internal_transactions: List[Any] = field(default_factory=list)
+    token_transfers: List[Any] = field(default_factory=list)
+    nft_transfers: List[Any] = field(default_factory=list)
+
+
+class TransactionAssembler:
+    """
+    Fetches the full details of transactions, all parts in parallel.
+
+    Args:
+        sdk (KaiascanSDK): The client used for all requests.
+        max_workers (int): Transactions assembled concurrently.
+        page_workers (int): Pages of one sub-resource list requested
+            concurrently once its page count is known.
+    """
+
+    def __init__(self, sdk: KaiascanSDK, max_workers: int = 8, page_workers: int = 1):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if page_workers < 1:
+            raise ValueError("page_workers must be >= 1")
+
+        self.sdk = sdk
+        self.max_workers = max_workers
+        self.page_workers = page_workers
+
+    def fetch(
+        self, transaction_hash: str, parts: ThreadPoolExecutor
+    ) -> TransactionDetails:
+        """Fetches one transaction and its sub-resources, in parallel on ``parts``."""
+        if not transaction_hash:
+            raise ValueError("Transaction hash is required")
+        sdk = self.sdk
+
+        def every(iterate: Callable[..., Iterator[Any]]) -> Callable[[], List[Any]]:
+            return lambda: list(
+                iterate(transaction_hash, max_workers=self.page_workers)
+            )
+
+        futures = [
+            parts.submit(lambda: sdk.get_transaction(transaction_hash).data),
+            parts.submit(
+                lambda: sdk.get_transaction_receipt_status(transaction_hash).data
+            ),
+            parts.submit(every(sdk.iter_transaction_event_logs)),
+            parts.submit(every(sdk.iter_transaction_internal_transactions)),
+            parts.submit(every(sdk.iter_transaction_token_transfers)),
+            parts.submit(every(sdk.iter_transaction_nft_transfers)),
+        ]
+        try:
+            return TransactionDetails(
+                transaction_hash, *(future.result() for future in futures)
+            )
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def assemble(self, transaction_hash: str) -> TransactionDetails:
+        """Returns the full details of one transaction."""
+        return self.assemble_many([transaction_hash])[transaction_hash]
+
+    def assemble_many(
+        self, transaction_hashes: Iterable[str]
+    ) -> Dict[str, TransactionDetails]:
+        """
+        Returns the full details of many transactions.
+
+        Args:
+            transaction_hashes (Iterable[str]): The transactions. Duplicates
+                are assembled once.
+
+        Returns:
+            Dict[str, TransactionDetails]: Details keyed by hash, in input
+            order. The first failure of any request is raised.
+        """
+        unique = list(dict.fromkeys(transaction_hashes))
+        if not unique:
+            raise ValueError("At least one transaction hash is required")
+
+        workers = min(len(unique), self.max_workers)
+        parts = ThreadPoolExecutor(workers * PARTS_PER_TRANSACTION)
+        try:
+            return dict(
+                bounded_map(lambda tx_hash: self.fetch(tx_hash, parts), unique, workers)
+            )
+        finally:
+            parts.shutdown()
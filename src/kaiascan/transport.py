@@ -0,0 +1,206 @@
+"""
+This module provides the HTTP transports used by `KaiascanSDK`.
+
+A transport sends GET requests on behalf of the client and owns its
+connections. Both transports here are safe to share between threads, keep
+connections alive between requests, and always apply a connect and a read
+timeout, so a stalled API cannot hold a worker or a socket forever.
+
+* `RequestsTransport` is the default. Each thread gets its own
+  `requests.Session`, but all of them draw from one shared, bounded urllib3
+  connection pool, so TLS connections are reused across threads instead of
+  being opened per thread. A thread's session is released when the thread
+  exits. TCP keep-alive probes are enabled on every socket so dead peers are
+  noticed even on idle connections.
+* `HttpxTransport` uses httpx and can multiplex requests over a single HTTP/2
+  connection. httpx (and h2, for HTTP/2) are optional, installed with the
+  ``http2`` extra, and only imported when this transport is created.
+
+Usage:
+    sdk = KaiascanSDK(
+        is_testnet=True,
+        transport=RequestsTransport(pool_size=64, timeout=(3.05, 20)),
+    )
+"""
+
+import socket
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestConnectionError
+from requests.exceptions import Timeout
+from urllib3.connection import HTTPConnection
+
+# (connect, read) timeouts in seconds.
+TimeoutSpec = Union[float, Tuple[float, float]]
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 30.0)
+DEFAULT_POOL_SIZE = 10
+
+# Seconds of idleness before the first keep-alive probe, and between probes.
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_PROBES = 3
+
+
+class Transport(Protocol):
+    """What `KaiascanSDK` needs from a transport; `requests.Session` also fits."""
+
+    headers: Any
+
+    def get(self, url: str, **kwargs: Any) -> Any: ...
+
+    def close(self) -> None: ...
+
+
+def _keepalive_options() -> List[Tuple[int, int, int]]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_PROBES),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """An `HTTPAdapter` whose pooled sockets use TCP keep-alive probes."""
+
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs: Any):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class RequestsTransport:
+    """
+    A thread-safe transport built on `requests` and a shared connection pool.
+
+    Args:
+        pool_size (int): Connections kept open per host. Size it to the
+            number of threads making requests.
+        timeout (TimeoutSpec): Connect and read timeouts in seconds, or one
+            value for both.
+        pool_block (bool): When every pooled connection is busy, wait for one
+            instead of opening a temporary extra connection.
+        tcp_keepalive (bool): Enable TCP keep-alive probes on pooled sockets.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: TimeoutSpec = DEFAULT_TIMEOUT,
+        pool_block: bool = False,
+        tcp_keepalive: bool = True,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+
+        self.timeout = timeout
+        self.headers: Dict[str, str] = {}
+        socket_options = list(HTTPConnection.default_socket_options)
+        if tcp_keepalive:
+            socket_options += _keepalive_options()
+        self._adapter = _KeepAliveAdapter(
+            socket_options,
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            pool_block=pool_block,
+        )
+        # Only the thread-local slot keeps a session alive, so the session of
+        # an exited thread is freed; the shared adapter is not closed with it.
+        self._local = threading.local()
+        self._sessions: "weakref.WeakSet[Session]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def _session(self) -> Session:
+        session: Optional[Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        """Sends a GET request from the calling thread's session."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self._session().get(url, headers=self.headers, **kwargs)
+
+    def close(self) -> None:
+        """Closes every session and pooled connection."""
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+
+
+class HttpxTransport:
+    """
+    A thread-safe transport built on httpx, with optional HTTP/2.
+
+    httpx errors are re-raised as the matching `requests` exceptions, so the
+    client's retry handling works unchanged.
+
+    Args:
+        http2 (bool): Multiplex requests over HTTP/2 connections. Requires h2.
+        pool_size (int): Maximum number of open connections.
+        timeout (TimeoutSpec): Connect and read timeouts in seconds, or one
+            value for both.
+        keepalive_expiry (float): Seconds an idle connection is kept open.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: TimeoutSpec = DEFAULT_TIMEOUT,
+        keepalive_expiry: float = 60.0,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        try:
+            import httpx
+        except ImportError as error:
+            raise ImportError(
+                "httpx is required for HttpxTransport: pip install kaiascan[http2]"
+            ) from error
+
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        self.headers: Dict[str, str] = {}
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(read, connect=connect),
+            follow_redirects=True,
+        )
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Sends a GET request; the response mirrors `requests.Response`."""
+        try:
+            return self._client.get(url, headers=self.headers, **kwargs)
+        except self._httpx.TimeoutException as error:
+            raise Timeout(str(error)) from error
+        except self._httpx.TransportError as error:
+            raise RequestConnectionError(str(error)) from error
+
+    def close(self) -> None:
+        """Closes every pooled connection."""
+        self._client.close()
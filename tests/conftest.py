@@ -0,0 +1,45 @@
+"""Shared fixtures for the kaiascan test suite."""
+
+import urllib.parse
+from typing import Callable, Optional
+
+import pytest
+
+from tests.fakes import FakeSession, Route, ok
+
+
+@pytest.fixture
+def fake_session() -> Callable[..., FakeSession]:
+    def factory(
+        handler: Optional[Callable[[str], Route]] = None, delay: float = 0.0
+    ) -> FakeSession:
+        return FakeSession(handler or (lambda url: ok({"url": url})), delay)
+
+    return factory
+
+
+@pytest.fixture
+def paged_handler() -> Callable[[int], Callable[[str], Route]]:
+    """Build handlers that serve ``total_items`` consecutive integers in pages."""
+
+    def factory(total_items: int) -> Callable[[str], Route]:
+        def handler(url: str) -> Route:
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+            page, size = int(query["page"][0]), int(query["size"][0])
+            start = (page - 1) * size
+            pages = -(-total_items // size)
+            return ok(
+                {
+                    "results": list(range(start, min(start + size, total_items))),
+                    "paging": {
+                        "total_count": total_items,
+                        "current_page": page,
+                        "last": page >= pages,
+                        "total_page": pages,
+                    },
+                }
+            )
+
+        return handler
+
+    return factory
@@ -0,0 +1,60 @@
+"""Test doubles for exercising the SDK without network access."""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from requests import Response
+
+Route = Union[Dict[str, Any], Tuple[int, Dict[str, Any], Dict[str, str]]]
+
+
+def ok(data: Any) -> Dict[str, Any]:
+    """Wrap a payload in the Kaiascan success envelope."""
+    return {"code": 0, "data": data, "msg": "success"}
+
+
+class FakeSession:
+    """
+    A stand-in for `requests.Session` that answers from a handler function.
+
+    The handler receives the requested URL and returns either a JSON body
+    (served with status 200) or a ``(status, body, headers)`` tuple.
+    """
+
+    def __init__(self, handler: Callable[[str], Route], delay: float = 0.0):
+        self.handler = handler
+        self.delay = delay
+        self.headers: Dict[str, str] = {}
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        with self._lock:
+            self.calls.append(url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            route = self.handler(url)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        status, body, headers = route if isinstance(route, tuple) else (200, route, {})
+        response = Response()
+        response.status_code = status
+        response.url = url
+        response._content = json.dumps(body).encode()
+        response.headers.update(headers)
+        return response
@@ -0,0 +1,142 @@
+"""Tests for Keccak-256 and the ABI decoding engine."""
+
+import json
+from typing import Any, Dict
+
+from kaiascan.abi import AbiDecoder
+from kaiascan.interfaces.models import EventLog
+from kaiascan.keccak import keccak256, python_keccak256, signature_hash
+
+SENDER = "0x" + "11" * 20
+RECEIVER = "0x" + "22" * 20
+
+ABI = [
+    {
+        "type": "function",
+        "name": "transfer",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+    },
+    {
+        "type": "function",
+        "name": "register",
+        "inputs": [
+            {"name": "label", "type": "string"},
+            {"name": "ids", "type": "uint256[]"},
+            {
+                "name": "owner",
+                "type": "tuple",
+                "components": [
+                    {"name": "account", "type": "address"},
+                    {"name": "delta", "type": "int256"},
+                ],
+            },
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Transfer",
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+]
+
+
+def _word(value: int) -> str:
+    return (value % (1 << 256)).to_bytes(32, "big").hex()
+
+
+def _address(address: str) -> str:
+    return "0" * 24 + address[2:]
+
+
+def test_keccak256_matches_known_digests():
+    """Test Keccak-256 against reference values, across block boundaries."""
+    assert keccak256(b"").hex() == (
+        "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+    )
+    assert signature_hash("transfer(address,uint256)")[:10] == "0xa9059cbb"
+    assert keccak256(b"a" * 300).hex() == (
+        "5b7e0e47a96f32a88b4f14ca177982790807c40e1a105742ba0fc1babe1ef826"
+    )
+    assert python_keccak256(b"a" * 300) == keccak256(b"a" * 300)
+
+
+def test_decode_input_static_and_dynamic_arguments():
+    """Test selectors, strings, dynamic arrays and static tuples."""
+    decoder = AbiDecoder({"abi": json.dumps(ABI)})
+
+    transfer = decoder.decode_input("0xa9059cbb" + _address(RECEIVER) + _word(10**18))
+    assert transfer is not None
+    assert transfer.signature == "transfer(address,uint256)"
+    assert transfer.args == {"to": RECEIVER, "amount": 10**18}
+
+    selector = signature_hash("register(string,uint256[],(address,int256))")[:10]
+    data = (
+        _word(128)  # offset of label
+        + _word(192)  # offset of ids
+        + _address(SENDER)
+        + _word(-5)
+        + _word(4)
+        + b"kaia".ljust(32, b"\0").hex()
+        + _word(2)
+        + _word(7)
+        + _word(8)
+    )
+    register = decoder.decode_input({"input": selector + data})
+    assert register is not None
+    assert register.args == {
+        "label": "kaia",
+        "ids": [7, 8],
+        "owner": {"account": SENDER, "delta": -5},
+    }
+
+    assert decoder.decode_input("0xdeadbeef") is None
+    assert decoder.decode_input(selector + _word(4096)) is None
+
+
+def test_decode_input_rejects_malformed_hex():
+    """Test that call data which is not valid hex decodes to None."""
+    decoder = AbiDecoder(ABI)
+    call = "0xa9059cbb" + _address(RECEIVER) + _word(1)
+
+    assert decoder.decode_input(call[:-1]) is None
+    assert decoder.decode_input("0xa9059cbz" + call[10:]) is None
+    assert decoder.decode_input({"input": "0x0"}) is None
+
+
+def test_decode_logs_by_topic_and_topic_count(monkeypatch):
+    """Test event decoding from dicts and models, in and out of a process pool."""
+    decoder = AbiDecoder(ABI)
+    topic = signature_hash("Transfer(address,address,uint256)")
+    log: Dict[str, Any] = {
+        "topics": [topic, "0x" + _address(SENDER), "0x" + _address(RECEIVER)],
+        "data": "0x" + _word(42),
+    }
+
+    event = decoder.decode_log(EventLog.from_dict(log))
+    assert event is not None
+    assert event.name == "Transfer"
+    assert event.args == {"from": SENDER, "to": RECEIVER, "value": 42}
+
+    # ERC-721 Transfer shares the topic but indexes the token ID as well.
+    nft = dict(log, topics=log["topics"] + ["0x" + _word(1)], data="0x")
+    assert decoder.decode_log(nft) is None
+
+    monkeypatch.setattr("kaiascan.abi.PROCESS_POOL_THRESHOLD", 4)
+    batch = [log, nft] * 3
+    assert decoder.decode_logs(batch, processes=2, chunk_size=2) == (
+        decoder.decode_logs(batch, processes=1)
+    )
+    pool = decoder._pool
+    first = decoder.decode_logs(batch, processes=2)[0]
+    assert first is not None
+    assert first.name == "Transfer"
+    assert decoder._pool is pool
+    decoder.close()
+    assert decoder._pool is None
@@ -0,0 +1,72 @@
+"""Tests for strict address normalization."""
+
+import pytest
+
+from kaiascan import KaiascanSDK
+from kaiascan.types.address import (
+    normalize_address,
+    normalize_addresses,
+    to_checksum_address,
+)
+
+CHECKSUMMED = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+
+
+def test_normalize_address_lowercases_and_interns():
+    """Test canonical spelling, interning and EIP-55 checksums."""
+    lower = normalize_address(CHECKSUMMED.upper().replace("0X", "0x"))
+
+    assert lower == CHECKSUMMED.lower()
+    assert lower is normalize_address("".join(["0x", CHECKSUMMED[2:].lower()]))
+    assert to_checksum_address(lower) == CHECKSUMMED
+    assert normalize_address(lower, checksum=True) == CHECKSUMMED
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "0x1234567890abcdef",  # too short
+        CHECKSUMMED[2:],  # no prefix
+        "0x" + "g" * 40,  # not hex
+        CHECKSUMMED[:-1] + "D",  # bad checksum
+        None,
+    ],
+)
+def test_normalize_address_rejects_malformed_input(address):
+    """Test that length, hex digits and mixed-case checksums are enforced."""
+    with pytest.raises(ValueError):
+        normalize_address(address)
+
+
+def test_normalize_addresses_reports_every_bad_entry():
+    """Test the batch form and its error summary."""
+    good = ["0x" + f"{n:040x}" for n in range(3)]
+    assert normalize_addresses(good) == good
+
+    with pytest.raises(ValueError, match=r"2 invalid addresses: #1 '0x1', #3 ''"):
+        normalize_addresses([good[0], "0x1", good[1], ""])
+
+
+def test_normalize_addresses_verifies_checksums_on_request():
+    """Test that batch checksum verification is opt-in."""
+    miscased = CHECKSUMMED[:-1] + "D"
+
+    assert normalize_addresses([miscased]) == [CHECKSUMMED.lower()]
+    with pytest.raises(ValueError, match="#0"):
+        normalize_addresses([miscased], verify_checksum=True)
+
+
+def test_sdk_rejects_bad_addresses_before_requesting(fake_session):
+    """Test that invalid input never reaches the network and keys are canonical."""
+    session = fake_session()
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = session
+
+    with pytest.raises(ValueError):
+        sdk.get_account_info("0xnot-an-address")
+    with pytest.raises(ValueError):
+        sdk.get_fungible_tokens_bulk([CHECKSUMMED, "0x1"])
+    assert session.calls == []
+
+    sdk.get_account_info(CHECKSUMMED)
+    assert session.calls[0].endswith(f"accounts/{CHECKSUMMED.lower()}")
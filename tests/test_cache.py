@@ -0,0 +1,100 @@
+"""Tests for the finality-aware response cache."""
+
+import time
+
+from kaiascan import KaiascanSDK, ResponseCache
+from kaiascan.cache import IMMUTABLE
+from tests.fakes import ok
+
+
+def test_cache_policy_classifies_endpoints():
+    """Test that immutable, short-lived and uncached endpoints are told apart."""
+    cache = ResponseCache()
+
+    assert cache.ttl_for("api/v1/blocks?blockNumber=100") == IMMUTABLE
+    assert cache.ttl_for("api/v1/blocks/100/rewards") == IMMUTABLE
+    assert cache.ttl_for("api/v1/transactions/0xabc/input-data") == IMMUTABLE
+    assert cache.ttl_for("api/v1/contracts/0xabc/abi") == IMMUTABLE
+    assert cache.ttl_for("api/v1/blocks/latest") == 1.0
+    assert cache.ttl_for("api/v1/kaia") == 10.0
+    assert cache.ttl_for("api/v1/accounts/0xabc/transactions?page=1&size=20") is None
+
+
+def test_cache_evicts_least_recently_used_and_expires():
+    """Test LRU eviction and TTL expiry."""
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1, IMMUTABLE)
+    cache.set("b", 2, IMMUTABLE)
+    cache.get("a")
+    cache.set("c", 3, IMMUTABLE)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, 0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is None
+
+
+def test_sdk_serves_immutable_responses_from_cache(fake_session):
+    """Test that repeated immutable lookups hit the network once."""
+    session = fake_session()
+    sdk = KaiascanSDK(is_testnet=True, cache=ResponseCache())
+    sdk.session = session
+
+    first = sdk.get_block(7)
+    second = sdk.get_block(7)
+    sdk.get_account_info("0x" + "ab" * 20)
+    sdk.get_account_info("0x" + "ab" * 20)
+
+    assert first is second
+    assert len(session.calls) == 3
+
+
+def test_disk_cache_survives_restart(fake_session, tmp_path):
+    """Test that immutable responses are reused across SDK instances and restarts."""
+    from kaiascan import DiskCache
+
+    path = str(tmp_path / "kaiascan.db")
+    disk_cache = DiskCache(path)
+    sdk = KaiascanSDK(is_testnet=True, disk_cache=disk_cache)
+    sdk.session = fake_session()
+    sdk.get_transaction("0xabc")
+    sdk.get_latest_block()
+    disk_cache.close()
+
+    reopened = DiskCache(path)
+    restarted = KaiascanSDK(is_testnet=True, disk_cache=reopened)
+    restarted_session = fake_session()
+    restarted.session = restarted_session
+    response = restarted.get_transaction("0xabc")
+    mainnet = KaiascanSDK(is_testnet=False, disk_cache=reopened)
+    mainnet_session = fake_session()
+    mainnet.session = mainnet_session
+    mainnet.get_transaction("0xabc")
+
+    assert response.data == {
+        "url": "https://kairos-oapi.kaiascan.io/api/v1/transactions/0xabc"
+    }
+    assert restarted_session.calls == []
+    assert len(mainnet_session.calls) == 1
+    assert len(reopened) == 2
+
+
+def test_empty_immutable_responses_are_not_kept(fake_session, monkeypatch, tmp_path):
+    """Test that a block past the head is neither cached forever nor persisted."""
+    from kaiascan import DiskCache
+
+    monkeypatch.setattr("kaiascan.cache.EMPTY_RESPONSE_TTL", 0.01)
+    disk_cache = DiskCache(str(tmp_path / "kaiascan.db"))
+    session = fake_session(lambda url: ok({}))
+    sdk = KaiascanSDK(is_testnet=True, cache=ResponseCache(), disk_cache=disk_cache)
+    sdk.session = session
+
+    sdk.get_block(10**9)
+    sdk.get_block(10**9)
+    time.sleep(0.02)
+    sdk.get_block(10**9)
+
+    assert len(session.calls) == 2
+    assert len(disk_cache) == 0
@@ -0,0 +1,98 @@
+"""Tests for the ``kaiascan`` bulk command-line tool."""
+
+import io
+import json
+import subprocess
+import sys
+import time
+from typing import Iterator
+
+import pytest
+
+from kaiascan import KaiascanSDK
+from kaiascan.cli import main, parse_params, run
+from kaiascan.concurrency import bounded_map_unordered
+
+
+def test_bounded_map_unordered_yields_fast_results_first():
+    """Test that a slow call does not hold back the results behind it."""
+
+    def work(delay):
+        time.sleep(delay)
+        return delay
+
+    results = [delay for delay, _ in bounded_map_unordered(work, [0.2, 0, 0], 4)]
+    assert results == [0, 0, 0.2]
+
+
+def test_run_streams_ndjson_records(fake_session):
+    """Test one record per input, block number conversion and error records."""
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session()
+    out = io.StringIO()
+
+    failed = run(sdk, "get_block", iter(["12", "0x10", "tip"]), out, ordered=True)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert failed == 1
+    assert [record["input"] for record in records] == ["12", "0x10", "tip"]
+    assert records[0]["data"]["url"].endswith("blockNumber=12")
+    assert records[1]["data"]["url"].endswith("blockNumber=16")
+    assert "invalid literal" in records[2]["error"]
+
+
+def test_run_writes_one_record_per_paged_item(fake_session, paged_handler):
+    """Test that ``iter_*`` methods are flattened into item records."""
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(paged_handler(3))
+    out = io.StringIO()
+    params = parse_params(sdk, "iter_transactions_of_block", ["size=2"])
+
+    run(sdk, "iter_transactions_of_block", ["7"], out, params=params)
+
+    assert params == {"size": 2}
+    assert [json.loads(line)["data"] for line in out.getvalue().splitlines()] == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_run_streams_paged_items_as_they_are_yielded():
+    """Test that paged items are written one by one, and mid-stream errors."""
+    out = io.StringIO()
+    written = []
+
+    class Streaming:
+        def iter_items(self, value: str) -> Iterator[int]:
+            for item in range(3):
+                yield item
+                written.append(len(out.getvalue().splitlines()))
+            raise RuntimeError("page 2 failed")
+
+    assert run(Streaming(), "iter_items", ["a"], out) == 1
+    assert written == [1, 2, 3]
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [record.get("data") for record in records[:3]] == [0, 1, 2]
+    assert records[3] == {"input": "a", "error": "page 2 failed"}
+
+
+def test_main_rejects_methods_without_a_single_input(capsys):
+    """Test usage errors for unknown and multi-argument methods."""
+    for method in ("get_kaia_info", "nope", "get_blocks_bulk", "get_nft_item"):
+        with pytest.raises(SystemExit):
+            main([method])
+    assert "does not take a single" in capsys.readouterr().err
+
+
+def test_cli_import_is_light(tmp_path):
+    """Test that the CLI module does not import requests or the SDK."""
+    code = "import sys, kaiascan.cli; print('requests' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,104 @@
+"""Tests for the concurrency helpers and bulk lookups."""
+
+import asyncio
+import itertools
+import time
+from typing import Any, Dict, Iterator, Tuple
+
+from kaiascan import AsyncKaiascanSDK, KaiascanSDK
+from kaiascan.concurrency import bounded_map, chunked
+from kaiascan.types.address import Address, normalize_addresses
+from tests.fakes import ok
+
+
+def test_bounded_map_keeps_order_and_is_lazy():
+    """Test that results come back in input order without draining the input."""
+    consumed = []
+
+    def source() -> Iterator[int]:
+        for number in itertools.count():
+            consumed.append(number)
+            yield number
+
+    def slow_square(number: int) -> int:
+        time.sleep(0.001 * (number % 3))
+        return number * number
+
+    results = bounded_map(slow_square, source(), max_workers=2)
+    first = [next(results) for _ in range(5)]
+
+    assert first == [(n, n * n) for n in range(5)]
+    assert len(consumed) <= 9
+    results.close()
+
+
+def test_chunked():
+    """Test splitting an iterable into bounded chunks."""
+    assert list(chunked(range(5), 2)) == [(0, 1), (2, 3), (4,)]
+
+
+def test_contracts_info_bulk_chunks_and_merges(fake_session):
+    """Test that large address lists are split into chunks and merged by input."""
+
+    def handler(url):
+        addresses = url.split("contractAddresses=")[1].split(",")
+        return ok([{"contract_address": a.lower(), "name": a} for a in addresses])
+
+    session = fake_session(handler)
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = session
+    addresses = [f"0x{n:040X}" for n in range(25)]
+
+    info = sdk.get_contracts_info_bulk(addresses + addresses[:3], chunk_size=10)
+
+    normalized = normalize_addresses(addresses)
+    assert list(info) == normalized
+    assert info[normalized[7]]["name"] == normalized[7]
+    assert len(session.calls) == 3
+
+
+def test_blocks_bulk_dedupes(fake_session):
+    """Test that bulk single-item lookups are keyed by input and deduplicated."""
+    session = fake_session()
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = session
+
+    blocks = sdk.get_blocks_bulk([3, 1, 3, 2])
+
+    assert list(blocks) == [3, 1, 2]
+    assert blocks[1]["url"].endswith("blockNumber=1")
+    assert len(session.calls) == 3
+
+
+def test_async_bulk_lookups(fake_session):
+    """Test that the bulk lookups of AsyncKaiascanSDK are awaitable and bounded."""
+
+    def handler(url):
+        if "contractAddresses=" in url:
+            addresses = url.split("contractAddresses=")[1].split(",")
+            return ok([{"contract_address": a, "name": a} for a in addresses])
+        return ok({"url": url})
+
+    session = fake_session(handler, delay=0.01)
+
+    async def run() -> Tuple[
+        int, Dict[int, Any], Dict[Address, Any], Dict[Address, Any]
+    ]:
+        async with AsyncKaiascanSDK(is_testnet=True, max_concurrency=8) as sdk:
+            sdk.client.session = session
+            blocks = await sdk.get_blocks_bulk([3, 1, 3] + list(range(4, 20)), 2)
+            peak = session.max_in_flight
+            tokens = await sdk.get_fungible_tokens_bulk(["0x" + "ab" * 20])
+            contracts = await sdk.get_contracts_info_bulk(
+                [f"0x{n:040x}" for n in range(5)], chunk_size=2
+            )
+            return peak, blocks, tokens, contracts
+
+    peak, blocks, tokens, contracts = asyncio.run(run())
+
+    assert list(blocks)[:3] == [3, 1, 4]
+    assert blocks[1]["url"].endswith("blockNumber=1")
+    assert 1 < peak <= 2
+    assert tokens[Address("0x" + "ab" * 20)]["url"].endswith("ab" * 20)
+    assert contracts[Address("0x" + "0" * 39 + "4")]["name"] == "0x" + "0" * 39 + "4"
+    assert len(session.calls) == 18 + 1 + 3
@@ -0,0 +1,92 @@
+"""Tests for the pluggable JSON decoders."""
+
+import json
+from typing import List, Type
+
+import pytest
+
+from kaiascan import KaiascanSDK
+from kaiascan.decoding import JsonDecoder, MsgspecDecoder, OrjsonDecoder
+from kaiascan.interfaces.models import TokenTransfer, model_for
+
+BODY = json.dumps(
+    {
+        "code": 0,
+        "msg": "success",
+        "data": {
+            "results": [{"transaction_hash": "0x1", "block_id": 5, "amount": "10"}],
+            "paging": {"last": True},
+        },
+    }
+).encode()
+
+
+def _backends() -> List[Type[JsonDecoder]]:
+    backends: List[Type[JsonDecoder]] = [JsonDecoder]
+    for backend in (OrjsonDecoder, MsgspecDecoder):
+        try:
+            backend()
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+@pytest.mark.parametrize("backend", _backends())
+def test_decoders_agree(backend):
+    """Test that every installed backend decodes raw and typed pages alike."""
+    decoder = backend()
+
+    raw = decoder.decode(BODY)
+    typed = decoder.decode(BODY, TokenTransfer)
+
+    assert raw["data"]["results"][0]["block_id"] == 5
+    assert typed["data"]["results"] == [
+        TokenTransfer.from_dict(raw["data"]["results"][0])
+    ]
+    assert typed["data"]["paging"] == {"last": True}
+    assert (
+        decoder.decode(b'{"code": 1, "data": null, "msg": "x"}', TokenTransfer)["code"]
+        == 1
+    )
+
+
+@pytest.mark.parametrize("backend", _backends())
+def test_decoders_keep_uint256_amounts(backend):
+    """Test that integers wider than 64 bits decode exactly on every backend."""
+    amount = 2**256 - 1
+    body = json.dumps(
+        {"code": 0, "data": {"amount": amount, "decimals": 18}, "msg": ""}
+    ).encode()
+
+    data = backend().decode(body)["data"]
+
+    assert data["amount"] == amount
+    assert isinstance(data["amount"], int)
+    assert data["decimals"] == 18
+
+
+def test_model_for_endpoints():
+    """Test that list endpoints map to the model of their items."""
+    assert model_for("api/v1/tokens/0x1/transfers?page=1&size=20") is TokenTransfer
+    assert model_for("api/v1/accounts/0x1/token-transfers?page=1") is TokenTransfer
+    assert model_for("api/v1/blocks/1/internal-transactions?page=1") is None
+    assert model_for("api/v1/kaia") is None
+
+
+def test_typed_sdk_yields_models(fake_session):
+    """Test that a typed client returns models from list endpoints."""
+    sdk = KaiascanSDK(is_testnet=True, typed=True, json_decoder=JsonDecoder())
+    sdk.session = fake_session(
+        lambda url: (
+            json.loads(BODY)
+            if "transfers" in url
+            else {"code": 0, "data": {}, "msg": ""}
+        )
+    )
+
+    [transfer] = list(sdk.iter_token_transfers("0x" + "ab" * 20))
+
+    assert isinstance(transfer, TokenTransfer)
+    assert transfer.block_number == 5
+    assert sdk.get_kaia_info().data == {}
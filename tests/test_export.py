@@ -0,0 +1,73 @@
+"""Tests for columnar export of paginated results."""
+
+from decimal import Decimal
+
+import pytest
+
+from kaiascan.export import iter_record_batches, to_numpy, write_parquet
+from kaiascan.interfaces.models import TokenTransfer
+
+ITEMS = [
+    {
+        "transaction_hash": f"0x{n:064x}",
+        "block_id": 100 + n,
+        "datetime": "2024-11-25T10:00:00Z",
+        "from": "0x1",
+        "to": "0x2",
+        "amount": str(10**30 + n),
+    }
+    for n in range(5)
+]
+
+
+def test_record_batches_use_typed_columns():
+    """Test Arrow batches for dtypes and exact big-integer amounts."""
+    pa = pytest.importorskip("pyarrow")
+
+    batches = list(iter_record_batches(ITEMS, TokenTransfer, batch_size=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    schema = batches[0].schema
+    assert schema.field("block_number").type == pa.int64()
+    assert pa.types.is_timestamp(schema.field("datetime").type)
+    assert schema.field("amount").type == pa.string()
+    assert batches[2].column("amount")[0].as_py() == str(10**30 + 4)
+    assert batches[0].column("contract_address").null_count == 2
+
+
+def test_record_batches_keep_full_uint256_amounts():
+    """Test that amounts too wide for decimal256 survive, and opt-in decimals."""
+    pa = pytest.importorskip("pyarrow")
+    items = [dict(ITEMS[0], amount=str(2**256 - 1))]
+
+    [batch] = iter_record_batches(items, TokenTransfer)
+    assert batch.column("amount")[0].as_py() == str(2**256 - 1)
+
+    [batch] = iter_record_batches(ITEMS[:1], TokenTransfer, decimal_scale=0)
+    assert batch.schema.field("amount").type == pa.decimal256(76, 0)
+    assert batch.column("amount")[0].as_py() == Decimal(10**30)
+
+
+def test_write_parquet_streams_rows(tmp_path):
+    """Test that a Parquet file round-trips the exported rows."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "transfers.parquet")
+    models = (TokenTransfer.from_dict(item) for item in ITEMS)
+
+    assert write_parquet(models, TokenTransfer, path, batch_size=2) == 5
+    table = pq.read_table(path)
+    assert table.column("block_number").to_pylist() == [100, 101, 102, 103, 104]
+
+
+def test_to_numpy_structured_array():
+    """Test NumPy structured arrays with integer and datetime columns."""
+    np = pytest.importorskip("numpy")
+
+    array = to_numpy(ITEMS, TokenTransfer, batch_size=3)
+
+    assert array.dtype["block_number"] == np.int64
+    assert array["block_number"].sum() == 510
+    assert array["datetime"][0] == np.datetime64("2024-11-25T10:00:00")
+    assert array["amount"][1] == Decimal(10**30 + 1)
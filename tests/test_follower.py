@@ -0,0 +1,98 @@
+"""Tests for the chain-head follower."""
+
+import asyncio
+import re
+from typing import Any, Callable, Dict, List, Optional, cast
+
+import pytest
+
+from kaiascan import ChainFollower, KaiascanSDK
+from kaiascan.follower import FollowedBlock
+from tests.fakes import FakeSession, Route, ok
+
+
+def _chain(heads: List[int]) -> Callable[[str], Route]:
+    """Serve a chain whose head moves through ``heads`` on successive polls."""
+    polls = iter(heads)
+    state: Dict[str, Optional[int]] = {"head": None}
+
+    def handler(url: str) -> Route:
+        if url.endswith("blocks/latest"):
+            state["head"] = next(polls, state["head"])
+            return ok({"block_id": state["head"]})
+        match = re.search(r"blocks(?:\?blockNumber=|/)(\d+)", url)
+        assert match is not None
+        number = int(match.group(1))
+        if "/rewards" in url:
+            return ok({"block_id": number, "total_reward": "9.6"})
+        if "transactions" in url:
+            kind = "internal" if "internal" in url else "tx"
+            return ok({"results": [f"{kind}-{number}"], "paging": {"last": True}})
+        return ok({"block_id": number})
+
+    return handler
+
+
+def _follower(
+    fake_session: Callable[..., FakeSession], heads: List[int], **options: Any
+) -> ChainFollower:
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(_chain(heads))
+    return ChainFollower(sdk, min_interval=0.001, max_interval=0.01, **options)
+
+
+def test_follower_delivers_every_block_in_order(fake_session):
+    """Test gap filling across polls that skip several blocks."""
+    follower = _follower(fake_session, [10, 10, 13, 17], start_block=9)
+    seen: List[FollowedBlock] = []
+
+    def handler(block: FollowedBlock) -> None:
+        seen.append(block)
+        if block.number == 17:
+            follower.stop()
+
+    follower.run(handler)
+
+    assert [block.number for block in seen] == list(range(9, 18))
+    assert seen[0].block == {"block_id": 9}
+    assert seen[0].transactions == ["tx-9"]
+    assert seen[0].internal_transactions == ["internal-9"]
+    assert seen[0].rewards["total_reward"] == "9.6"
+    assert follower.next_block == 18
+
+
+def test_follower_starts_at_head_and_skips_optional_parts(fake_session):
+    """Test the default start and disabled internal transactions and rewards."""
+    follower = _follower(
+        fake_session, [50, 51], include_internal=False, include_rewards=False
+    )
+    blocks = follower.iter_blocks()
+
+    first, second = next(blocks), next(blocks)
+    blocks.close()
+
+    assert (first.number, second.number) == (50, 51)
+    assert second.internal_transactions == [] and second.rewards is None
+    session = cast(FakeSession, follower.sdk.session)
+    assert not any("rewards" in url for url in session.calls)
+
+
+def test_follower_async_iterator(fake_session):
+    """Test delivery through ``async for``."""
+    follower = _follower(fake_session, [5, 6, 7], start_block=5)
+
+    async def run() -> List[int]:
+        numbers = []
+        async for block in follower.aiter_blocks():
+            numbers.append(block.number)
+            if len(numbers) == 3:
+                break
+        return numbers
+
+    assert asyncio.run(run()) == [5, 6, 7]
+
+
+def test_follower_validates_intervals():
+    """Test that invalid polling bounds are rejected."""
+    with pytest.raises(ValueError):
+        ChainFollower(KaiascanSDK(is_testnet=True), min_interval=2, max_interval=1)
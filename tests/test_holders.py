@@ -0,0 +1,91 @@
+"""Tests for holder snapshots, distribution statistics and diffs."""
+
+from decimal import Decimal
+from typing import Dict
+
+import pytest
+
+from kaiascan import HolderSnapshot, KaiascanSDK
+from kaiascan.holders import iter_snapshots
+from kaiascan.interfaces.models import TokenHolder
+from tests.fakes import ok
+
+np = pytest.importorskip("numpy")
+
+TOKEN = "0x" + "aa" * 20
+
+
+def _holder(n: int, amount: str) -> Dict[str, str]:
+    # A trailing zero byte checks that NumPy's NUL stripping is undone.
+    return {"holder_address": "0x" + f"{n:038x}" + "00", "amount": amount}
+
+
+def test_snapshot_statistics():
+    """Test top-N share, Gini coefficient and balance buckets."""
+    snapshot = HolderSnapshot.from_holders(
+        TOKEN, [_holder(n, amount) for n, amount in enumerate(["0", "5", "15", "80"])]
+    )
+
+    assert len(snapshot) == 4
+    assert snapshot.total() == 100
+    assert snapshot.top_share(1) == pytest.approx(0.8)
+    assert snapshot.top_share(10) == 1.0
+    # Sorted x = 0, 5, 15, 80: (2 * (5*2 + 15*3 + 80*4)) / (4 * 100) - 5 / 4.
+    assert snapshot.gini() == pytest.approx(0.625)
+    assert snapshot.bucket_counts([1, 10, 50]) == [
+        (1.0, 10.0, 1),
+        (10.0, 50.0, 1),
+        (50.0, float("inf"), 1),
+    ]
+    assert HolderSnapshot.from_holders(TOKEN, []).gini() == 0.0
+
+
+def test_diff_and_round_trip(tmp_path):
+    """Test exact diffs, canonical amounts and the on-disk format."""
+    big = str(10**30)
+    before = HolderSnapshot.from_holders(
+        TOKEN,
+        [_holder(1, "1.50"), _holder(2, big), _holder(3, "7")],
+        taken_at=1.0,
+    )
+    after = HolderSnapshot.from_holders(
+        TOKEN,
+        [
+            TokenHolder.from_dict(_holder(1, "1.5")),
+            _holder(2, str(10**30 + 1)),
+            _holder(4, "2"),
+        ],
+    )
+
+    path = str(tmp_path / "before.npz")
+    before.save(path)
+    loaded = HolderSnapshot.load(path)
+    assert (loaded.token_address, loaded.taken_at) == (TOKEN, 1.0)
+    assert list(loaded.holders()) == list(before.holders())
+
+    diff = loaded.diff(after)
+    assert [row["holder_address"][-4:] for row in diff.rows()] == [
+        "0200",
+        "0300",
+        "0400",
+    ]
+    assert next(iter(diff.rows()))["after"] == Decimal(10**30 + 1)
+    assert diff.removed() == [_holder(3, "")["holder_address"]]
+    assert diff.added() == [_holder(4, "")["holder_address"]]
+    assert len(after.diff(after)) == 0
+
+
+def test_take_pages_through_holders(fake_session):
+    """Test snapshotting through the SDK, for tokens and NFTs."""
+    holders = [_holder(n, str(n)) for n in range(1, 6)]
+
+    def handler(url):
+        assert "/nfts/" in url
+        return ok({"results": holders, "paging": {"last": True}})
+
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(handler)
+
+    [(token, snapshot)] = list(iter_snapshots(sdk, [TOKEN], nft=True))
+    assert token == TOKEN
+    assert snapshot.total() == 15
@@ -0,0 +1,121 @@
+"""Tests for per-request instrumentation hooks and the Prometheus collector."""
+
+from typing import List
+
+import pytest
+
+from kaiascan import KaiascanSDK, PrometheusCollector, ResponseCache, RetryPolicy
+from kaiascan.instrumentation import RequestMetrics, endpoint_template
+from tests.fakes import ok
+
+ADDRESS = "0x" + "ab" * 20
+TX_HASH = "0x" + "cd" * 32
+
+
+def test_endpoint_template_replaces_identifiers():
+    """Test that addresses, hashes and numbers collapse into placeholders."""
+    assert (
+        endpoint_template(f"api/v1/accounts/{ADDRESS}/transactions?page=1&size=20")
+        == "api/v1/accounts/{address}/transactions"
+    )
+    assert endpoint_template(f"api/v1/transactions/{TX_HASH}") == (
+        "api/v1/transactions/{hash}"
+    )
+    assert endpoint_template("api/v1/blocks/123/rewards") == (
+        "api/v1/blocks/{id}/rewards"
+    )
+
+
+def test_hooks_report_cache_retries_and_timings(fake_session):
+    """Test that each call produces one record describing how it was served."""
+    attempts = []
+
+    def handler(url):
+        attempts.append(url)
+        return (503, {}, {}) if len(attempts) == 1 else ok({"block_id": 1})
+
+    records: List[RequestMetrics] = []
+    sdk = KaiascanSDK(
+        is_testnet=True,
+        cache=ResponseCache(),
+        retry=RetryPolicy(backoff_base=0.001),
+        hooks=[records.append],
+    )
+    sdk.session = fake_session(handler)
+
+    sdk.get_transaction(TX_HASH)
+    sdk.get_transaction(TX_HASH)
+
+    first, second = records
+    assert first.endpoint == "api/v1/transactions/{hash}"
+    assert (first.cache, first.status, first.retries) == ("miss", 200, 1)
+    assert first.bytes_received > 0
+    assert first.total >= first.decode >= 0
+    assert (second.cache, second.bytes_received) == ("hit", 0)
+
+
+def test_hooks_see_failed_requests(fake_session):
+    """Test that a failing call is still reported, with its error."""
+    records: List[RequestMetrics] = []
+    sdk = KaiascanSDK(is_testnet=True, hooks=[records.append])
+    sdk.session = fake_session(lambda url: {"code": 5, "data": None, "msg": "bad"})
+
+    with pytest.raises(Exception, match="API error"):
+        sdk.get_transaction(TX_HASH)
+
+    assert records[0].error is not None
+    assert "API error" in records[0].error
+
+
+def test_prometheus_collector_renders_counters_and_histograms():
+    """Test the text exposition of aggregated records."""
+    collector = PrometheusCollector(buckets=(0.1, 1.0))
+    endpoint = "api/v1/blocks/{id}"
+    collector(
+        RequestMetrics(
+            url="u",
+            endpoint=endpoint,
+            cache="miss",
+            status=200,
+            total=0.5,
+            bytes_received=100,
+            retries=2,
+        )
+    )
+    collector(RequestMetrics(url="u", endpoint=endpoint, cache="hit", total=0.01))
+
+    text = collector.render()
+    assert (
+        'kaiascan_requests_total{endpoint="api/v1/blocks/{id}",cache="miss",'
+        'status="200"} 1' in text
+    )
+    assert 'kaiascan_retries_total{endpoint="api/v1/blocks/{id}"} 2' in text
+    assert 'kaiascan_response_bytes_total{endpoint="api/v1/blocks/{id}"} 100' in text
+    assert (
+        'kaiascan_request_seconds_bucket{endpoint="api/v1/blocks/{id}",le="0.1"} 1'
+        in text
+    )
+    assert (
+        'kaiascan_request_seconds_bucket{endpoint="api/v1/blocks/{id}",le="+Inf"} 2'
+        in text
+    )
+    assert 'kaiascan_ttfb_seconds_count{endpoint="api/v1/blocks/{id}"} 1' in text
+
+
+def test_prometheus_collector_renders_exact_values():
+    """Test that large counters and sums are not rounded to six digits."""
+    collector = PrometheusCollector()
+    endpoint = "api/v1/blocks/{id}"
+    for total in (2.5, 0.125):
+        collector(
+            RequestMetrics(
+                url="u",
+                endpoint=endpoint,
+                total=total,
+                bytes_received=12_345_678,
+            )
+        )
+
+    text = collector.render()
+    assert f'kaiascan_response_bytes_total{{endpoint="{endpoint}"}} 24691356' in text
+    assert f'kaiascan_request_seconds_sum{{endpoint="{endpoint}"}} 2.625' in text
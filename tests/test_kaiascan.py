@@ -90,3 +90,104 @@ def test_address_validation():
 
     assert is_valid_address(valid_address) is True
     assert is_valid_address(invalid_address) is False
+
+
+def test_async_sdk_mirrors_endpoints(fake_session):
+    """Test that AsyncKaiascanSDK endpoints are awaitable and return ApiResponse."""
+    import asyncio
+    from typing import Any, List
+
+    from kaiascan import AsyncKaiascanSDK
+    from kaiascan.interfaces.api_response import ApiResponse
+
+    session = fake_session(delay=0.01)
+
+    async def run() -> List[ApiResponse[Any]]:
+        async with AsyncKaiascanSDK(is_testnet=True, max_concurrency=4) as sdk:
+            sdk.client.session = session
+            return await asyncio.gather(
+                *(sdk.get_block(number) for number in range(20))
+            )
+
+    responses = asyncio.run(run())
+
+    assert [r.data["url"] for r in responses] == [
+        f"https://kairos-oapi.kaiascan.io/api/v1/blocks?blockNumber={n}"
+        for n in range(20)
+    ]
+    assert session.max_in_flight <= 4
+
+
+def test_async_sdk_validates_before_sending(fake_session):
+    """Test that AsyncKaiascanSDK rejects bad arguments without a request."""
+    import asyncio
+
+    import pytest
+
+    from kaiascan import AsyncKaiascanSDK
+
+    session = fake_session()
+
+    async def run() -> None:
+        async with AsyncKaiascanSDK(is_testnet=True) as sdk:
+            sdk.client.session = session
+            await sdk.get_token_holders("0x" + "01" * 20, page=0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+    assert session.calls == []
+
+
+def test_iter_pages_walks_every_page(fake_session, paged_handler):
+    """Test that iter_* yields all items across pages and stops on the last page."""
+    session = fake_session(paged_handler(45))
+    sdk = kaiascan.KaiascanSDK(is_testnet=True)
+    sdk.session = session
+
+    items = list(
+        sdk.iter_account_transactions("0x" + "ab" * 20, size=10, block_number_start=5)
+    )
+
+    assert items == list(range(45))
+    assert len(session.calls) == 5
+    assert all("blockNumberStart=5" in url for url in session.calls)
+
+
+def test_async_iter_pages(fake_session, paged_handler):
+    """Test that AsyncKaiascanSDK.iter_* is an async iterator over all pages."""
+    import asyncio
+    from typing import Any, List
+
+    from kaiascan import AsyncKaiascanSDK
+
+    async def run() -> List[Any]:
+        async with AsyncKaiascanSDK(is_testnet=True) as sdk:
+            sdk.client.session = fake_session(paged_handler(25))
+            return [
+                item async for item in sdk.iter_token_holders("0x" + "01" * 20, size=10)
+            ]
+
+    assert asyncio.run(run()) == list(range(25))
+
+
+def test_iter_pages_parallel_fan_out_keeps_order(fake_session, paged_handler):
+    """Test that parallel page fan-out overlaps requests but yields in page order."""
+    import random
+
+    handler = paged_handler(95)
+
+    def jittery(url):
+        import time
+
+        time.sleep(random.uniform(0, 0.02))
+        return handler(url)
+
+    session = fake_session(jittery)
+    sdk = kaiascan.KaiascanSDK(is_testnet=True)
+    sdk.session = session
+
+    items = list(sdk.iter_token_transfers("0x" + "ab" * 20, size=10, max_workers=4))
+
+    assert items == list(range(95))
+    assert len(session.calls) == 10
+    assert 1 < session.max_in_flight <= 4
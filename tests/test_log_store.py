@@ -0,0 +1,118 @@
+"""Tests for the local SQLite event-log store."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from kaiascan import EventLogStore, KaiascanSDK
+from kaiascan.interfaces.models import EventLog
+from tests.fakes import Route, ok
+
+TOKEN = "0x" + "AB" * 20
+OTHER = "0x" + "cd" * 20
+TRANSFER = "Transfer(address,address,uint256)"
+APPROVAL = "Approval(address,address,uint256)"
+
+
+def _log(
+    block: int,
+    index: int,
+    contract: str = TOKEN,
+    signature: str = TRANSFER,
+    tx: Optional[str] = None,
+) -> Dict[str, Any]:
+    return {
+        "transaction_hash": tx or f"0x{block:064x}",
+        "block_id": block,
+        "log_index": index,
+        "contract_address": contract,
+        "signature": signature,
+        "datetime": "2024-11-25T10:00:00Z",
+        "topics": ["0x01", "0x02"],
+        "data": "0x",
+    }
+
+
+def test_store_dedupes_and_filters(tmp_path):
+    """Test ingest idempotence and filtering by every indexed key."""
+    store = EventLogStore(str(tmp_path / "logs.db"), "8217")
+    logs = [
+        _log(100, 0),
+        _log(100, 1, signature=APPROVAL),
+        _log(101, 0, contract=OTHER),
+        _log(102, 3),
+    ]
+
+    assert store.ingest(logs) == 4
+    store.ingest([EventLog.from_dict(log) for log in logs[:2]])
+    assert len(store) == 4
+
+    transfers = store.query(contract_address=TOKEN.lower(), signature=TRANSFER)
+    assert [log["block_id"] for log in transfers] == [100, 102]
+    assert transfers[0]["topics"] == ["0x01", "0x02"]
+    assert store.count(block_start=101, block_end=102) == 2
+    same_tx = store.query(transaction_hash=f"0x{100:064x}")
+    assert [log["signature"] for log in same_tx] == [TRANSFER, APPROVAL]
+    assert [log["block_id"] for log in store.query(limit=2, descending=True)] == [
+        102,
+        101,
+    ]
+
+    assert EventLogStore(store.path, "1001").count() == 0
+
+
+def test_ingest_transaction_fills_missing_hashes(fake_session, tmp_path):
+    """Test that per-transaction logs are keyed by the requested hash."""
+    tx_hash = "0x" + "ee" * 32
+    sdk = KaiascanSDK(is_testnet=True)
+    items: List[Dict[str, Any]] = [{"block_id": 5, "signature": TRANSFER}] * 2
+    sdk.session = fake_session(
+        lambda url: ok({"results": items, "paging": {"last": True}})
+    )
+    store = EventLogStore(str(tmp_path / "logs.db"), sdk.chain_id)
+
+    assert store.ingest_transaction(sdk, tx_hash) == 2
+    assert [log["log_index"] for log in store.query(transaction_hash=tx_hash)] == [
+        0,
+        1,
+    ]
+
+
+def test_filtered_ingest_does_not_renumber_transaction_logs(fake_session, tmp_path):
+    """Test that a signature-filtered ingest cannot overwrite other logs."""
+    tx_hash = "0x" + "ee" * 32
+    full = [{"block_id": 5, "signature": sig} for sig in (TRANSFER, APPROVAL)]
+
+    def handler(url: str) -> Route:
+        if "signature=" in url:
+            results = [dict(full[1], transaction_hash=tx_hash)]
+        else:
+            results = full
+        return ok({"results": results, "paging": {"last": True}})
+
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(handler)
+    store = EventLogStore(str(tmp_path / "logs.db"), sdk.chain_id)
+
+    assert store.ingest_transaction(sdk, tx_hash) == 2
+    with pytest.raises(ValueError):
+        store.ingest_transaction(sdk, tx_hash, signature=APPROVAL)
+
+    stored = store.query(transaction_hash=tx_hash)
+    assert [(log["log_index"], log["signature"]) for log in stored] == [
+        (0, TRANSFER),
+        (1, APPROVAL),
+    ]
+
+
+def test_ingest_rejects_unindexed_account_logs(tmp_path):
+    """Test that logs without an index are only numbered within a transaction."""
+    store = EventLogStore(str(tmp_path / "logs.db"), "8217")
+    log = _log(100, 0)
+    del log["log_index"]
+
+    with pytest.raises(ValueError):
+        store.ingest([log])
+    assert store.ingest([_log(100, 0), log], log["transaction_hash"]) == 2
+    assert store.ingest([log, log], log["transaction_hash"]) == 2
+    assert [row["log_index"] for row in store.query()] == [0, 1]
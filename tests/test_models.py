@@ -0,0 +1,63 @@
+"""Tests for the slotted, lazily converted response models."""
+
+import pickle
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from kaiascan.interfaces.api_response import ApiResponse
+from kaiascan.interfaces.models import PAGE_MODELS, Block, TokenTransfer, to_int
+from kaiascan.interfaces.token_info import TokenInfo
+
+
+def test_models_have_no_instance_dict():
+    """Test that responses and models are slotted."""
+    transfer = TokenTransfer.from_dict({"amount": "1"})
+
+    assert not hasattr(transfer, "__dict__")
+    assert not hasattr(ApiResponse(code=0, data=None, msg=""), "__dict__")
+    assert not hasattr(
+        TokenInfo("KIP-7", "Kaia", "KAIA", "", 18, 1, 1, "", 0, 0), "__dict__"
+    )
+
+
+def test_model_fields_convert_on_read():
+    """Test lazy conversion of integers, amounts and datetimes."""
+    page = {
+        "results": [
+            {
+                "transaction_hash": "0xabc",
+                "block_id": "0x10",
+                "datetime": "2024-11-25T10:00:00Z",
+                "from": "0x1",
+                "to": "0x2",
+                "amount": str(2**200),
+                "unused": "ignored",
+            }
+        ]
+    }
+
+    [transfer] = TokenTransfer.from_page(page)
+
+    assert transfer.block_number == 16
+    assert transfer.amount == Decimal(2**200)
+    assert transfer.datetime == datetime(2024, 11, 25, 10, tzinfo=timezone.utc)
+    assert transfer.contract_address is None
+    assert transfer.to_dict()["from_address"] == "0x1"
+    assert pickle.loads(pickle.dumps(transfer)) == transfer
+
+
+def test_block_model_and_int_conversion():
+    """Test the Block model and the to_int helper."""
+    block = Block.from_dict({"block_id": 100, "hash": "0xdef"})
+
+    assert block.number == 100
+    assert block.hash == "0xdef"
+    assert to_int("0xff") == 255
+    assert to_int("42") == 42
+
+
+def test_model_annotations_match_fields():
+    """Test that every model declares exactly the attributes of its FIELDS."""
+    for _, model in PAGE_MODELS:
+        attributes = [attribute for attribute, _, _ in model.FIELDS]
+        assert list(model.__annotations__) == attributes
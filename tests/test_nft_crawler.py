@@ -0,0 +1,65 @@
+"""Tests for the resumable NFT collection crawler."""
+
+import urllib.parse
+from typing import List
+
+import pytest
+
+from kaiascan import CrawledNft, KaiascanSDK, NftCrawler
+from tests.fakes import Route, ok
+
+COLLECTION = "0x" + "ab" * 20
+
+
+def _collection_handler(url: str) -> Route:
+    """List token IDs 0-9 over pages of 4, repeating one across a page break."""
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+    if "/inventories" in url:
+        page = int(query["page"][0])
+        ids = [[0, 1, 2, 3], [3, 4, 5, 6], [7, 8, 9]][page - 1]
+        return ok(
+            {
+                "results": [{"token_id": str(n)} for n in ids],
+                "paging": {"last": page == 3},
+            }
+        )
+    return ok({"token_id": query["tokenId"][0], "name": "item"})
+
+
+def test_crawler_dedupes_and_resumes(fake_session, tmp_path):
+    """Test a crawl that dies midway and resumes from its progress file."""
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(_collection_handler)
+    progress = str(tmp_path / "crawl.progress")
+    seen: List[str] = []
+
+    def crash_on_fifth(item: CrawledNft) -> None:
+        if len(seen) == 4:
+            raise RuntimeError("worker died")
+        seen.append(item.token_id)
+
+    crawler = NftCrawler(
+        sdk, COLLECTION, max_workers=2, progress_path=progress, page_size=4
+    )
+    with pytest.raises(RuntimeError):
+        crawler.run(crash_on_fifth)
+
+    with open(progress, "a") as f:
+        f.write("9")  # a write cut short by the crash
+
+    resumed = NftCrawler(
+        sdk, COLLECTION, max_workers=3, progress_path=progress, page_size=4
+    )
+    assert resumed.completed == set(seen)
+
+    items: List[CrawledNft] = []
+    assert resumed.run(items.append) == 6
+    assert sorted(seen + [item.token_id for item in items], key=int) == [
+        str(n) for n in range(10)
+    ]
+    assert items[0].metadata["token_id"] == items[0].token_id
+    assert NftCrawler(sdk, COLLECTION, progress_path=progress).completed == {
+        str(n) for n in range(10)
+    }
+    with pytest.raises(ValueError):
+        NftCrawler(sdk, "0x" + "cd" * 20, progress_path=progress)
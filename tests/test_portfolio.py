@@ -0,0 +1,58 @@
+"""Tests for the multi-wallet portfolio aggregator."""
+
+from decimal import Decimal
+
+from kaiascan import KaiascanSDK, PortfolioAggregator
+from tests.fakes import ok
+
+WALLETS = ["0x" + f"{n:040x}" for n in range(1, 4)]
+USDT = "0x" + "aa" * 20
+WKAIA = "0x" + "bb" * 20
+PUNKS = "0x" + "cc" * 20
+
+
+def _portfolio_handler(url):
+    """Every wallet holds both tokens; only the first holds an NFT."""
+    last = {"last": True}
+    if "/token-balances" in url:
+        return ok(
+            {
+                "results": [
+                    {"contract": {"contract_address": USDT}, "balance": "2500000"},
+                    {"contract_address": WKAIA, "balance": str(10**30 + 1)},
+                ],
+                "paging": last,
+            }
+        )
+    if "/nft-balances/kip17" in url:
+        results = [{"contract_address": PUNKS, "token_count": 2}]
+        return ok({"results": results if WALLETS[0] in url else [], "paging": last})
+    if "/nft-balances/kip37" in url:
+        return ok({"results": [], "paging": last})
+    decimal = 6 if USDT in url else 18
+    return ok({"symbol": "USDT" if USDT in url else "WKAIA", "decimal": decimal})
+
+
+def test_portfolio_merges_wallets_with_cached_metadata(fake_session):
+    """Test exact scaling, totals and one metadata lookup per token."""
+    session = fake_session(_portfolio_handler)
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = session
+    aggregator = PortfolioAggregator(sdk, max_workers=4)
+
+    portfolio = aggregator.build(WALLETS + [WALLETS[0].upper().replace("0X", "0x")])
+
+    assert list(portfolio.wallets) == WALLETS
+    first = portfolio.wallets[WALLETS[0]]
+    assert [(p.symbol, p.balance) for p in first.tokens] == [
+        ("USDT", Decimal("2.5")),
+        ("WKAIA", Decimal("1000000000000.000000000000000001")),
+    ]
+    assert first.kip17 == [{"contract_address": PUNKS, "token_count": 2}]
+    assert portfolio.wallets[WALLETS[1]].kip17 == []
+    assert portfolio.totals[USDT] == Decimal("7.5")
+    assert portfolio.tokens[WKAIA].decimal == 18
+
+    aggregator.build(WALLETS[:1])
+    metadata_calls = [url for url in session.calls if "tokenAddress=" in url]
+    assert len(metadata_calls) == 2
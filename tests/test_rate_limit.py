@@ -0,0 +1,77 @@
+"""Tests for the shared rate limiter and retry policy."""
+
+import time
+from typing import Iterator
+
+import pytest
+
+from kaiascan import KaiascanSDK, RateLimiter, RetryPolicy
+from kaiascan.rate_limit import parse_retry_after
+from tests.fakes import Route, ok
+
+
+def test_rate_limiter_paces_requests():
+    """Test that the token bucket spaces requests beyond the burst."""
+    limiter = RateLimiter(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_rate_limiter_is_shared_per_api_key():
+    """Test that clients using the same API key share one limiter."""
+    assert RateLimiter.shared("key-a", rate=5) is RateLimiter.shared("key-a", rate=9)
+    assert RateLimiter.shared("key-a", rate=5) is not RateLimiter.shared("key-b", 5)
+
+
+def test_rate_limiter_adapts_to_pushback():
+    """Test multiplicative slowdown on 429 and additive recovery."""
+    limiter = RateLimiter(rate=10, increase_step=1)
+    limiter.penalize()
+    assert limiter.rate == 5
+    limiter.reward()
+    assert limiter.rate == 6
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing in seconds and HTTP-date form."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_sdk_retries_throttled_requests(fake_session):
+    """Test that 429 and 5xx responses are retried and Retry-After is honoured."""
+    statuses: Iterator[Route] = iter(
+        [(429, {}, {"Retry-After": "0.05"}), (503, {}, {})]
+    )
+    limiter = RateLimiter(rate=100)
+    sdk = KaiascanSDK(
+        is_testnet=True,
+        rate_limiter=limiter,
+        retry=RetryPolicy(max_retries=3, backoff_base=0.01),
+    )
+    session = fake_session(lambda url: next(statuses, ok("done")))
+    sdk.session = session
+
+    started = time.monotonic()
+    response = sdk.get_kaia_info()
+
+    assert response.data == "done"
+    assert len(session.calls) == 3
+    assert time.monotonic() - started >= 0.05
+    assert limiter.rate < 100
+
+
+def test_sdk_gives_up_after_max_retries(fake_session):
+    """Test that the last failure is surfaced once retries are exhausted."""
+    sdk = KaiascanSDK(is_testnet=True, retry=RetryPolicy(max_retries=1, backoff_base=0))
+    session = fake_session(lambda url: (500, {}, {}))
+    sdk.session = session
+
+    with pytest.raises(Exception, match="500 Server Error"):
+        sdk.get_kaia_info()
+    assert len(session.calls) == 2
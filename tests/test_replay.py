@@ -0,0 +1,48 @@
+"""Tests that exercise the full request path against the local replay server."""
+
+from typing import Any, Dict
+
+import pytest
+
+from kaiascan import KaiascanSDK, RetryPolicy
+from kaiascan.replay import Recording, ReplayServer
+
+RECORDINGS: Dict[str, Recording] = {
+    r"^/api/v1/blocks\?blockNumber=": {"code": 0, "data": {"block_id": 1}, "msg": ""},
+    r"^/api/v1/kaia$": {"code": 5, "data": None, "msg": "quota exceeded"},
+}
+
+
+def _sdk(server: ReplayServer, **options: Any) -> KaiascanSDK:
+    sdk = KaiascanSDK(is_testnet=True, **options)
+    sdk.base_url = server.base_url
+    return sdk
+
+
+def test_fetch_api_over_http():
+    """Test that _fetch_api decodes a real HTTP response."""
+    with ReplayServer(RECORDINGS) as server:
+        response = _sdk(server).get_block(1)
+
+    assert response.code == 0
+    assert response.data == {"block_id": 1}
+
+
+def test_fetch_api_surfaces_api_errors():
+    """Test that non-zero API codes and missing routes raise."""
+    with ReplayServer(RECORDINGS) as server:
+        sdk = _sdk(server, retry=RetryPolicy(max_retries=0))
+        with pytest.raises(Exception, match="API error! code: 5"):
+            sdk.get_kaia_info()
+        with pytest.raises(Exception, match="404"):
+            sdk.get_account_info("0x" + "ab" * 20)
+
+
+def test_fetch_api_retries_injected_errors():
+    """Test that injected 429/503 responses are retried to success."""
+    with ReplayServer(RECORDINGS, error_rate=0.5, seed=1) as server:
+        sdk = _sdk(server, retry=RetryPolicy(max_retries=10, backoff_base=0.001))
+        responses = [sdk.get_block(n) for n in range(10)]
+
+        assert server.requests > 10
+    assert all(response.data == {"block_id": 1} for response in responses)
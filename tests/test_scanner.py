@@ -0,0 +1,83 @@
+"""Tests for the checkpointed block-range scanner."""
+
+import json
+from typing import List
+
+import pytest
+
+from kaiascan import KaiascanSDK
+from kaiascan.scanner import BlockScanner, BlockWindow
+from tests.fakes import ok
+
+
+def _block_handler(url):
+    """Serve one transaction per block and an empty internal-transaction list."""
+    path = url.split("api/v1/blocks")[1]
+    if path.startswith("?"):
+        return ok({"results": [], "paging": {"last": True}})
+    number = int(path.split("/")[1])
+    if "/internal-transactions" in path:
+        return ok({"results": [], "paging": {"last": True}})
+    return ok({"results": [f"tx-{number}"], "paging": {"last": True}})
+
+
+def test_scanner_windows():
+    """Test that the range is split into inclusive windows."""
+    scanner = BlockScanner(KaiascanSDK(is_testnet=True), 10, 34, window_size=10)
+
+    assert scanner.windows() == [(10, 19), (20, 29), (30, 34)]
+
+
+def test_scanner_resumes_from_checkpoint(fake_session, tmp_path):
+    """Test that a crashed scan resumes without redoing completed windows."""
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(_block_handler)
+    checkpoint = str(tmp_path / "scan.json")
+    seen: List[int] = []
+
+    def crash_on_third(window: BlockWindow) -> None:
+        if len(seen) == 2:
+            raise RuntimeError("worker died")
+        seen.append(window.start)
+
+    scanner = BlockScanner(
+        sdk, 0, 49, window_size=10, max_workers=1, checkpoint_path=checkpoint
+    )
+    with pytest.raises(RuntimeError):
+        scanner.run(crash_on_third)
+
+    resumed = BlockScanner(
+        sdk, 0, 49, window_size=10, max_workers=3, checkpoint_path=checkpoint
+    )
+    assert resumed.pending_windows() == [(20, 29), (30, 39), (40, 49)]
+
+    windows: List[BlockWindow] = []
+    resumed.run(windows.append)
+
+    assert sorted(window.start for window in windows) == [20, 30, 40]
+    assert windows[0].transactions[windows[0].start] == [f"tx-{windows[0].start}"]
+    assert resumed.pending_windows() == []
+
+
+def test_scanner_checkpoint_stays_small(fake_session, tmp_path):
+    """Test that finished windows fold into the checkpoint's low-water mark."""
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(_block_handler)
+    checkpoint = tmp_path / "scan.json"
+    sizes = []
+
+    def record_size(window):
+        if checkpoint.exists():
+            sizes.append(len(checkpoint.read_text()))
+
+    scanner = BlockScanner(
+        sdk, 0, 199, window_size=5, max_workers=4, checkpoint_path=str(checkpoint)
+    )
+    scanner.run(record_size)
+
+    state = json.loads(checkpoint.read_text())
+    assert state["low_water_mark"] == 200
+    assert state["completed"] == []
+    assert len(sizes) == 39 and max(sizes) < 200
+    resumed = BlockScanner(sdk, 0, 199, window_size=5, checkpoint_path=str(checkpoint))
+    assert resumed.pending_windows() == []
@@ -0,0 +1,58 @@
+"""Tests for single-flight request coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kaiascan import KaiascanSDK
+from kaiascan.single_flight import SingleFlight
+
+
+def test_single_flight_shares_one_execution():
+    """Test that concurrent callers with one key share a single call."""
+    flight: SingleFlight[str] = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(flight.do, "key", slow) for _ in range(8)]
+        started.wait(1)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+
+def test_single_flight_propagates_errors():
+    """Test that the leader's exception reaches the caller and the key is freed."""
+    flight: SingleFlight[int] = SingleFlight()
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_sdk_coalesces_identical_requests(fake_session):
+    """Test that identical concurrent lookups send one HTTP request."""
+    sdk = KaiascanSDK(is_testnet=True)
+    session = fake_session(delay=0.1)
+    sdk.session = session
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(
+            executor.map(lambda _: sdk.get_contract_abi("0x" + "ab" * 20), range(16))
+        )
+
+    assert len(session.calls) == 1
+    assert all(response is responses[0] for response in responses)
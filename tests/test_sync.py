@@ -0,0 +1,87 @@
+"""Tests for incremental account sync with persistent cursors."""
+
+import urllib.parse
+from typing import Callable, List
+
+import pytest
+
+from kaiascan import AccountSync, CursorStore, KaiascanSDK
+from kaiascan.sync import AccountActivity
+from tests.fakes import Route, ok
+
+WALLET = "0x" + "ab" * 20
+
+
+def _handler(head: List[int]) -> Callable[[str], Route]:
+    """Serve the chain head and one transfer per block in the requested range."""
+
+    def handler(url: str) -> Route:
+        if "blocks/latest" in url:
+            return ok({"block_id": head[0]})
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        start = int(query.get("blockNumberStart", ["0"])[0])
+        end = int(query["blockNumberEnd"][0])
+        return ok(
+            {
+                "results": [{"block_id": n} for n in range(start, end + 1)],
+                "paging": {"last": True},
+            }
+        )
+
+    return handler
+
+
+def test_sync_fetches_only_new_blocks(fake_session, tmp_path):
+    """Test that a second run resumes after the stored cursors."""
+    head = [10]
+    session = fake_session(_handler(head))
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = session
+    store = CursorStore(str(tmp_path / "cursors.db"))
+    sync = AccountSync(sdk, store, endpoints=["transactions"], start_block=5)
+
+    seen: List[AccountActivity] = []
+    assert sync.run([WALLET, WALLET, "0x" + "AB" * 20], seen.append) == 10
+    assert [activity.ranges for activity in seen] == [{"transactions": (5, 10)}]
+    assert len(seen[0].items["transactions"]) == 6
+
+    head[0] = 12
+    restarted = AccountSync(
+        sdk, CursorStore(store.path), endpoints=["transactions"], start_block=5
+    )
+    seen.clear()
+    restarted.run([WALLET.upper().replace("0X", "0x")], seen.append)
+    assert seen[0].items["transactions"] == [{"block_id": 11}, {"block_id": 12}]
+
+    seen.clear()
+    restarted.run([WALLET], seen.append)
+    assert seen[0].ranges == {}
+    assert session.calls[-1].endswith("blocks/latest")
+
+
+def test_sync_keeps_cursor_when_handler_fails(fake_session, tmp_path):
+    """Test that activity is re-delivered if the handler raised."""
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = fake_session(_handler([3]))
+    store = CursorStore(str(tmp_path / "cursors.db"))
+    sync = AccountSync(sdk, store, endpoints=["token_transfers", "event_logs"])
+
+    def fail(activity: AccountActivity) -> None:
+        raise RuntimeError("store unavailable")
+
+    with pytest.raises(RuntimeError):
+        sync.run([WALLET], fail)
+    assert len(store) == 0
+
+    sync.run([WALLET], lambda activity: None)
+    assert store.get(sdk.chain_id, WALLET) == {"token_transfers": 3, "event_logs": 3}
+
+
+def test_sync_rejects_unknown_endpoints(tmp_path):
+    """Test that endpoint names are validated."""
+    with pytest.raises(ValueError):
+        AccountSync(
+            KaiascanSDK(is_testnet=True),
+            CursorStore(str(tmp_path / "cursors.db")),
+            endpoints=["balances"],
+        )
@@ -0,0 +1,35 @@
+"""Tests for the concurrent transaction detail assembler."""
+
+import time
+
+from kaiascan import KaiascanSDK, TransactionAssembler
+from tests.fakes import ok
+
+HASHES = ["0x" + f"{n:064x}" for n in range(1, 4)]
+
+
+def test_assembler_fetches_parts_in_parallel(fake_session, paged_handler):
+    """Test that all six parts overlap and every list is followed to the end."""
+    pages = paged_handler(5)
+
+    def handler(url):
+        if "?page=" in url:
+            return pages(url)
+        return ok({"url": url})
+
+    session = fake_session(handler, delay=0.05)
+    sdk = KaiascanSDK(is_testnet=True)
+    sdk.session = session
+    assembler = TransactionAssembler(sdk, max_workers=3)
+
+    started = time.perf_counter()
+    details = assembler.assemble_many(HASHES + HASHES[:1])
+    elapsed = time.perf_counter() - started
+
+    assert list(details) == HASHES
+    first = details[HASHES[0]]
+    assert first.transaction["url"].endswith(HASHES[0])
+    assert "transactionHash=" + HASHES[0] in first.receipt_status["url"]
+    assert first.event_logs == first.nft_transfers == [0, 1, 2, 3, 4]
+    assert session.max_in_flight >= 6
+    assert elapsed < 0.05 * 6
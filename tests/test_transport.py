@@ -0,0 +1,70 @@
+"""Tests for the pooled, thread-safe HTTP transports."""
+
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests.exceptions import Timeout
+
+from kaiascan import KaiascanSDK, RequestsTransport, RetryPolicy
+from kaiascan.replay import ReplayServer
+
+BLOCK = {"code": 0, "data": {"block_id": 1}, "msg": "success"}
+
+
+def test_sdk_uses_pooled_transport_with_timeouts():
+    """Test that the default client never sends a request without a timeout."""
+    sdk = KaiascanSDK(is_testnet=True)
+
+    assert isinstance(sdk.session, RequestsTransport)
+    assert sdk.session.timeout == (3.05, 30.0)
+    assert sdk.session.headers["Content-Type"] == "application/json"
+
+
+def test_transport_shares_one_pool_between_threads():
+    """Test that many threads can share one bounded connection pool."""
+    transport = RequestsTransport(pool_size=4, pool_block=True)
+    with ReplayServer({r"blocks": BLOCK}, latency=0.005) as server:
+        sdk = KaiascanSDK(is_testnet=True, transport=transport)
+        sdk.base_url = server.base_url
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            responses = list(executor.map(sdk.get_block, range(64)))
+        sdk.close()
+
+    assert all(response.data == {"block_id": 1} for response in responses)
+    assert server.requests == 64
+
+
+def test_transport_read_timeout_frees_stalled_requests():
+    """Test that a stalled response raises instead of hanging."""
+    transport = RequestsTransport(timeout=(1.0, 0.05))
+    with ReplayServer({r"blocks": BLOCK}, latency=0.5) as server:
+        with pytest.raises(Timeout):
+            transport.get(f"{server.base_url}api/v1/blocks?blockNumber=1")
+
+        sdk = KaiascanSDK(
+            is_testnet=True,
+            transport=transport,
+            retry=RetryPolicy(max_retries=1, backoff_base=0.001),
+        )
+        sdk.base_url = server.base_url
+        with pytest.raises(Exception, match="Error making request"):
+            sdk.get_block(1)
+        transport.close()
+
+
+def test_transport_releases_sessions_of_exited_threads():
+    """Test that short-lived threads do not leave their sessions behind."""
+    transport = RequestsTransport()
+    with ReplayServer({r"blocks": BLOCK}) as server:
+        url = f"{server.base_url}api/v1/blocks?blockNumber=1"
+        for _ in range(50):
+            thread = threading.Thread(target=transport.get, args=(url,))
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert len(transport._sessions) <= 1
+        assert transport.get(url).json() == BLOCK
+    transport.close()